@@ -0,0 +1,210 @@
+"""Benchmark headless das páginas do app (Streamlit AppTest).
+
+Para cada página do menu (e, nas páginas com upload, para cada tamanho de
+CSV sintético) mede o tempo da primeira execução, o tempo de um rerun com o
+mesmo upload, o pico de RSS e o tamanho do payload enviado ao navegador.
+Cada cenário roda em um subprocesso próprio, para que o pico de memória e os
+caches não vazem de um cenário para o outro.
+
+    python benchmarks/bench_paginas.py --linhas 1000 100000 --saida bench.json
+    python benchmarks/bench_paginas.py --comparar antes.json depois.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "pa.py")
+LINHAS_PADRAO = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+PAGINAS_COM_UPLOAD = {
+    "🧹 Limpeza de CSV (Profissional)",
+    "📈 Análise de Dados",
+    "⚡ Módulo Avançado Interativo",
+}
+
+
+
+def csv_sintetico(linhas, semente=0, fracao_nulos=0.05):
+    """CSV com inteiros, floats, categorias, texto livre, booleanos, datas e nulos."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(semente)
+    df = pd.DataFrame({
+        "ID": np.arange(linhas),
+        "Idade": rng.integers(18, 80, linhas),
+        "Nota": rng.normal(7, 1.5, linhas).round(2),
+        "Renda Mensal": rng.lognormal(8, 0.6, linhas).round(2),
+        "Cidade": rng.choice(["Recife", "Olinda", "Caruaru", "Petrolina", "Garanhuns"], linhas),
+        "Comentario": pd.Series(rng.integers(0, 10**9, linhas)).map("texto {}".format),
+        "Ativo": rng.random(linhas) < 0.5,
+        "Data": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, linhas), unit="D"),
+    })
+    for col in ["Idade", "Nota", "Renda Mensal", "Cidade", "Comentario"]:
+        df.loc[rng.random(linhas) < fracao_nulos, col] = None
+    # duplicados de propósito, para a limpeza ter trabalho
+    repetidas = max(1, linhas // 100)
+    df.iloc[-repetidas:] = df.iloc[:repetidas].to_numpy()
+    return df.to_csv(index=False).encode("utf-8")
+
+
+
+def _pico_rss_bytes():
+    import resource
+
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+
+def _payload_bytes(at):
+    total = 0
+    for no in at._tree:
+        proto = getattr(no, "proto", None)
+        if proto is not None and hasattr(proto, "ByteSize"):
+            total += proto.ByteSize()
+    return total
+
+
+
+def rodar_cenario(pagina, linhas):
+    """Executa um cenário no processo atual e devolve as métricas."""
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, RAIZ)
+    at = AppTest.from_file(APP, default_timeout=3600)
+    at.run()
+    at.sidebar.radio[0].set_value(pagina)
+
+    tamanho_csv = 0
+    if linhas:
+        conteudo = csv_sintetico(linhas)
+        tamanho_csv = len(conteudo)
+        at.run()
+        at.file_uploader[0].upload("sintetico.csv", conteudo, "text/csv")
+        del conteudo
+
+    inicio = time.perf_counter()
+    at.run()
+    tempo = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    at.run()
+    tempo_rerun = time.perf_counter() - inicio
+
+    return {
+        "pagina": pagina,
+        "linhas": linhas,
+        "tamanho_csv": tamanho_csv,
+        "tempo": tempo,
+        "tempo_rerun": tempo_rerun,
+        "pico_rss": _pico_rss_bytes(),
+        "payload": _payload_bytes(at),
+        "excecoes": [str(e.value) for e in at.exception],
+    }
+
+
+
+def _cenarios(linhas):
+    sys.path.insert(0, RAIZ)
+    from paginas import PAGINAS
+
+    for pagina in PAGINAS:
+        if pagina in PAGINAS_COM_UPLOAD:
+            for n in linhas:
+                yield pagina, n
+        else:
+            yield pagina, 0
+
+
+
+def _revisao():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=RAIZ, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+
+def rodar_todos(linhas, saida):
+    import pandas as pd
+    import streamlit
+
+    resultados = []
+    for pagina, n in _cenarios(linhas):
+        processo = subprocess.run(
+            [sys.executable, __file__, "--cenario", pagina, str(n)],
+            capture_output=True, text=True
+        )
+        if processo.returncode == 0:
+            resultado = json.loads(processo.stdout.strip().splitlines()[-1])
+        else:
+            resultado = {"pagina": pagina, "linhas": n, "erro": processo.stderr.strip()[-2000:]}
+        resultados.append(resultado)
+        print(
+            f"{pagina} [{n} linhas]: "
+            + (f"{resultado['tempo']:.2f}s, rerun {resultado['tempo_rerun']:.2f}s, "
+               f"RSS {resultado['pico_rss'] / 2**20:.0f} MB, payload {resultado['payload'] / 1024:.0f} KB"
+               + (f", {len(resultado['excecoes'])} exceção(ões)" if resultado["excecoes"] else "")
+               if "erro" not in resultado else "ERRO"),
+            file=sys.stderr
+        )
+
+    relatorio = {
+        "revisao": _revisao(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "streamlit": streamlit.__version__,
+        "resultados": resultados,
+    }
+    with open(saida, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    return relatorio
+
+
+
+def comparar(antes, depois, metricas=("tempo", "tempo_rerun", "pico_rss", "payload")):
+    """Imprime a razão depois/antes de cada métrica, cenário a cenário."""
+    with open(antes, encoding="utf-8") as arquivo:
+        base = {(r["pagina"], r["linhas"]): r for r in json.load(arquivo)["resultados"]}
+    with open(depois, encoding="utf-8") as arquivo:
+        novos = json.load(arquivo)["resultados"]
+
+    for r in novos:
+        anterior = base.get((r["pagina"], r["linhas"]))
+        if anterior is None or "erro" in r or "erro" in anterior:
+            continue
+        razoes = ", ".join(
+            f"{m} x{r[m] / anterior[m]:.2f}" for m in metricas if anterior.get(m)
+        )
+        print(f"{r['pagina']} [{r['linhas']} linhas]: {razoes}")
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--linhas", type=int, nargs="+", default=LINHAS_PADRAO)
+    parser.add_argument("--saida", default="bench_resultados.json")
+    parser.add_argument("--comparar", nargs=2, metavar=("ANTES", "DEPOIS"))
+    parser.add_argument("--cenario", nargs=2, metavar=("PAGINA", "LINHAS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cenario:
+        pagina, linhas = args.cenario
+        print(json.dumps(rodar_cenario(pagina, int(linhas)), ensure_ascii=False))
+    elif args.comparar:
+        comparar(*args.comparar)
+    else:
+        rodar_todos(args.linhas, args.saida)
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+
+
+# ------------------------------------------------------------
+# BOXPLOT E VIOLINO CALCULADOS NO SERVIDOR (SÓ OS RESUMOS VÃO AO GRÁFICO)
+# ------------------------------------------------------------
+LIMITE_EXATO = 5_000_000     # acima disso os quartis saem de uma amostra
+AMOSTRA_QUANTIS = 1_000_000
+MAX_OUTLIERS = 500           # outliers desenhados (a contagem é sempre exata)
+PONTOS_DENSIDADE = 100
+FATOR_BIGODE = 1.5
+
+
+
+def _densidade(valores, minimo, maximo, pontos=PONTOS_DENSIDADE):
+    # Histograma fino suavizado com um núcleo gaussiano: a forma do violino
+    # com custo O(n) e só `pontos` números no resultado.
+    if maximo <= minimo:
+        return pd.DataFrame({"valor": [minimo], "densidade": [1.0]})
+    contagens, bordas = np.histogram(valores, bins=pontos, range=(minimo, maximo))
+    nucleo = np.exp(-0.5 * np.linspace(-2.5, 2.5, 11) ** 2)
+    suave = np.convolve(contagens, nucleo / nucleo.sum(), mode="same")
+    return pd.DataFrame({
+        "valor": (bordas[:-1] + bordas[1:]) / 2,
+        "densidade": suave / suave.max() if suave.max() > 0 else suave,
+    })
+
+
+
+def estatisticas_boxplot(serie, semente=0):
+    """Cinco números, bigodes (1,5 × IQR), amostra de outliers e densidade de uma coluna.
+
+    Retorna um dict pequeno, pronto para `grafico_boxplot`, ou None se a
+    coluna não tiver valores. Com mais de `LIMITE_EXATO` valores os quartis
+    são aproximados (amostra uniforme de `AMOSTRA_QUANTIS`); mínimo, máximo,
+    bigodes e a contagem de outliers são sempre exatos.
+    """
+    valores = serie.to_numpy(dtype=np.float64, na_value=np.nan)
+    valores = valores[np.isfinite(valores)]
+    n = valores.size
+    if not n:
+        return None
+
+    rng = np.random.default_rng(semente)
+    aproximado = n > LIMITE_EXATO
+    base = rng.choice(valores, AMOSTRA_QUANTIS, replace=False) if aproximado else valores
+    q1, mediana, q3 = np.quantile(base, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    cerca_inferior, cerca_superior = q1 - FATOR_BIGODE * iqr, q3 + FATOR_BIGODE * iqr
+
+    fora = (valores < cerca_inferior) | (valores > cerca_superior)
+    dentro = valores[~fora]
+    outliers = valores[fora]
+    if outliers.size > MAX_OUTLIERS:
+        # os extremos sempre aparecem; o resto é amostrado
+        extremos = [outliers.argmin(), outliers.argmax()]
+        resto = np.delete(np.arange(outliers.size), extremos)
+        escolhidos = np.concatenate([extremos, rng.choice(resto, MAX_OUTLIERS - 2, replace=False)])
+        outliers_exibidos = outliers[escolhidos]
+    else:
+        outliers_exibidos = outliers
+
+    minimo, maximo = float(valores.min()), float(valores.max())
+    return {
+        "total": int(n),
+        "nulos": int(len(serie) - n),
+        "min": minimo,
+        "q1": float(q1),
+        "mediana": float(mediana),
+        "q3": float(q3),
+        "max": maximo,
+        "media": float(valores.mean()),
+        "bigode_inferior": float(dentro.min()) if dentro.size else float(q1),
+        "bigode_superior": float(dentro.max()) if dentro.size else float(q3),
+        "total_outliers": int(outliers.size),
+        "outliers": pd.DataFrame({"valor": np.sort(outliers_exibidos)}),
+        "densidade": _densidade(base, minimo, maximo),
+        "aproximado": aproximado,
+    }
+
+
+
+def grafico_boxplot(resumo, coluna, violino=False):
+    """Gráfico Altair (importado só aqui) a partir do resumo de `estatisticas_boxplot`."""
+    import altair as alt
+
+    caixa = pd.DataFrame([{campo: resumo[campo] for campo in
+                           ["min", "bigode_inferior", "q1", "mediana", "q3", "bigode_superior", "max", "media"]}])
+    eixo = alt.Y("bigode_inferior:Q", title=coluna, scale=alt.Scale(zero=False))
+    dicas = [
+        alt.Tooltip("bigode_inferior:Q", title="bigode inferior"),
+        alt.Tooltip("q1:Q", title="Q1"),
+        alt.Tooltip("mediana:Q", title="mediana"),
+        alt.Tooltip("q3:Q", title="Q3"),
+        alt.Tooltip("bigode_superior:Q", title="bigode superior"),
+        alt.Tooltip("media:Q", title="média"),
+    ]
+    # tudo no centro (x = 0); o violino se abre para os dois lados
+    centro = alt.X(datum=0, type="quantitative", axis=None, scale=alt.Scale(domain=[-1.1, 1.1]))
+    base = alt.Chart(caixa)
+    camadas = [
+        base.mark_rule().encode(x=centro, y=eixo, y2="bigode_superior:Q", tooltip=dicas),
+        base.mark_bar(size=40, opacity=0.6 if violino else 1.0).encode(x=centro, y="q1:Q", y2="q3:Q", tooltip=dicas),
+        base.mark_tick(size=40, color="white", thickness=2, orient="horizontal").encode(x=centro, y="mediana:Q"),
+    ]
+    if len(resumo["outliers"]):
+        camadas.append(
+            alt.Chart(resumo["outliers"]).mark_circle(size=25, opacity=0.6, color="#d62728").encode(
+                x=centro, y="valor:Q", tooltip=[alt.Tooltip("valor:Q", title=coluna)]
+            )
+        )
+    if violino:
+        camadas.insert(0, alt.Chart(resumo["densidade"]).transform_calculate(
+            esquerda="-datum.densidade", direita="datum.densidade"
+        ).mark_area(orient="horizontal", opacity=0.3).encode(
+            y="valor:Q",
+            x=alt.X("esquerda:Q", axis=None, scale=alt.Scale(domain=[-1.1, 1.1])),
+            x2="direita:Q",
+        ))
+    return alt.layer(*camadas).properties(height=350)
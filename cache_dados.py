@@ -0,0 +1,454 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from cache_disco import CacheDisco
+from ingestao import ler_csv_otimizado, ler_csvs_otimizado
+
+
+
+# ------------------------------------------------------------
+# CACHE LRU DE UPLOADS (COMPARTILHADO ENTRE RERUNS E SESSÕES)
+# ------------------------------------------------------------
+LIMITE_CACHE_BYTES = 512 * 1024 * 1024   # orçamento global de memória
+LIMITE_SESSAO_BYTES = 256 * 1024 * 1024  # orçamento de cada sessão
+# Com um diretório configurado, artefatos descartados vão para Parquet em vez
+# de serem recalculados; sem ele, o descarte é definitivo.
+DIRETORIO_DERRAMAMENTO = os.environ.get("DATABYTE_DIRETORIO_SPILL")
+LIMITE_DISCO_BYTES = 4 * 1024 * 1024 * 1024
+_LIMITE_EM_LINHA = 1024 * 1024  # o que não é DataFrame e fica na memória ao derramar
+_MAX_HASHES_MEMORIZADOS = 256
+# artefatos que também vão para o cache em disco (o perfil do dataset)
+ARTEFATOS_PERSISTENTES = {"perfil", "resumo", "histograma", "boxplot", "corr", "top_pares", "regressao", "regressao_blocos"}
+_AUSENTE = object()
+
+
+
+def tamanho_em_bytes(valor):
+    """Estimativa do espaço ocupado por um artefato em memória."""
+    if isinstance(valor, pd.DataFrame):
+        return int(valor.memory_usage(deep=True).sum())
+    if isinstance(valor, (pd.Series, pd.Index)):
+        return int(valor.memory_usage(deep=True))
+    if isinstance(valor, (tuple, list)):
+        return sys.getsizeof(valor) + sum(tamanho_em_bytes(item) for item in valor)
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(tamanho_em_bytes(item) for item in valor.values())
+    return sys.getsizeof(valor)
+
+
+
+def sessao_atual():
+    """Id da sessão do Streamlit rodando nesta thread (None fora de um rerun)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    contexto = get_script_run_ctx(suppress_warning=True)
+    return contexto.session_id if contexto is not None else None
+
+
+
+def _derramar(valor, base, arquivos):
+    # Troca DataFrames/Series (também dentro de tuplas, listas e dicts) por
+    # arquivos Parquet; o resto fica como está. Devolve o descritor.
+    if isinstance(valor, pd.DataFrame):
+        caminho = f"{base}-{len(arquivos)}.parquet"
+        valor.to_parquet(caminho)
+        arquivos.append(caminho)
+        return ("parquet", caminho)
+    if isinstance(valor, pd.Series):
+        nome = valor.name
+        return ("serie", _derramar(valor.to_frame(name="valor"), base, arquivos), nome)
+    if isinstance(valor, (tuple, list)):
+        return (type(valor).__name__, [_derramar(item, base, arquivos) for item in valor])
+    if isinstance(valor, dict):
+        return ("dict", {k: _derramar(v, base, arquivos) for k, v in valor.items()})
+    return ("valor", valor)
+
+
+
+def _recompor(descritor):
+    tipo = descritor[0]
+    if tipo == "parquet":
+        return pd.read_parquet(descritor[1])
+    if tipo == "serie":
+        return _recompor(descritor[1])["valor"].rename(descritor[2])
+    if tipo in ("tuple", "list"):
+        itens = [_recompor(item) for item in descritor[1]]
+        return tuple(itens) if tipo == "tuple" else itens
+    if tipo == "dict":
+        return {k: _recompor(v) for k, v in descritor[1].items()}
+    return descritor[1]
+
+
+
+def _em_linha(descritor):
+    # bytes que continuariam na memória depois de derramar
+    tipo = descritor[0]
+    if tipo == "parquet":
+        return 0
+    if tipo == "serie":
+        return _em_linha(descritor[1])
+    if tipo in ("tuple", "list"):
+        return sum(_em_linha(item) for item in descritor[1])
+    if tipo == "dict":
+        return sum(_em_linha(item) for item in descritor[1].values())
+    return tamanho_em_bytes(descritor[1])
+
+
+
+def _remover_arquivos(arquivos):
+    for caminho in arquivos:
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+
+
+class CacheLRU:
+    """Cache limitado por bytes, no total e por sessão (o governador de memória).
+
+    Cada artefato pertence à última sessão que o usou. Ao estourar o orçamento
+    da sessão, saem os artefatos dela usados há mais tempo; ao estourar o
+    global, os de qualquer sessão. Um item maior que o orçamento de uma sessão
+    (o DataFrame de um upload grande) não pertence a nenhuma: só o limite
+    global o retira, abrindo espaço à custa dos itens usados há mais tempo.
+    Com `diretorio_derramamento`, o que sai vai para Parquet e volta do disco
+    no próximo uso (a sessão é avisada via `recarregados`); o que não cabe nem
+    no limite global não é guardado (avisado via `recusados`).
+    """
+
+    def __init__(self, limite_bytes=LIMITE_CACHE_BYTES, limite_sessao=LIMITE_SESSAO_BYTES,
+                 diretorio_derramamento=DIRETORIO_DERRAMAMENTO, limite_disco=LIMITE_DISCO_BYTES):
+        self.limite_bytes = limite_bytes
+        self.limite_sessao = limite_sessao
+        self.diretorio_derramamento = diretorio_derramamento
+        self.limite_disco = limite_disco
+        self.bytes_usados = 0
+        self.bytes_disco = 0
+        self._itens = OrderedDict()       # chave -> [valor, tamanho, sessão]
+        self._por_sessao = {}
+        self._derramados = OrderedDict()  # chave -> (descritor, arquivos, bytes no disco)
+        self._recarregados = {}
+        self._recusados = {}
+        self._lock = threading.RLock()
+
+    def __contains__(self, chave):
+        with self._lock:
+            return chave in self._itens
+
+    def __len__(self):
+        with self._lock:
+            return len(self._itens)
+
+    def uso_sessao(self, sessao):
+        with self._lock:
+            return self._por_sessao.get(sessao, 0)
+
+    def recarregados(self, sessao):
+        """Chaves que voltaram do disco para esta sessão desde a última chamada."""
+        with self._lock:
+            return self._recarregados.pop(sessao, [])
+
+    def recusados(self, sessao):
+        """`(chave, bytes)` que esta sessão tentou guardar e não cabiam no cache."""
+        with self._lock:
+            return self._recusados.pop(sessao, [])
+
+    def _dono(self, tamanho, sessao):
+        return None if tamanho > self.limite_sessao else sessao
+
+    def _contabilizar(self, sessao, delta):
+        uso = self._por_sessao.get(sessao, 0) + delta
+        if uso > 0:
+            self._por_sessao[sessao] = uso
+        else:
+            self._por_sessao.pop(sessao, None)
+
+    def _tocar(self, chave):
+        # Chamado com o lock: o item passa a ser o mais recente e muda de dono.
+        item = self._itens[chave]
+        self._itens.move_to_end(chave)
+        sessao = self._dono(item[1], sessao_atual())
+        if item[2] != sessao:
+            self._contabilizar(item[2], -item[1])
+            self._contabilizar(sessao, item[1])
+            item[2] = sessao
+        return self._aplicar_limites(sessao, chave)
+
+    def _aplicar_limites(self, sessao, protegida):
+        # Chamado com o lock; devolve os itens retirados para derramar fora dele.
+        retirados = []
+        if sessao is not None:
+            for chave in list(self._itens):
+                if self._por_sessao.get(sessao, 0) <= self.limite_sessao:
+                    break
+                if chave != protegida and self._itens[chave][2] == sessao:
+                    retirados.append(self._retirar(chave))
+        for chave in list(self._itens):
+            if self.bytes_usados <= self.limite_bytes:
+                break
+            if chave != protegida:
+                retirados.append(self._retirar(chave))
+        return retirados
+
+    def _retirar(self, chave):
+        valor, tamanho, sessao = self._itens.pop(chave)
+        self.bytes_usados -= tamanho
+        self._contabilizar(sessao, -tamanho)
+        return chave, valor
+
+    def _derramar_itens(self, retirados):
+        if not self.diretorio_derramamento or not retirados:
+            return
+        os.makedirs(self.diretorio_derramamento, exist_ok=True)
+        for chave, valor in retirados:
+            base = os.path.join(
+                self.diretorio_derramamento,
+                hashlib.blake2b(repr(chave).encode(), digest_size=16).hexdigest()
+            )
+            arquivos = []
+            try:
+                descritor = _derramar(valor, base, arquivos)
+            except (ValueError, TypeError, NotImplementedError, ImportError, OSError):
+                # tipos que o Parquet não representa: fica só o descarte
+                _remover_arquivos(arquivos)
+                continue
+            if not arquivos or _em_linha(descritor) > _LIMITE_EM_LINHA:
+                _remover_arquivos(arquivos)
+                continue
+            em_disco = sum(os.path.getsize(caminho) for caminho in arquivos)
+            with self._lock:
+                if chave in self._derramados:
+                    antigo = self._derramados.pop(chave)
+                    self.bytes_disco -= antigo[2]
+                    _remover_arquivos(antigo[1])
+                self._derramados[chave] = (descritor, arquivos, em_disco)
+                self.bytes_disco += em_disco
+                while self.bytes_disco > self.limite_disco and self._derramados:
+                    _, (_, antigos, liberado) = self._derramados.popitem(last=False)
+                    self.bytes_disco -= liberado
+                    _remover_arquivos(antigos)
+
+    def _recarregar(self, chave):
+        with self._lock:
+            if chave not in self._derramados:
+                return _AUSENTE
+            descritor, arquivos, em_disco = self._derramados.pop(chave)
+            self.bytes_disco -= em_disco
+        try:
+            valor = _recompor(descritor)
+        except (OSError, ValueError, ImportError):
+            return _AUSENTE
+        finally:
+            _remover_arquivos(arquivos)
+        with self._lock:
+            self._recarregados.setdefault(sessao_atual(), []).append(chave)
+        return valor
+
+    def obter(self, chave, calcular):
+        """Devolve o valor em cache para `chave` ou calcula, guarda e devolve."""
+        with self._lock:
+            if chave in self._itens:
+                valor = self._itens[chave][0]
+                retirados = self._tocar(chave)
+            else:
+                retirados = None
+        if retirados is not None:
+            self._derramar_itens(retirados)
+            return valor
+
+        valor = self._recarregar(chave)
+        if valor is _AUSENTE:
+            valor = calcular()
+        self.guardar(chave, valor)
+        return valor
+
+    def pegar(self, chave, padrao=None):
+        with self._lock:
+            if chave in self._itens:
+                valor = self._itens[chave][0]
+                retirados = self._tocar(chave)
+            else:
+                retirados = None
+        if retirados is not None:
+            self._derramar_itens(retirados)
+            return valor
+
+        valor = self._recarregar(chave)
+        if valor is _AUSENTE:
+            return padrao
+        self.guardar(chave, valor)
+        return valor
+
+    def guardar(self, chave, valor):
+        tamanho = tamanho_em_bytes(valor)
+        sessao = sessao_atual()
+        with self._lock:
+            if tamanho > self.limite_bytes:
+                if sessao is not None:
+                    self._recusados.setdefault(sessao, []).append((chave, tamanho))
+                return
+            if chave in self._itens:
+                self._retirar(chave)
+            dono = self._dono(tamanho, sessao)
+            self._itens[chave] = [valor, tamanho, dono]
+            self.bytes_usados += tamanho
+            self._contabilizar(dono, tamanho)
+            retirados = self._aplicar_limites(sessao, chave)
+        self._derramar_itens(retirados)
+
+    def remover_dataset(self, hash_dataset):
+        """Descarta todos os artefatos derivados de um mesmo upload (também os do disco)."""
+        with self._lock:
+            for chave in [c for c in self._itens if c[0] == hash_dataset]:
+                self._retirar(chave)
+            for chave in [c for c in self._derramados if c[0] == hash_dataset]:
+                _, arquivos, em_disco = self._derramados.pop(chave)
+                self.bytes_disco -= em_disco
+                _remover_arquivos(arquivos)
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+            self._por_sessao.clear()
+            self.bytes_usados = 0
+            for _, arquivos, _ in self._derramados.values():
+                _remover_arquivos(arquivos)
+            self._derramados.clear()
+            self.bytes_disco = 0
+
+
+
+cache = CacheLRU()
+disco = CacheDisco()
+_hashes = OrderedDict()
+_hashes_lock = threading.Lock()
+
+
+
+def hash_conteudo(arquivo):
+    """Hash do conteúdo enviado (memorizado por `file_id` do upload)."""
+    file_id = getattr(arquivo, "file_id", None)
+    if file_id is not None:
+        with _hashes_lock:
+            if file_id in _hashes:
+                _hashes.move_to_end(file_id)
+                return _hashes[file_id]
+
+    if hasattr(arquivo, "getvalue"):
+        # getvalue() devolve os bytes do upload sem copiar; getbuffer() faria
+        # uma cópia inteira (e a manteria viva) enquanto eles são compartilhados
+        digest = hashlib.blake2b(arquivo.getvalue(), digest_size=16).hexdigest()
+    else:
+        digest = hashlib.blake2b(bytes(arquivo), digest_size=16).hexdigest()
+
+    if file_id is not None:
+        with _hashes_lock:
+            _hashes[file_id] = digest
+            while len(_hashes) > _MAX_HASHES_MEMORIZADOS:
+                _hashes.popitem(last=False)
+    return digest
+
+
+
+def _ler_com_disco(chave, ler):
+    # Um conteúdo já visto (mesmo antes de reiniciar o servidor) volta do
+    # Feather mapeado na memória, sem passar pelo parser de CSV.
+    inicio = time.perf_counter()
+    df = disco.carregar_dataset(chave)
+    relatorio = disco.carregar((chave, "ingestao"))
+    if df is not None and relatorio is not None:
+        cache.guardar((chave, "ingestao"), dict(relatorio, tempo_disco=time.perf_counter() - inicio))
+        return df
+
+    df, relatorio = ler()
+    cache.guardar((chave, "ingestao"), relatorio)
+    disco.salvar_dataset(chave, df)
+    disco.salvar((chave, "ingestao"), relatorio)
+    return df
+
+
+
+def ler_csv(arquivo):
+    """Lê o CSV enviado uma única vez; reruns com o mesmo conteúdo usam o cache.
+
+    Retorna `(hash, df)`. O DataFrame é compartilhado: não altere no lugar.
+    """
+    chave = hash_conteudo(arquivo)
+    return chave, cache.obter((chave, "df"), lambda: _ler_com_disco(chave, lambda: ler_csv_otimizado(arquivo)))
+
+
+
+def chave_conjunto(arquivos):
+    """Hash de um conjunto de uploads (o de `ler_csvs`): conteúdo e ordem."""
+    if len(arquivos) == 1:
+        return hash_conteudo(arquivos[0])
+    hashes = "".join(hash_conteudo(arquivo) for arquivo in arquivos)
+    return hashlib.blake2b(hashes.encode(), digest_size=16).hexdigest()
+
+
+
+def ler_csvs(arquivos):
+    """Como `ler_csv`, para um ou mais arquivos (fragmentos do mesmo conjunto).
+
+    Os fragmentos são lidos em paralelo e só o DataFrame combinado fica no
+    cache. O hash depende do conteúdo e da ordem dos arquivos.
+    """
+    if len(arquivos) == 1:
+        return ler_csv(arquivos[0])
+    chave = chave_conjunto(arquivos)
+    return chave, cache.obter((chave, "df"), lambda: _ler_com_disco(chave, lambda: ler_csvs_otimizado(arquivos)))
+
+
+
+def relatorio_ingestao(hash_dataset):
+    """Relatório de leitura (tempo e memória economizada) de um upload em cache."""
+    return cache.pegar((hash_dataset, "ingestao"))
+
+
+
+def artefato(hash_dataset, nome, calcular, *params):
+    """Artefato derivado de um dataset (describe, corr, ...) guardado no cache.
+
+    Os de `ARTEFATOS_PERSISTENTES` também são gravados no cache em disco.
+    """
+    chave = (hash_dataset, nome, *params)
+    if nome not in ARTEFATOS_PERSISTENTES:
+        return cache.obter(chave, calcular)
+
+    def _calcular():
+        valor = disco.carregar(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            valor = calcular()
+            disco.salvar(chave, valor)
+        return valor
+
+    return cache.obter(chave, _calcular)
+
+
+
+def pegar_artefato(hash_dataset, nome, *params, padrao=None):
+    """Artefato já calculado (na memória ou no disco), sem calcular nada."""
+    chave = (hash_dataset, nome, *params)
+    valor = cache.pegar(chave, _AUSENTE)
+    if valor is _AUSENTE and nome in ARTEFATOS_PERSISTENTES:
+        valor = disco.carregar(chave, _AUSENTE)
+        if valor is not _AUSENTE:
+            cache.guardar(chave, valor)
+    return padrao if valor is _AUSENTE else valor
+
+
+
+def guardar_artefato(hash_dataset, nome, valor, *params):
+    chave = (hash_dataset, nome, *params)
+    cache.guardar(chave, valor)
+    if nome in ARTEFATOS_PERSISTENTES:
+        disco.salvar(chave, valor)
@@ -0,0 +1,169 @@
+import hashlib
+import os
+import pickle
+import shutil
+import threading
+import uuid
+
+
+
+# ------------------------------------------------------------
+# CACHE EM DISCO ENDEREÇADO PELO CONTEÚDO (SOBREVIVE A REINÍCIOS)
+# ------------------------------------------------------------
+# Uma pasta por dataset (o hash do upload): o DataFrame lido em Feather sem
+# compressão, para ser mapeado na memória, e os artefatos do perfil
+# (describe, histogramas, correlações) ao lado. Variável vazia desativa.
+DIRETORIO_CACHE_DISCO = os.environ.get(
+    "DATABYTE_DIRETORIO_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "databyte")
+)
+LIMITE_CACHE_DISCO_BYTES = 2 * 1024 * 1024 * 1024
+_ARQUIVO_DADOS = "dados.feather"
+_VERSAO = 2  # muda quando a leitura passa a produzir outro DataFrame (v2: floats em float64)
+
+
+
+def _tamanho_pasta(pasta):
+    total = 0
+    for raiz, _, nomes in os.walk(pasta):
+        for nome in nomes:
+            try:
+                total += os.path.getsize(os.path.join(raiz, nome))
+            except OSError:
+                pass
+    return total
+
+
+
+def _nome_artefato(chave):
+    # (hash, nome, *params) -> arquivo estável para os mesmos parâmetros
+    return hashlib.blake2b(repr(chave[1:]).encode(), digest_size=16).hexdigest() + ".pkl"
+
+
+
+class CacheDisco:
+    """Datasets já lidos e seus perfis, guardados em disco pelo hash do conteúdo.
+
+    O uso mais recente de cada dataset fica no mtime da pasta; ao passar de
+    `limite_bytes`, as pastas usadas há mais tempo são apagadas inteiras.
+    Falhas de leitura ou gravação viram só uma falta no cache.
+    """
+
+    def __init__(self, diretorio=DIRETORIO_CACHE_DISCO, limite_bytes=LIMITE_CACHE_DISCO_BYTES):
+        self.diretorio = diretorio
+        self.limite_bytes = limite_bytes
+        self._lock = threading.Lock()
+
+    def _pasta(self, hash_dataset):
+        return os.path.join(self.diretorio, f"{hash_dataset}.v{_VERSAO}")
+
+    def _tocar(self, pasta):
+        try:
+            os.utime(pasta)
+        except OSError:
+            pass
+
+    def carregar_dataset(self, hash_dataset):
+        """DataFrame salvo para o hash (mapeado na memória) ou None."""
+        if not self.diretorio:
+            return None
+        pasta = self._pasta(hash_dataset)
+        caminho = os.path.join(pasta, _ARQUIVO_DADOS)
+        if not os.path.exists(caminho):
+            return None
+        try:
+            import pyarrow.feather as feather
+
+            # split_blocks evita consolidar as colunas em blocos (uma cópia):
+            # as que o Arrow consegue repassar continuam apontando para o mmap.
+            df = feather.read_table(caminho, memory_map=True).to_pandas(split_blocks=True)
+        except Exception:  # arquivo corrompido ou de outra versão: relê o CSV
+            return None
+        self._tocar(pasta)
+        return df
+
+    def salvar_dataset(self, hash_dataset, df):
+        if not self.diretorio:
+            return
+        pasta = self._pasta(hash_dataset)
+        if os.path.exists(os.path.join(pasta, _ARQUIVO_DADOS)):
+            return
+        parcial = os.path.join(pasta, f".{uuid.uuid4().hex}.parcial")
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+
+            os.makedirs(pasta, exist_ok=True)
+            tabela = pa.Table.from_pandas(df)
+            feather.write_feather(tabela, parcial, compression="uncompressed")
+            os.replace(parcial, os.path.join(pasta, _ARQUIVO_DADOS))
+        except Exception:  # tipos que o Arrow não representa: fica só na memória
+            if os.path.exists(parcial):
+                os.remove(parcial)
+            return
+        self._podar(manter=pasta)
+
+    def carregar(self, chave, padrao=None):
+        """Artefato `(hash, nome, *params)` salvo ou `padrao`."""
+        if not self.diretorio:
+            return padrao
+        pasta = self._pasta(chave[0])
+        try:
+            with open(os.path.join(pasta, _nome_artefato(chave)), "rb") as arquivo:
+                valor = pickle.load(arquivo)
+        except Exception:  # ausente, corrompido ou de outra versão do pandas
+            return padrao
+        self._tocar(pasta)
+        return valor
+
+    def salvar(self, chave, valor):
+        if not self.diretorio:
+            return
+        pasta = self._pasta(chave[0])
+        parcial = os.path.join(pasta, f".{uuid.uuid4().hex}.parcial")
+        try:
+            os.makedirs(pasta, exist_ok=True)
+            with open(parcial, "wb") as arquivo:
+                pickle.dump(valor, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(parcial, os.path.join(pasta, _nome_artefato(chave)))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            if os.path.exists(parcial):
+                os.remove(parcial)
+            return
+        self._podar(manter=pasta)
+
+    def _podar(self, manter=None):
+        with self._lock:
+            try:
+                nomes = os.listdir(self.diretorio)
+            except OSError:
+                return
+            pastas = []
+            for nome in nomes:
+                pasta = os.path.join(self.diretorio, nome)
+                try:
+                    if os.path.isdir(pasta):
+                        pastas.append((os.path.getmtime(pasta), _tamanho_pasta(pasta), pasta))
+                except OSError:  # apagada por outro processo no meio do caminho
+                    pass
+            total = sum(tamanho for _, tamanho, _ in pastas)
+            for _, tamanho, pasta in sorted(pastas):
+                if total <= self.limite_bytes:
+                    break
+                if pasta == manter:
+                    continue
+                # no Linux quem ainda mapeia os arquivos continua lendo normalmente
+                shutil.rmtree(pasta, ignore_errors=True)
+                total -= tamanho
+
+    def uso_bytes(self):
+        if not self.diretorio or not os.path.isdir(self.diretorio):
+            return 0
+        return _tamanho_pasta(self.diretorio)
+
+    def remover_dataset(self, hash_dataset):
+        if self.diretorio:
+            shutil.rmtree(self._pasta(hash_dataset), ignore_errors=True)
+
+    def limpar(self):
+        if self.diretorio:
+            shutil.rmtree(self.diretorio, ignore_errors=True)
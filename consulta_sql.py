@@ -0,0 +1,146 @@
+import importlib.util
+import os
+import tempfile
+import time
+
+# O duckdb (dependência opcional: sem ela o modo SQL fica desativado) só é
+# importado quando uma consulta roda, não a cada carga da página de análise.
+
+
+
+# ------------------------------------------------------------
+# CONSULTAS SQL (DUCKDB) DIRETO SOBRE OS ARQUIVOS ENVIADOS
+# ------------------------------------------------------------
+DIRETORIO = os.path.join(tempfile.gettempdir(), "databyte_sql")
+LIMITE_DISCO = 4 * 1024 * 1024 * 1024  # arquivos despejados guardados no disco
+MAX_LINHAS = 10_000                    # linhas devolvidas ao pandas por consulta
+MEMORIA_DUCKDB = "1GB"                 # acima disso o DuckDB usa o disco
+TABELA = "dados"
+CONSULTA_PADRAO = f"SELECT *\nFROM {TABELA}\nLIMIT 100"
+
+
+
+class ErroSQL(Exception):
+    """Erro do DuckDB ao executar a consulta (a mensagem traz o tipo original)."""
+
+
+
+def disponivel():
+    return importlib.util.find_spec("duckdb") is not None
+
+
+
+def _extensao(arquivo):
+    nome = getattr(arquivo, "name", "") or ""
+    return "parquet" if nome.lower().endswith(".parquet") else "csv"
+
+
+
+def _podar(manter):
+    # Remove os arquivos usados há mais tempo até caber em LIMITE_DISCO.
+    arquivos = []
+    for nome in os.listdir(DIRETORIO):
+        caminho = os.path.join(DIRETORIO, nome)
+        if os.path.isfile(caminho) and caminho not in manter:
+            info = os.stat(caminho)
+            arquivos.append((info.st_atime, info.st_size, caminho))
+    total = sum(tamanho for _, tamanho, _ in arquivos) + sum(os.path.getsize(c) for c in manter)
+    for _, tamanho, caminho in sorted(arquivos):
+        if total <= LIMITE_DISCO:
+            break
+        try:
+            os.remove(caminho)
+            total -= tamanho
+        except OSError:
+            pass
+
+
+
+def despejar(arquivos, hashes):
+    """Grava os uploads em arquivos temporários nomeados pelo hash do conteúdo.
+
+    Um conteúdo já despejado é reaproveitado. Retorna `(caminhos, formato)`.
+    """
+    os.makedirs(DIRETORIO, exist_ok=True)
+    formatos = {_extensao(arquivo) for arquivo in arquivos}
+    if len(formatos) > 1:
+        raise ValueError("Envie só CSVs ou só arquivos Parquet para consultar juntos.")
+    formato = formatos.pop()
+
+    caminhos = []
+    for arquivo, hash_arquivo in zip(arquivos, hashes):
+        caminho = os.path.join(DIRETORIO, f"{hash_arquivo}.{formato}")
+        if not os.path.exists(caminho):
+            parcial = caminho + ".parcial"
+            with open(parcial, "wb") as destino:
+                destino.write(arquivo.getvalue())  # sem cópia, ao contrário de getbuffer()
+            os.replace(parcial, caminho)
+        else:
+            os.utime(caminho)
+        caminhos.append(caminho)
+    _podar(set(caminhos))
+    return caminhos, formato
+
+
+
+def _conectar(caminhos, formato):
+    """Conexão nova, que só enxerga os arquivos enviados (via a visão `dados`)."""
+    import duckdb
+
+    conexao = duckdb.connect(config={
+        "memory_limit": MEMORIA_DUCKDB,
+        "temp_directory": os.path.join(DIRETORIO, "duckdb_tmp"),
+        "autoinstall_known_extensions": False,
+        "autoload_known_extensions": False,
+    })
+    lista = "[" + ", ".join("'" + caminho.replace("'", "''") + "'" for caminho in caminhos) + "]"
+    leitor = "read_parquet" if formato == "parquet" else "read_csv_auto"
+    conexao.execute(f"CREATE VIEW {TABELA} AS SELECT * FROM {leitor}({lista}, union_by_name = true)")
+    # Daqui em diante o SQL do usuário não lê nem grava outros arquivos.
+    conexao.execute(f"SET allowed_paths = {lista}")
+    conexao.execute("SET enable_external_access = false")
+    conexao.execute("SET lock_configuration = true")
+    return conexao
+
+
+
+def esquema(caminhos, formato):
+    """Colunas e tipos da visão `dados`, como o DuckDB os inferiu."""
+    import duckdb
+
+    try:
+        with _conectar(caminhos, formato) as conexao:
+            return conexao.sql(f"DESCRIBE {TABELA}").df()[["column_name", "column_type"]]
+    except duckdb.Error as e:
+        raise ErroSQL(f"{type(e).__name__}: {e}") from e
+
+
+
+def executar_sql(caminhos, formato, sql, max_linhas=MAX_LINHAS, plano=False):
+    """Executa `sql` sobre a visão `dados` e traz no máximo `max_linhas` para o pandas.
+
+    O limite é aplicado pelo próprio DuckDB (só o resultado atravessa para o
+    Python). Retorna `{"dados", "truncado", "tempo", "plano"}`; `dados` é None
+    quando o comando não produz linhas. Erros do DuckDB saem como `ErroSQL`.
+    """
+    import duckdb
+
+    inicio = time.perf_counter()
+    try:
+        with _conectar(caminhos, formato) as conexao:
+            relacao = conexao.sql(sql)
+            if relacao is None:
+                return {"dados": None, "truncado": False, "tempo": time.perf_counter() - inicio, "plano": None}
+            dados = relacao.limit(max_linhas + 1).df()
+            texto_plano = None
+            if plano:
+                texto_plano = "\n".join(linha[1] for linha in conexao.sql(f"EXPLAIN {sql}").fetchall())
+    except duckdb.Error as e:
+        raise ErroSQL(f"{type(e).__name__}: {e}") from e
+    truncado = len(dados) > max_linhas
+    return {
+        "dados": dados.iloc[:max_linhas],
+        "truncado": truncado,
+        "tempo": time.perf_counter() - inicio,
+        "plano": texto_plano,
+    }
@@ -0,0 +1,168 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+
+# ------------------------------------------------------------
+# CORRELAÇÃO EM BLOCOS (FLOAT32 PADRONIZADO, EM PARALELO)
+# ------------------------------------------------------------
+TAMANHO_BLOCO = 256
+MAX_THREADS = min(8, os.cpu_count() or 1)
+
+
+
+def _parametros(df, colunas):
+    medias = np.empty(len(colunas), dtype=np.float64)
+    desvios = np.empty(len(colunas), dtype=np.float64)
+    for i, col in enumerate(colunas):
+        serie = df[col]
+        medias[i] = serie.mean()
+        desvios[i] = serie.std()
+    return medias, desvios
+
+
+
+def _padronizar(df, colunas, medias, desvios):
+    # Retorna `(z, validos)`: os valores padronizados, com 0 nos nulos, e a
+    # máscara (1 = tem valor) em float32, ou None se o bloco não tem nulos.
+    # Centra e escala em float64, coluna a coluna, e só o z-score vira
+    # float32: uma coluna de média grande e pouca variação (1e6 + 1e-3·x)
+    # viraria constante se fosse convertida antes de subtrair a média.
+    z = np.empty((len(df), len(colunas)), dtype=np.float32, order="F")
+    nulos = np.zeros(z.shape, dtype=bool, order="F")
+    for j, col in enumerate(colunas):
+        valores = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        nulos[:, j] = np.isnan(valores)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z[:, j] = (valores - medias[j]) / desvios[j]
+    z[~np.isfinite(z)] = 0
+    if not nulos.any():
+        return z, None
+    return z, (~nulos).astype(np.float32)
+
+
+
+def _correlacao_bloco(z_a, validos_a, z_b, validos_b, n):
+    # Sem nulos: um único produto de matrizes. Com nulos, como o pandas, cada
+    # par de colunas usa só as linhas em que as duas têm valor: contagens,
+    # somas e somas de quadrados por par saem de produtos com as máscaras
+    # (os nulos já são 0 em z, então somem das somas sozinhos).
+    if validos_a is None and validos_b is None:
+        return (z_a.T @ z_b) / np.float32(max(n - 1, 1))
+    if validos_a is None:
+        validos_a = np.ones_like(z_a)
+    if validos_b is None:
+        validos_b = np.ones_like(z_b)
+    contagem = validos_a.T @ validos_b
+    with np.errstate(divide="ignore", invalid="ignore"):
+        soma_a = z_a.T @ validos_b
+        soma_b = validos_a.T @ z_b
+        cov = z_a.T @ z_b - soma_a * soma_b / contagem
+        var_a = (z_a * z_a).T @ validos_b - soma_a ** 2 / contagem
+        var_b = validos_a.T @ (z_b * z_b) - soma_b ** 2 / contagem
+        c = cov / np.sqrt(var_a * var_b)
+    c[(contagem < 2) | ~np.isfinite(c)] = np.nan
+    return c
+
+
+
+def _blocos(colunas, tamanho_bloco):
+    return [list(range(i, min(i + tamanho_bloco, len(colunas)))) for i in range(0, len(colunas), tamanho_bloco)]
+
+
+
+def _percorrer(df, colunas, tamanho_bloco, paralelo, visitar, progresso=None):
+    """Chama `visitar(I, J, C_IJ)` para cada par de blocos de colunas com I <= J.
+
+    `progresso(fracao, mensagem)`, se dado, é chamado a cada par de blocos.
+    """
+    medias, desvios = _parametros(df, colunas)
+    blocos = _blocos(colunas, tamanho_bloco)
+    n = len(df)
+    total = len(blocos) * (len(blocos) + 1) // 2
+    feitos = [0]
+    lock = threading.Lock()
+
+    def linha_de_blocos(a):
+        idx_a = blocos[a]
+        z_a, validos_a = _padronizar(df, [colunas[i] for i in idx_a], medias[idx_a], desvios[idx_a])
+        for b in range(a, len(blocos)):
+            idx_b = blocos[b]
+            if b == a:
+                z_b, validos_b = z_a, validos_a
+            else:
+                z_b, validos_b = _padronizar(df, [colunas[i] for i in idx_b], medias[idx_b], desvios[idx_b])
+            c = _correlacao_bloco(z_a, validos_a, z_b, validos_b, n)
+            visitar(idx_a, idx_b, np.clip(c, -1, 1))
+            if progresso is not None:
+                with lock:
+                    feitos[0] += 1
+                    atual = feitos[0]
+                progresso(atual / total, f"{atual}/{total} blocos de colunas")
+
+    if paralelo and len(blocos) > 1:
+        with ThreadPoolExecutor(max_workers=MAX_THREADS) as executor:
+            list(executor.map(linha_de_blocos, range(len(blocos))))
+    else:
+        for a in range(len(blocos)):
+            linha_de_blocos(a)
+    return desvios
+
+
+
+def matriz_correlacao(df, colunas, tamanho_bloco=TAMANHO_BLOCO, paralelo=True, progresso=None):
+    """Matriz de correlação de Pearson calculada bloco a bloco em float32.
+
+    Com nulos, cada par usa só as linhas completas do par (como `df.corr()`).
+    """
+    p = len(colunas)
+    resultado = np.empty((p, p), dtype=np.float32)
+
+    def visitar(idx_a, idx_b, c):
+        resultado[np.ix_(idx_a, idx_b)] = c
+        resultado[np.ix_(idx_b, idx_a)] = c.T
+
+    desvios = _percorrer(df, colunas, tamanho_bloco, paralelo, visitar, progresso)
+    constantes = ~(desvios > 0)
+    resultado[constantes, :] = np.nan
+    resultado[:, constantes] = np.nan
+    np.fill_diagonal(resultado, np.where(constantes, np.nan, 1.0))
+    return pd.DataFrame(resultado, index=colunas, columns=colunas)
+
+
+
+def top_pares(df, colunas, k=20, tamanho_bloco=TAMANHO_BLOCO, paralelo=True, progresso=None):
+    """Os `k` pares de colunas com maior |correlação|, sem montar a matriz p×p.
+
+    Cada par de blocos guarda só os seus `k` melhores candidatos.
+    """
+    candidatos = []
+
+    def visitar(idx_a, idx_b, c):
+        if idx_a is idx_b:
+            linhas, cols = np.triu_indices(len(idx_a), k=1)
+        else:
+            linhas, cols = np.indices(c.shape).reshape(2, -1)
+        valores = c[linhas, cols]
+        m = min(k, valores.size)
+        if not m:
+            return
+        # pares sem linhas suficientes (NaN) ficam por último
+        melhores = np.argpartition(np.where(np.isnan(valores), -1, np.abs(valores)), valores.size - m)[-m:]
+        candidatos.extend(
+            (idx_a[linhas[i]], idx_b[cols[i]], float(valores[i]))
+            for i in melhores
+        )
+
+    desvios = _percorrer(df, colunas, tamanho_bloco, paralelo, visitar, progresso)
+    candidatos = [par for par in candidatos
+                  if desvios[par[0]] > 0 and desvios[par[1]] > 0 and not np.isnan(par[2])]
+    candidatos.sort(key=lambda par: abs(par[2]), reverse=True)
+    return pd.DataFrame(
+        [(colunas[a], colunas[b], r) for a, b, r in candidatos[:k]],
+        columns=["coluna_a", "coluna_b", "correlacao"]
+    )
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+
+
+# ------------------------------------------------------------
+# GRÁFICO DE DISPERSÃO: PROJEÇÃO, AMOSTRAGEM E AGREGAÇÃO
+# ------------------------------------------------------------
+LIMITE_PONTOS = 5000
+GRADE = 50  # células por eixo na estratificação e na agregação 2D
+MODO_AMOSTRA = "amostra"
+MODO_AGREGADO = "agregado"
+
+
+
+def _indices_grade(valores, celulas):
+    minimo, maximo = valores.min(), valores.max()
+    if maximo <= minimo:
+        return np.zeros(valores.size, dtype=np.int64)
+    return np.minimum(((valores - minimo) / (maximo - minimo) * celulas).astype(np.int64), celulas - 1)
+
+
+
+def amostra_estratificada(x, y, limite, semente=0):
+    """Posições de uma amostra de ~`limite` pontos, estratificada por uma grade 2D.
+
+    Cada célula não vazia contribui proporcionalmente ao seu tamanho e com
+    pelo menos um ponto, então regiões esparsas (e outliers) não somem.
+    """
+    n = x.size
+    celula = _indices_grade(x, GRADE) * GRADE + _indices_grade(y, GRADE)
+    prioridade = np.random.default_rng(semente).random(n)
+    ordem = np.lexsort((prioridade, celula))
+    celulas_ordenadas = celula[ordem]
+
+    _, inicio, tamanho = np.unique(celulas_ordenadas, return_index=True, return_counts=True)
+    cota = np.maximum(1, np.round(tamanho * limite / n)).astype(np.int64)
+    rank = np.arange(n) - np.repeat(inicio, tamanho)
+    manter = rank < np.repeat(cota, tamanho)
+    return np.sort(ordem[manter])
+
+
+
+def agregar_grade(x, y, celulas=GRADE):
+    """Histograma 2D: centro de cada célula não vazia e quantos pontos caíram nela."""
+    contagens, bordas_x, bordas_y = np.histogram2d(x, y, bins=celulas)
+    centros_x = (bordas_x[:-1] + bordas_x[1:]) / 2
+    centros_y = (bordas_y[:-1] + bordas_y[1:]) / 2
+    ix, iy = np.nonzero(contagens)
+    return pd.DataFrame({
+        "x": centros_x[ix],
+        "y": centros_y[iy],
+        "contagem": contagens[ix, iy].astype(np.int64),
+    })
+
+
+
+def preparar_dispersao(df, col_x, col_y, limite=LIMITE_PONTOS, modo=MODO_AMOSTRA):
+    """Dados do gráfico com só as colunas X/Y e no máximo ~`limite` marcas.
+
+    Retorna `(dados, info)`. Até `limite` linhas os pontos vão como estão;
+    acima disso, conforme `modo`, vai uma amostra estratificada ou a grade
+    agregada (colunas `x`, `y`, `contagem`). `info` traz `total`,
+    `exibidos`, `agregados` e o `modo` efetivamente usado.
+    """
+    colunas = [col_x] if col_x == col_y else [col_x, col_y]
+    pontos = df[colunas].dropna()
+    x = pontos[col_x].to_numpy(dtype=np.float64)
+    y = pontos[col_y].to_numpy(dtype=np.float64)
+    total = x.size
+
+    if total <= limite:
+        dados = pd.DataFrame({"x": x, "y": y})
+        return dados, {"total": total, "exibidos": total, "agregados": 0, "modo": None}
+
+    if modo == MODO_AGREGADO:
+        dados = agregar_grade(x, y)
+        return dados, {"total": total, "exibidos": len(dados), "agregados": total, "modo": modo}
+
+    posicoes = amostra_estratificada(x, y, limite)
+    dados = pd.DataFrame({"x": x[posicoes], "y": y[posicoes]})
+    return dados, {"total": total, "exibidos": len(dados), "agregados": total - len(dados), "modo": modo}
+
+
+
+def grafico_dispersao(dados, info, col_x, col_y):
+    """Gráfico Altair (importado só aqui) para o resultado de `preparar_dispersao`."""
+    import altair as alt
+
+    eixo_x = alt.X("x:Q", title=col_x, scale=alt.Scale(zero=False))
+    eixo_y = alt.Y("y:Q", title=col_y, scale=alt.Scale(zero=False))
+    if info["modo"] == MODO_AGREGADO:
+        return alt.Chart(dados).mark_square(size=60).encode(
+            x=eixo_x,
+            y=eixo_y,
+            color=alt.Color("contagem:Q", scale=alt.Scale(type="log"), title="pontos"),
+            tooltip=[
+                alt.Tooltip("x:Q", title=col_x),
+                alt.Tooltip("y:Q", title=col_y),
+                alt.Tooltip("contagem:Q", title="pontos"),
+            ]
+        ).interactive()
+
+    return alt.Chart(dados).mark_circle(size=60).encode(
+        x=eixo_x,
+        y=eixo_y,
+        tooltip=[alt.Tooltip("x:Q", title=col_x), alt.Tooltip("y:Q", title=col_y)]
+    ).interactive()
@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+
+
+# ------------------------------------------------------------
+# DUPLICADOS POR HASH DE LINHA (EM BLOCOS, MEMÓRIA LIMITADA)
+# ------------------------------------------------------------
+TAMANHO_BLOCO = 1_000_000
+_HASH_NULO = np.uint64(0x9E3779B97F4A7C15)
+_HASH_MULT = np.uint64(1_000_003)
+
+
+
+def hash_linhas(bloco):
+    """Hash de 64 bits de cada linha, estável entre blocos do mesmo CSV.
+
+    Cada coluna é hasheada separadamente: numéricas viram float64 para que
+    1 (int) e 1.0 (float, quando outro bloco tem nulos) coincidam, e nulos
+    recebem um valor fixo, já que o dtype de uma coluna vazia varia por bloco.
+    """
+    acumulado = np.zeros(len(bloco), dtype=np.uint64)
+    for col in bloco.columns:
+        serie = bloco[col]
+        if pd.api.types.is_numeric_dtype(serie):
+            serie = serie.astype("float64")
+        hashes = pd.util.hash_pandas_object(serie, index=False).to_numpy(copy=True)
+        hashes[serie.isna().to_numpy()] = _HASH_NULO
+        acumulado = (acumulado * _HASH_MULT) ^ hashes
+    return acumulado
+
+
+
+def _fundir(a, b):
+    # `a` e `b` são níveis ordenados e disjuntos: intercala sem reordenar tudo
+    destino = np.searchsorted(a[0], b[0]) + np.arange(len(b[0]))
+    resto = np.ones(len(a[0]) + len(b[0]), dtype=bool)
+    resto[destino] = False
+    fundido = []
+    for x, y in zip(a, b):
+        saida = np.empty(len(resto), dtype=x.dtype)
+        saida[destino] = y
+        saida[resto] = x
+        fundido.append(saida)
+    return tuple(fundido)
+
+
+
+class ConjuntoHashes:
+    """Conjunto de hashes uint64 com contagem e primeira posição de cada um.
+
+    Guarda arrays ordenados em níveis (como uma LSM tree): cada bloco novo
+    vira um nível e níveis de tamanho parecido são fundidos, então inserir e
+    consultar são operações vetorizadas e cada hash ocupa 20 bytes, contra
+    ~100 de um `set` do Python.
+    """
+
+    def __init__(self):
+        self._niveis = []  # (hashes ordenados, contagens uint32, primeiras posições int64)
+
+    def __len__(self):
+        return sum(len(nivel[0]) for nivel in self._niveis)
+
+    def adicionar(self, hashes, posicoes):
+        """Registra os hashes (com suas posições globais) e devolve a máscara das primeiras ocorrências."""
+        # factorize é por tabela hash (sem ordenar o bloco inteiro); só os
+        # valores únicos são ordenados, o que também acelera o searchsorted.
+        codigos, unicos = pd.factorize(hashes)
+        primeiro = np.flatnonzero(np.diff(np.maximum.accumulate(codigos), prepend=-1) > 0)
+        contagem = np.bincount(codigos, minlength=len(unicos))
+        ordem = np.argsort(unicos)
+        unicos, primeiro, contagem = unicos[ordem], primeiro[ordem], contagem[ordem]
+        novo = np.ones(len(unicos), dtype=bool)
+        for existentes, contagens, _ in self._niveis:
+            pos = np.minimum(np.searchsorted(existentes, unicos), len(existentes) - 1)
+            achou = existentes[pos] == unicos
+            contagens[pos[achou]] += contagem[achou].astype(np.uint32)
+            novo &= ~achou
+
+        manter = np.zeros(len(hashes), dtype=bool)
+        manter[primeiro[novo]] = True
+        if novo.any():
+            self._inserir((
+                unicos[novo],
+                contagem[novo].astype(np.uint32),
+                np.asarray(posicoes)[primeiro[novo]].astype(np.int64),
+            ))
+        return manter
+
+    def _inserir(self, nivel):
+        self._niveis.append(nivel)
+        while len(self._niveis) > 1 and 2 * len(self._niveis[-1][0]) >= len(self._niveis[-2][0]):
+            b = self._niveis.pop()
+            a = self._niveis.pop()
+            self._niveis.append(_fundir(a, b))
+
+    def grupos(self, minimo=2):
+        """DataFrame `primeira_linha`/`ocorrencias` dos hashes vistos pelo menos `minimo` vezes."""
+        if not self._niveis:
+            return pd.DataFrame({"primeira_linha": np.array([], dtype=np.int64),
+                                 "ocorrencias": np.array([], dtype=np.uint32)})
+        contagens = np.concatenate([nivel[1] for nivel in self._niveis])
+        posicoes = np.concatenate([nivel[2] for nivel in self._niveis])
+        filtro = np.flatnonzero(contagens >= minimo)
+        contagens, posicoes = contagens[filtro], posicoes[filtro]
+        ordem = np.lexsort((posicoes, ~contagens))  # maiores grupos primeiro
+        return pd.DataFrame({"primeira_linha": posicoes[ordem], "ocorrencias": contagens[ordem]})
+
+
+
+class DetectorDuplicados:
+    """Marca as linhas repetidas de um CSV lido em blocos (mantém a primeira).
+
+    `subconjunto` limita as colunas comparadas, como em `drop_duplicates`.
+    Linhas diferentes só se confundem se colidirem no hash de 64 bits
+    (chance de ~3 em um milhão para 10 milhões de linhas únicas).
+    """
+
+    def __init__(self, subconjunto=None):
+        self.subconjunto = list(subconjunto) if subconjunto else None
+        self.vistos = ConjuntoHashes()
+        self.linhas = 0
+
+    def atualizar(self, bloco):
+        """Processa o próximo bloco e devolve a máscara das linhas que ficam."""
+        colunas = bloco[self.subconjunto] if self.subconjunto else bloco
+        posicoes = np.arange(self.linhas, self.linhas + len(bloco), dtype=np.int64)
+        self.linhas += len(bloco)
+        return self.vistos.adicionar(hash_linhas(colunas), posicoes)
+
+    @property
+    def duplicados(self):
+        return self.linhas - len(self.vistos)
+
+    def grupos(self):
+        return self.vistos.grupos()
+
+
+
+def remover_duplicados(df, subconjunto=None, tamanho_bloco=TAMANHO_BLOCO, progresso=None):
+    """`drop_duplicates(subset, keep="first")` feito em blocos.
+
+    Retorna `(df_sem_duplicados, grupos)`, em que `grupos` traz, para cada
+    conjunto de linhas repetidas, a posição da primeira e quantas eram.
+    `progresso(fracao, mensagem)`, se dado, é chamado a cada bloco.
+    """
+    detector = DetectorDuplicados(subconjunto)
+    mascaras = []
+    for inicio in range(0, len(df), tamanho_bloco):
+        mascaras.append(detector.atualizar(df.iloc[inicio:inicio + tamanho_bloco]))
+        if progresso is not None:
+            progresso(min(inicio + tamanho_bloco, len(df)) / len(df), f"{detector.duplicados} duplicados até agora")
+    manter = np.concatenate(mascaras) if mascaras else np.zeros(0, dtype=bool)
+    return df[manter], detector.grupos()
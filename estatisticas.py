@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+
+
+
+# ------------------------------------------------------------
+# ESTATÍSTICAS EM UMA PASSADA (ACUMULADOR COMBINÁVEL)
+# ------------------------------------------------------------
+CAPACIDADE_ESBOCO = 512
+QUANTIS = (0.25, 0.5, 0.75)
+
+
+
+class EsbocoQuantis:
+    """Esboço KLL simplificado para quantis aproximados.
+
+    Cada nível guarda até `capacidade` valores; quando enche, é ordenado e
+    metade dos itens (alternados, com deslocamento aleatório) sobe para o
+    nível seguinte com peso dobrado. Enquanto nada foi compactado os quantis
+    são exatos.
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_ESBOCO, semente=None):
+        self.capacidade = capacidade
+        self.niveis = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(semente)
+
+    def adicionar(self, valores):
+        valores = np.asarray(valores, dtype=np.float64)
+        if valores.size:
+            self.niveis[0] = np.concatenate([self.niveis[0], valores])
+            self._compactar()
+
+    def combinar(self, outro):
+        for nivel, itens in enumerate(outro.niveis):
+            if nivel == len(self.niveis):
+                self.niveis.append(np.empty(0, dtype=np.float64))
+            self.niveis[nivel] = np.concatenate([self.niveis[nivel], itens])
+        self._compactar()
+
+    def _compactar(self):
+        nivel = 0
+        while nivel < len(self.niveis):
+            itens = self.niveis[nivel]
+            if itens.size > self.capacidade:
+                itens = np.sort(itens)
+                # número par de itens sobe; o ímpar que sobrar fica no nível
+                resto = itens[-1:] if itens.size % 2 else itens[:0]
+                pares = itens[: itens.size - resto.size]
+                promovidos = pares[self._rng.integers(2)::2]
+                self.niveis[nivel] = resto
+                if nivel + 1 == len(self.niveis):
+                    self.niveis.append(np.empty(0, dtype=np.float64))
+                self.niveis[nivel + 1] = np.concatenate([self.niveis[nivel + 1], promovidos])
+            nivel += 1
+
+    def quantis(self, qs=QUANTIS):
+        valores = np.concatenate(self.niveis)
+        if not valores.size:
+            return [np.nan] * len(qs)
+        pesos = np.concatenate([np.full(itens.size, 2.0 ** n) for n, itens in enumerate(self.niveis)])
+        ordem = np.argsort(valores, kind="stable")
+        valores, pesos = valores[ordem], pesos[ordem]
+        if len(self.niveis) == 1 or all(not itens.size for itens in self.niveis[1:]):
+            # sem compactação: mesmo cálculo (interpolação linear) do pandas
+            return [float(np.quantile(valores, q)) for q in qs]
+        acumulado = np.cumsum(pesos) - pesos / 2
+        return [float(np.interp(q * pesos.sum(), acumulado, valores)) for q in qs]
+
+
+
+class ResumoEstatistico:
+    """Acumulador de estatísticas por coluna, combinável entre blocos.
+
+    Em uma única passada calcula contagem, média e variância (Welford/Chan),
+    mínimo, máximo, nulos e quantis aproximados. Funciona com um DataFrame
+    inteiro ou com blocos de um `read_csv(chunksize=...)`; colunas que
+    aparecerem como não numéricas em algum bloco são descartadas.
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_ESBOCO):
+        self.capacidade = capacidade
+        self.colunas = {}
+        self.nulos = {}
+        self.descartadas = set()
+        self.linhas = 0
+
+    def _novo(self):
+        return {
+            "count": 0,
+            "mean": 0.0,
+            "m2": 0.0,
+            "min": np.inf,
+            "max": -np.inf,
+            "esboco": EsbocoQuantis(self.capacidade),
+        }
+
+    def _combinar_momentos(self, atual, n, media, m2, minimo, maximo):
+        total = atual["count"] + n
+        delta = media - atual["mean"]
+        atual["mean"] += delta * n / total
+        atual["m2"] += m2 + delta * delta * atual["count"] * n / total
+        atual["count"] = total
+        atual["min"] = min(atual["min"], minimo)
+        atual["max"] = max(atual["max"], maximo)
+
+    def atualizar(self, df):
+        self.linhas += len(df)
+        for col in df.columns:
+            serie = df[col]
+            self.nulos[col] = self.nulos.get(col, 0) + int(serie.isna().sum())
+            if col in self.descartadas:
+                continue
+            if not pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_bool_dtype(serie):
+                self.descartadas.add(col)
+                self.colunas.pop(col, None)
+                continue
+
+            atual = self.colunas.setdefault(col, self._novo())
+            valores = serie.to_numpy(dtype=np.float64, na_value=np.nan)
+            valores = valores[~np.isnan(valores)]
+            if not valores.size:
+                continue
+            media = valores.mean()
+            self._combinar_momentos(
+                atual, valores.size, media, float(((valores - media) ** 2).sum()),
+                float(valores.min()), float(valores.max())
+            )
+            atual["esboco"].adicionar(valores)
+        return self
+
+    def combinar(self, outro):
+        self.linhas += outro.linhas
+        for col, nulos in outro.nulos.items():
+            self.nulos[col] = self.nulos.get(col, 0) + nulos
+        self.descartadas |= outro.descartadas
+        for col in list(self.colunas):
+            if col in self.descartadas:
+                del self.colunas[col]
+        for col, dados in outro.colunas.items():
+            if col in self.descartadas:
+                continue
+            atual = self.colunas.setdefault(col, self._novo())
+            if dados["count"]:
+                self._combinar_momentos(
+                    atual, dados["count"], dados["mean"], dados["m2"], dados["min"], dados["max"]
+                )
+                atual["esboco"].combinar(dados["esboco"])
+        return self
+
+    def medias(self):
+        return {
+            col: dados["mean"] if dados["count"] else np.nan
+            for col, dados in self.colunas.items()
+        }
+
+    def para_dataframe(self):
+        """Tabela no formato do `df.describe()`, com a linha extra `nulos`."""
+        linhas = {}
+        for col, dados in self.colunas.items():
+            n = dados["count"]
+            q1, q2, q3 = dados["esboco"].quantis()
+            linhas[col] = {
+                "count": float(n),
+                "mean": dados["mean"] if n else np.nan,
+                "std": np.sqrt(dados["m2"] / (n - 1)) if n > 1 else np.nan,
+                "min": dados["min"] if n else np.nan,
+                "25%": q1,
+                "50%": q2,
+                "75%": q3,
+                "max": dados["max"] if n else np.nan,
+                "nulos": float(self.nulos.get(col, 0)),
+            }
+        indice = ["count", "mean", "std", "min", "25%", "50%", "75%", "max", "nulos"]
+        return pd.DataFrame(linhas, index=indice)
+
+
+
+def resumir(df):
+    """Atalho: resumo estatístico de um DataFrame inteiro em uma passada."""
+    return ResumoEstatistico().atualizar(df).para_dataframe()
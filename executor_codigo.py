@@ -0,0 +1,172 @@
+import io
+import math
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from contextlib import redirect_stderr, redirect_stdout
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows não tem rlimits
+    resource = None
+
+
+
+# ------------------------------------------------------------
+# EXECUÇÃO ISOLADA DE CÓDIGO DO ALUNO (POOL DE PROCESSOS AQUECIDOS)
+# ------------------------------------------------------------
+NUM_TRABALHADORES = max(2, min(4, os.cpu_count() or 1))
+TEMPO_CPU = 5            # segundos de CPU por execução
+TEMPO_LIMITE = 10        # segundos de relógio por execução
+MEMORIA_MB = 512         # memória extra que cada execução pode alocar
+ESPERA_FILA = 15         # quanto esperar por um processo livre
+MAX_SAIDA = 100_000      # caracteres de stdout devolvidos para a página
+
+
+
+def _contexto():
+    metodos = multiprocessing.get_all_start_methods()
+    if "forkserver" in metodos:
+        contexto = multiprocessing.get_context("forkserver")
+        contexto.set_forkserver_preload(["numpy", "pandas"])
+        return contexto
+    return multiprocessing.get_context("spawn")
+
+
+
+def _limitar_memoria(megabytes):
+    if resource is None:
+        return
+    try:
+        with open("/proc/self/statm") as statm:
+            atual = int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return
+    limite = atual + megabytes * 1024 * 1024
+    _, maximo = resource.getrlimit(resource.RLIMIT_AS)
+    if maximo != resource.RLIM_INFINITY:
+        limite = min(limite, maximo)
+    resource.setrlimit(resource.RLIMIT_AS, (limite, maximo))
+
+
+
+def _limitar_cpu(segundos):
+    if resource is None:
+        return
+    uso = resource.getrusage(resource.RUSAGE_SELF)
+    gasto = int(math.ceil(uso.ru_utime + uso.ru_stime))
+    _, maximo = resource.getrlimit(resource.RLIMIT_CPU)
+    limite = gasto + segundos
+    if maximo != resource.RLIM_INFINITY:
+        limite = min(limite, maximo)
+    resource.setrlimit(resource.RLIMIT_CPU, (limite, maximo))
+
+
+
+def _trabalhador(conexao, memoria_mb):
+    import numpy as np
+    import pandas as pd
+
+    _limitar_memoria(memoria_mb)
+    while True:
+        try:
+            codigo, tempo_cpu = conexao.recv()
+        except (EOFError, OSError):
+            return
+
+        _limitar_cpu(tempo_cpu)
+        saida = io.StringIO()
+        erro = None
+        try:
+            with redirect_stdout(saida), redirect_stderr(saida):
+                exec(
+                    compile(codigo, "<seu código>", "exec"),
+                    {"__name__": "__main__", "pd": pd, "np": np, "math": math}
+                )
+        except MemoryError:
+            erro = f"limite de memória excedido ({memoria_mb} MB)"
+        except BaseException as e:  # inclui SystemExit de um exit() no código
+            erro = f"{type(e).__name__}: {e}"
+        conexao.send((saida.getvalue()[:MAX_SAIDA], erro))
+
+
+
+class PoolExecucao:
+    """Processos pré-iniciados (com pandas/numpy já importados) que executam código do aluno.
+
+    Cada execução roda em um processo livre, com limite de CPU e memória via
+    `resource` e limite de tempo de relógio no processo principal. Todo
+    processo é usado uma única vez: o que um código muda nos módulos (por
+    exemplo `pd.DataFrame = ...`) não chega à execução de outro aluno. O
+    substituto é criado em segundo plano (um fork do forkserver, que já tem
+    pandas e numpy carregados), fora do tempo de resposta.
+    """
+
+    def __init__(self, trabalhadores=NUM_TRABALHADORES, memoria_mb=MEMORIA_MB):
+        self.memoria_mb = memoria_mb
+        self._contexto = _contexto()
+        self._livres = queue.Queue()
+        for _ in range(trabalhadores):
+            self._livres.put(self._iniciar())
+
+    def _iniciar(self):
+        conexao, conexao_filho = self._contexto.Pipe()
+        processo = self._contexto.Process(
+            target=_trabalhador, args=(conexao_filho, self.memoria_mb), daemon=True
+        )
+        processo.start()
+        conexao_filho.close()
+        return {"processo": processo, "conexao": conexao}
+
+    def _encerrar(self, trabalhador):
+        trabalhador["conexao"].close()
+        if trabalhador["processo"].is_alive():
+            trabalhador["processo"].kill()
+        trabalhador["processo"].join(timeout=1)
+
+    def _substituir(self, trabalhador):
+        self._encerrar(trabalhador)
+        self._livres.put(self._iniciar())
+
+    def executar(self, codigo, tempo_cpu=TEMPO_CPU, tempo_limite=TEMPO_LIMITE):
+        """Roda `codigo` e devolve `{"saida", "erro", "tempo"}`."""
+        try:
+            trabalhador = self._livres.get(timeout=ESPERA_FILA)
+        except queue.Empty:
+            return {"saida": "", "erro": "servidor ocupado, tente novamente em instantes", "tempo": 0.0}
+
+        inicio = time.perf_counter()
+        try:
+            trabalhador["conexao"].send((codigo, tempo_cpu))
+            if trabalhador["conexao"].poll(tempo_limite):
+                saida, erro = trabalhador["conexao"].recv()
+            else:
+                saida, erro = "", f"tempo limite excedido ({tempo_limite}s)"
+        except (EOFError, OSError):
+            trabalhador["processo"].join(timeout=1)
+            if trabalhador["processo"].exitcode == -getattr(signal, "SIGXCPU", 0):
+                saida, erro = "", f"limite de CPU excedido ({tempo_cpu}s)"
+            else:
+                saida, erro = "", "o processo de execução foi encerrado (memória insuficiente?)"
+        finally:
+            threading.Thread(target=self._substituir, args=(trabalhador,), daemon=True).start()
+
+        return {"saida": saida, "erro": erro, "tempo": time.perf_counter() - inicio}
+
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+
+def executar_codigo(codigo):
+    """Executa o código no pool compartilhado (criado no primeiro uso)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PoolExecucao()
+    return _pool.executar(codigo)
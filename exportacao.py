@@ -0,0 +1,153 @@
+import gzip
+import os
+import shutil
+import tempfile
+from contextlib import ExitStack
+
+import pandas as pd
+
+from limpeza import LIMITE_SPOOL
+
+try:
+    import zstandard
+except ImportError:  # dependência opcional: sem ela o formato zstd não aparece
+    zstandard = None
+
+
+
+# ------------------------------------------------------------
+# EXPORTAÇÃO SOB DEMANDA (EM BLOCOS, COM COMPRESSÃO)
+# ------------------------------------------------------------
+TAMANHO_BLOCO = 100_000  # linhas codificadas por vez
+NIVEL_GZIP = 6
+NIVEL_ZSTD = 3
+
+
+
+def _compressor(compressao, destino):
+    """Arquivo de escrita que comprime para `destino` (ou o próprio destino)."""
+    if compressao == "gzip":
+        return gzip.GzipFile(fileobj=destino, mode="wb", compresslevel=NIVEL_GZIP)
+    if compressao == "zstd":
+        return zstandard.ZstdCompressor(level=NIVEL_ZSTD).stream_writer(destino, closefd=False)
+    return None
+
+
+
+def _gravar_csv(df, destino, compressao, tamanho_bloco):
+    escritor = _compressor(compressao, destino)
+    alvo = escritor or destino
+    for inicio in range(0, max(len(df), 1), tamanho_bloco):
+        bloco = df.iloc[inicio:inicio + tamanho_bloco]
+        alvo.write(bloco.to_csv(index=False, header=inicio == 0).encode("utf-8"))
+    if escritor is not None:
+        escritor.close()
+
+
+
+def _sem_objetos_mistos(df):
+    # O Arrow exige um tipo por coluna: colunas de objetos que misturam tipos
+    # (datas e textos, números e textos) vão como texto. É feito no df todo,
+    # antes dos blocos, para o esquema ser o mesmo em todos eles.
+    mistas = [
+        col for col, tipo in df.dtypes.items()
+        if tipo == object and pd.api.types.infer_dtype(df[col], skipna=True) not in ("string", "empty")
+    ]
+    return df.astype(dict.fromkeys(mistas, str)) if mistas else df
+
+
+
+def _gravar_parquet(df, destino, compressao, tamanho_bloco):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    df = _sem_objetos_mistos(df)
+    escritor = None
+    for inicio in range(0, max(len(df), 1), tamanho_bloco):
+        tabela = pa.Table.from_pandas(df.iloc[inicio:inicio + tamanho_bloco], preserve_index=False)
+        if escritor is None:
+            escritor = pq.ParquetWriter(destino, tabela.schema, compression=compressao)
+        escritor.write_table(tabela)
+    escritor.close()
+
+
+
+def _gravar_feather(df, destino, compressao, tamanho_bloco):
+    import pyarrow as pa
+
+    # O formato de arquivo IPC não aceita trocar o dicionário entre lotes, então
+    # as categorias viram texto aqui (o Feather ainda comprime os valores).
+    df = _sem_objetos_mistos(df)
+    colunas = df.select_dtypes("category").columns
+    opcoes = pa.ipc.IpcWriteOptions(compression=compressao)
+    escritor = None
+    for inicio in range(0, max(len(df), 1), tamanho_bloco):
+        bloco = df.iloc[inicio:inicio + tamanho_bloco]
+        if len(colunas):
+            bloco = bloco.astype({col: bloco[col].cat.categories.dtype for col in colunas})
+        tabela = pa.Table.from_pandas(bloco, preserve_index=False)
+        if escritor is None:
+            escritor = pa.ipc.new_file(destino, tabela.schema, options=opcoes)
+        escritor.write_table(tabela)
+    escritor.close()
+
+
+
+# rótulo -> (extensão, mime, gravador, compressão)
+FORMATOS = {
+    "CSV": ("csv", "text/csv", _gravar_csv, None),
+    "CSV (gzip)": ("csv.gz", "application/gzip", _gravar_csv, "gzip"),
+    "CSV (zstd)": ("csv.zst", "application/zstd", _gravar_csv, "zstd"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet", _gravar_parquet, "zstd"),
+    "Feather": ("feather", "application/vnd.apache.arrow.file", _gravar_feather, "zstd"),
+}
+if zstandard is None:
+    del FORMATOS["CSV (zstd)"]
+FORMATOS_CSV = [rotulo for rotulo, formato in FORMATOS.items() if formato[2] is _gravar_csv]
+
+
+
+def nome_arquivo(base, formato):
+    return f"{base}.{FORMATOS[formato][0]}"
+
+
+
+def mime(formato):
+    return FORMATOS[formato][1]
+
+
+
+def exportar(df, formato, tamanho_bloco=TAMANHO_BLOCO):
+    """Codifica `df` no `formato` escolhido, bloco a bloco, e devolve os bytes.
+
+    Só a saída (já comprimida) fica inteira; o texto CSV ou a tabela Arrow de
+    cada bloco é descartado antes do próximo.
+    """
+    _, _, gravar, compressao = FORMATOS[formato]
+    with tempfile.SpooledTemporaryFile(max_size=LIMITE_SPOOL, mode="w+b") as saida:
+        gravar(df, saida, compressao, tamanho_bloco)
+        saida.seek(0)
+        return saida.read()
+
+
+
+def comprimir_arquivo(arquivo, formato, tamanho_bloco=1024 * 1024):
+    """Versão de `exportar` para um CSV que já está em arquivo (modo streaming).
+
+    Com um caminho, cada chamada lê por um handle próprio, então downloads
+    simultâneos do mesmo arquivo não disputam a posição de leitura.
+    """
+    if formato not in FORMATOS_CSV:
+        raise ValueError(f"formato {formato!r} não é CSV")
+    with ExitStack() as pilha:
+        if isinstance(arquivo, (str, os.PathLike)):
+            arquivo = pilha.enter_context(open(arquivo, "rb"))
+        else:
+            arquivo.seek(0)
+        saida = pilha.enter_context(tempfile.SpooledTemporaryFile(max_size=LIMITE_SPOOL, mode="w+b"))
+        escritor = _compressor(FORMATOS[formato][3], saida)
+        shutil.copyfileobj(arquivo, escritor or saida, tamanho_bloco)
+        if escritor is not None:
+            escritor.close()
+        saida.seek(0)
+        return saida.read()
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+
+
+# ------------------------------------------------------------
+# GERADOR DE DADOS ALEATÓRIOS (np.random.Generator COM SEMENTE)
+# ------------------------------------------------------------
+# nome da coluna -> função que gera `n` valores com o gerador `rng`
+DISTRIBUICOES = {
+    "Normal": lambda rng, n: rng.standard_normal(n, dtype=np.float32),
+    "Uniforme": lambda rng, n: rng.random(n, dtype=np.float32),
+    "Inteiros (0–99)": lambda rng, n: rng.integers(0, 100, n, dtype=np.int32),
+    "Exponencial": lambda rng, n: rng.standard_exponential(n, dtype=np.float32),
+    "Log-normal": lambda rng, n: rng.lognormal(0.0, 0.5, n).astype(np.float32),
+    "Poisson (λ=4)": lambda rng, n: rng.poisson(4.0, n).astype(np.int32),
+    "Binomial (10; 0,3)": lambda rng, n: rng.binomial(10, 0.3, n).astype(np.int32),
+    "Passeio aleatório": lambda rng, n: rng.standard_normal(n, dtype=np.float32).cumsum(dtype=np.float64),
+}
+DISTRIBUICOES_PADRAO = ["Normal", "Uniforme", "Inteiros (0–99)"]
+OPCOES_LINHAS = [10, 100, 1_000, 10_000, 100_000, 1_000_000, 5_000_000, 10_000_000]
+
+
+
+def gerar_dados(semente, linhas, distribuicoes=DISTRIBUICOES_PADRAO):
+    """DataFrame com uma coluna por distribuição, reproduzível pela `semente`.
+
+    Cada coluna usa um fluxo próprio derivado da semente (`spawn`), então
+    incluir ou tirar uma distribuição não muda os valores das outras.
+    """
+    fluxos = np.random.SeedSequence(semente).spawn(len(DISTRIBUICOES))
+    geradores = dict(zip(DISTRIBUICOES, (np.random.default_rng(fluxo) for fluxo in fluxos)))
+    return pd.DataFrame({nome: DISTRIBUICOES[nome](geradores[nome], linhas) for nome in distribuicoes})
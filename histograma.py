@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+
+
+# ------------------------------------------------------------
+# HISTOGRAMA COM BINS ADAPTATIVOS (NUMPY VETORIZADO)
+# ------------------------------------------------------------
+MAX_BINS = 200
+MAX_VALORES_DISCRETOS = 50  # inteiros com poucos valores: uma barra por valor
+
+
+
+def numero_de_bins(valores):
+    """Freedman–Diaconis, com Sturges quando o IQR é zero; limitado a `MAX_BINS`."""
+    n = valores.size
+    if n < 2:
+        return 1
+    sturges = int(np.ceil(np.log2(n))) + 1
+    q1, q3 = np.percentile(valores, [25, 75])
+    amplitude = valores.max() - valores.min()
+    largura = 2 * (q3 - q1) / np.cbrt(n)
+    if largura <= 0 or amplitude <= 0:
+        return min(sturges, MAX_BINS)
+    return int(min(max(np.ceil(amplitude / largura), 1), MAX_BINS))
+
+
+
+def calcular_histograma(serie, bins=None):
+    """Contagens por faixa de valores de uma coluna numérica.
+
+    Retorna um DataFrame indexado pelo centro de cada faixa (ou pelo próprio
+    valor, para colunas inteiras com poucos valores distintos), com a coluna
+    `contagem`.
+    """
+    valores = serie.to_numpy(dtype=np.float64, na_value=np.nan)
+    valores = valores[np.isfinite(valores)]
+    if not valores.size:
+        return pd.DataFrame({"contagem": []})
+
+    inteiros = (
+        (pd.api.types.is_integer_dtype(serie) or np.array_equal(valores, np.round(valores)))
+        and np.abs(valores).max() < 2.0 ** 63  # fora do int64 (±1e300) o astype abaixo estouraria
+    )
+    if bins is None and inteiros:
+        unicos, contagens = np.unique(valores, return_counts=True)
+        if unicos.size <= MAX_VALORES_DISCRETOS:
+            return pd.DataFrame({"contagem": contagens}, index=pd.Index(unicos.astype(np.int64), name=serie.name))
+
+    contagens, bordas = np.histogram(valores, bins=bins or numero_de_bins(valores))
+    centros = (bordas[:-1] + bordas[1:]) / 2
+    return pd.DataFrame({"contagem": contagens}, index=pd.Index(centros, name=serie.name))
@@ -0,0 +1,212 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    MOTOR_CSV = "pyarrow"
+except ImportError:  # pragma: no cover - pyarrow vem com o streamlit
+    MOTOR_CSV = "c"
+
+
+
+# ------------------------------------------------------------
+# INGESTÃO DE CSV (ARROW MULTITHREAD + REDUÇÃO DE TIPOS)
+# ------------------------------------------------------------
+LIMITE_CARDINALIDADE = 0.5  # fração máxima de valores únicos para virar "category"
+_MAX_FLOAT32 = float(np.finfo(np.float32).max)
+
+
+
+def otimizar_tipos(df, float32=False):
+    """Reduz os tipos de cada coluna para o menor que comporta os dados.
+
+    Inteiros viram int8/int16/int32 e textos com poucos valores distintos
+    viram `category` quando isso ocupa menos memória, sem perder nada. Floats
+    só viram float32 com `float32=True` (~7 dígitos: serve para exibir e
+    resumir, não para gravar ou ajustar modelos). Retorna um novo DataFrame.
+    """
+    colunas = {}
+    for col in df.columns:
+        serie = df[col]
+        if pd.api.types.is_bool_dtype(serie):
+            pass
+        elif pd.api.types.is_integer_dtype(serie):
+            serie = pd.to_numeric(serie, downcast="integer")
+        elif pd.api.types.is_float_dtype(serie):
+            if float32 and not serie.abs().max() >= _MAX_FLOAT32:
+                serie = serie.astype("float32")
+        elif serie.dtype == object and pd.api.types.infer_dtype(serie, skipna=True) == "date":
+            # o motor Arrow entrega colunas de datas como objetos datetime.date
+            serie = pd.to_datetime(serie)
+        elif pd.api.types.is_string_dtype(serie) and pd.api.types.infer_dtype(serie, skipna=True) == "string":
+            unicos = serie.nunique(dropna=True)
+            if len(serie) and unicos / len(serie) <= LIMITE_CARDINALIDADE:
+                categorica = serie.astype("category")
+                if categorica.memory_usage(deep=True) < serie.memory_usage(deep=True):
+                    serie = categorica
+        colunas[col] = serie
+    return pd.DataFrame(colunas, index=df.index)
+
+
+
+def ler_csv_otimizado(arquivo, float32=False):
+    """Lê um CSV com o motor Arrow (multithread) e reduz os tipos.
+
+    Arquivos `.parquet` também são aceitos (lidos com `read_parquet`).
+    Retorna `(df, relatorio)`, onde o relatório traz o tempo de leitura e a
+    memória antes/depois da redução de tipos.
+    """
+    if hasattr(arquivo, "seek"):
+        arquivo.seek(0)
+    inicio = time.perf_counter()
+    if (getattr(arquivo, "name", "") or "").lower().endswith(".parquet"):
+        df = pd.read_parquet(arquivo)
+    else:
+        df = pd.read_csv(arquivo, engine=MOTOR_CSV)
+    tempo_leitura = time.perf_counter() - inicio
+
+    memoria_antes = int(df.memory_usage(deep=True).sum())
+    df = otimizar_tipos(df, float32=float32)
+    memoria_depois = int(df.memory_usage(deep=True).sum())
+
+    relatorio = {
+        "motor": MOTOR_CSV,
+        "linhas": len(df),
+        "colunas": df.shape[1],
+        "tempo_leitura": tempo_leitura,
+        "memoria_antes": memoria_antes,
+        "memoria_depois": memoria_depois,
+        "economia": memoria_antes - memoria_depois,
+    }
+    return df, relatorio
+
+
+
+# ------------------------------------------------------------
+# VÁRIOS ARQUIVOS (FRAGMENTOS): LEITURA PARALELA E ESQUEMA ÚNICO
+# ------------------------------------------------------------
+MAX_THREADS_LEITURA = min(8, os.cpu_count() or 1)
+
+
+
+def _como_texto(serie):
+    return serie.astype(str).where(serie.notna())
+
+
+
+def _tipo_unificado(tipos):
+    """dtype comum de uma coluna entre fragmentos (None = converter para texto)."""
+    if all(isinstance(tipo, pd.CategoricalDtype) for tipo in tipos):
+        categorias = pd.api.types.union_categoricals(
+            [pd.Categorical([], categories=tipo.categories) for tipo in tipos]
+        ).categories
+        return pd.CategoricalDtype(categorias)
+    if all(pd.api.types.is_bool_dtype(tipo) for tipo in tipos):
+        return tipos[0]
+    if all(pd.api.types.is_numeric_dtype(tipo) and not pd.api.types.is_bool_dtype(tipo) for tipo in tipos):
+        return np.result_type(*tipos)
+    if all(pd.api.types.is_datetime64_any_dtype(tipo) for tipo in tipos):
+        return tipos[0] if len(set(map(str, tipos))) == 1 else None
+    if all(pd.api.types.is_string_dtype(tipo) and not isinstance(tipo, pd.CategoricalDtype) for tipo in tipos):
+        return tipos[0]
+    return None
+
+
+
+def reconciliar_esquemas(partes):
+    """Alinha os fragmentos a um esquema único, sem concatenar ainda.
+
+    Colunas são casadas pelo nome normalizado (o nome exibido é o do primeiro
+    fragmento onde ela aparece), cada coluna recebe um dtype comum e as que
+    faltam em algum fragmento viram nulos. Retorna `(partes, ajustes)`, com
+    `ajustes` descrevendo o que precisou ser mudado.
+    """
+    from limpeza import normalizar_colunas
+
+    nomes = {}  # nome normalizado -> nome exibido
+    tipos = {}
+    renomeadas = []
+    for df in partes:
+        normalizados = normalizar_colunas(df.columns)
+        for original, normalizado in zip(df.columns, normalizados):
+            nomes.setdefault(normalizado, original)
+            tipos.setdefault(normalizado, []).append(df[original].dtype)
+        renomeadas.append(df.set_axis([nomes[n] for n in normalizados], axis=1))
+
+    ajustes = []
+    unificados = {}
+    for normalizado, nome in nomes.items():
+        faltando = len(partes) - len(tipos[normalizado])
+        if faltando:
+            ajustes.append(f"'{nome}' ausente em {faltando} arquivo(s): preenchida com nulos")
+        tipo = _tipo_unificado(tipos[normalizado])
+        if tipo is not None and faltando and pd.api.types.is_integer_dtype(tipo):
+            tipo = np.result_type(tipo, np.float32)
+        elif tipo is not None and faltando and pd.api.types.is_bool_dtype(tipo):
+            tipo = np.dtype(object)  # como na leitura de um arquivo só: True/False/None
+        if tipo is None:
+            ajustes.append(
+                f"'{nome}': tipos diferentes ({', '.join(sorted(set(map(str, tipos[normalizado]))))}) → texto"
+            )
+        unificados[nome] = tipo
+
+    alinhadas = []
+    for df in renomeadas:
+        colunas = {}
+        for nome, tipo in unificados.items():
+            if nome not in df.columns:
+                vazia = pd.Series(np.nan, index=df.index, dtype=object)
+                colunas[nome] = _como_texto(vazia) if tipo is None else vazia.astype(tipo)
+            elif tipo is None:
+                colunas[nome] = _como_texto(df[nome])
+            elif df[nome].dtype != tipo:
+                colunas[nome] = df[nome].astype(tipo)
+            else:
+                colunas[nome] = df[nome]
+        alinhadas.append(pd.DataFrame(colunas, index=df.index, copy=False))
+    return alinhadas, ajustes
+
+
+
+def ler_csvs_otimizado(arquivos, float32=False):
+    """Lê vários CSVs (fragmentos de um mesmo conjunto) em paralelo e junta.
+
+    Cada arquivo passa por `ler_csv_otimizado` em uma thread (o motor Arrow
+    solta o GIL durante a leitura); os esquemas são reconciliados e há uma
+    única concatenação. Retorna `(df, relatorio)` como `ler_csv_otimizado`,
+    com `arquivos` e `ajustes` a mais.
+    """
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(MAX_THREADS_LEITURA, len(arquivos))) as executor:
+        lidos = list(executor.map(lambda arquivo: ler_csv_otimizado(arquivo, float32), arquivos))
+    tempo_leitura = time.perf_counter() - inicio
+
+    memoria_antes = sum(relatorio["memoria_antes"] for _, relatorio in lidos)
+    partes, ajustes = reconciliar_esquemas([df for df, _ in lidos])
+    del lidos
+    df = pd.concat(partes, ignore_index=True)
+    del partes
+
+    # Só as colunas que viraram texto na reconciliação são reotimizadas (as
+    # demais já chegam com o tipo reduzido e não precisam de outra cópia).
+    textos = [col for col in df.columns if df[col].dtype == object or pd.api.types.is_string_dtype(df[col].dtype)]
+    if textos:
+        for col, serie in otimizar_tipos(df[textos], float32=float32).items():
+            df[col] = serie
+    memoria_depois = int(df.memory_usage(deep=True).sum())
+
+    return df, {
+        "motor": MOTOR_CSV,
+        "arquivos": len(arquivos),
+        "linhas": len(df),
+        "colunas": df.shape[1],
+        "tempo_leitura": tempo_leitura,
+        "memoria_antes": memoria_antes,
+        "memoria_depois": memoria_depois,
+        "economia": memoria_antes - memoria_depois,
+        "ajustes": ajustes,
+    }
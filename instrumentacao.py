@@ -0,0 +1,197 @@
+import io
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+
+# ------------------------------------------------------------
+# INSTRUMENTAÇÃO DAS ETAPAS (TEMPO, ALOCAÇÕES E RSS POR RERUN)
+# ------------------------------------------------------------
+_CHAVE = "_rastreamento"
+_sessoes_alocacoes = set()  # sessões que pediram o tracemalloc
+_alocacoes_lock = threading.Lock()
+
+
+
+def _rss_atual():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+
+def _pedir_alocacoes(sessao, alocacoes):
+    # O tracemalloc é global ao processo: fica ligado enquanto alguma sessão
+    # ainda aberta o pedir, e só desliga quando a última deixar de pedir.
+    from streamlit.runtime import Runtime
+
+    with _alocacoes_lock:
+        if alocacoes:
+            _sessoes_alocacoes.add(sessao)
+        else:
+            _sessoes_alocacoes.discard(sessao)
+        if Runtime.exists():
+            # sessões fechadas sem desmarcar a opção não seguram o rastreamento
+            _sessoes_alocacoes.difference_update(
+                [s for s in _sessoes_alocacoes if s is not None and not Runtime.instance().is_active_session(s)]
+            )
+        if _sessoes_alocacoes and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not _sessoes_alocacoes and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+
+def iniciar(ativo, pagina, alocacoes=False, perfil=False):
+    """Começa o rastreamento deste rerun (ou desliga, se `ativo` for falso).
+
+    `alocacoes` pede o tracemalloc para esta sessão (ele é global ao processo:
+    fica ligado enquanto alguma sessão pedir, e as outras também pagam o
+    custo) e `perfil` roda o cProfile no rerun.
+    """
+    contexto = get_script_run_ctx(suppress_warning=True)
+    _pedir_alocacoes(contexto.session_id if contexto is not None else None, alocacoes)
+
+    if not ativo:
+        st.session_state[_CHAVE] = None
+        return
+
+    rastro = {
+        "pagina": pagina,
+        "inicio": time.time(),
+        "etapas": [],
+        "_nivel": 0,
+        "_picos": [],
+        "_relogio": time.perf_counter(),
+        "_perfil": None,
+    }
+    if perfil:
+        import cProfile
+
+        rastro["_perfil"] = cProfile.Profile()
+        rastro["_perfil"].enable()
+    st.session_state[_CHAVE] = rastro
+
+
+
+@contextmanager
+def etapa(nome):
+    """Mede uma etapa do rerun; sem rastreamento ativo não faz nada."""
+    # Tarefas em segundo plano rodam fora do rerun (sem session_state).
+    if get_script_run_ctx(suppress_warning=True) is None:
+        yield
+        return
+    rastro = st.session_state.get(_CHAVE)
+    if rastro is None:
+        yield
+        return
+
+    # A posição é reservada na entrada, então a tabela fica na ordem de início
+    # (etapa externa antes das internas).
+    registro = {"etapa": nome, "nivel": rastro["_nivel"]}
+    rastro["etapas"].append(registro)
+    rss_antes = _rss_atual()
+    medir_alocacoes = tracemalloc.is_tracing()
+    if medir_alocacoes:
+        # reset_peak é global: o pico das etapas internas é repassado à externa
+        tracemalloc.reset_peak()
+        alocado_antes = tracemalloc.get_traced_memory()[0]
+        rastro["_picos"].append(0)
+    rastro["_nivel"] += 1
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registro["segundos"] = time.perf_counter() - inicio
+        rastro["_nivel"] -= 1
+        if medir_alocacoes and rastro["_picos"]:
+            atual, pico = tracemalloc.get_traced_memory()
+            pico = max(pico, rastro["_picos"].pop())
+            if rastro["_picos"]:
+                rastro["_picos"][-1] = max(rastro["_picos"][-1], pico)
+            registro["alocado"] = atual - alocado_antes
+            registro["pico_alocado"] = pico - alocado_antes
+        rss_depois = _rss_atual()
+        if rss_antes is not None and rss_depois is not None:
+            registro["rss_delta"] = rss_depois - rss_antes
+
+
+
+def finalizar():
+    """Encerra o rastreamento do rerun e devolve o rastro (ou None)."""
+    rastro = st.session_state.get(_CHAVE)
+    if rastro is None:
+        return None
+    rastro["total"] = time.perf_counter() - rastro["_relogio"]
+    perfil = rastro.pop("_perfil", None)
+    if perfil is not None:
+        perfil.disable()
+        rastro["_perfil_bytes"], rastro["_perfil_texto"] = _exportar_perfil(perfil)
+    return rastro
+
+
+
+def _exportar_perfil(perfil, linhas=15):
+    """Bytes no formato de `dump_stats` (.prof) e o texto das funções mais caras."""
+    import marshal
+    import pstats
+
+    perfil.create_stats()
+    saida = io.StringIO()
+    pstats.Stats(perfil, stream=saida).sort_stats("cumulative").print_stats(linhas)
+    return marshal.dumps(perfil.stats), saida.getvalue()
+
+
+
+def rastro_json(rastro):
+    publico = {k: v for k, v in rastro.items() if not k.startswith("_")}
+    return json.dumps(publico, ensure_ascii=False, indent=2)
+
+
+
+def mostrar_painel(rastro):
+    """Tabela de etapas do rerun e exportação (JSON / .prof) na barra lateral."""
+    if rastro is None:
+        return
+    barra = st.sidebar
+    barra.caption(f"Rerun de **{rastro['pagina']}**: {rastro['total'] * 1000:.0f} ms")
+    if rastro["etapas"]:
+        linhas = []
+        for registro in rastro["etapas"]:
+            linha = {
+                "etapa": "· " * registro["nivel"] + registro["etapa"],
+                "ms": round(registro.get("segundos", 0) * 1000, 1),
+            }
+            if "pico_alocado" in registro:
+                linha["pico MB"] = round(registro["pico_alocado"] / 2**20, 2)
+            if "rss_delta" in registro:
+                linha["ΔRSS MB"] = round(registro["rss_delta"] / 2**20, 2)
+            linhas.append(linha)
+        barra.dataframe(linhas, hide_index=True)
+    else:
+        barra.caption("Nenhuma etapa instrumentada nesta página.")
+
+    barra.download_button(
+        "⬇️ Rastro do rerun (JSON)",
+        data=rastro_json(rastro),
+        file_name="rastro_rerun.json",
+        mime="application/json"
+    )
+    if "_perfil_bytes" in rastro:
+        barra.download_button(
+            "⬇️ Perfil cProfile (.prof)",
+            data=rastro["_perfil_bytes"],
+            file_name="rerun.prof",
+            mime="application/octet-stream"
+        )
+        with barra.expander("Funções mais caras (cProfile)"):
+            st.code(rastro["_perfil_texto"], language="text")
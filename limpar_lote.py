@@ -0,0 +1,151 @@
+"""Limpa em paralelo todos os CSVs de um diretório (mesma limpeza da página).
+
+Cada arquivo é limpo em blocos por um processo do pool e gravado com o
+mesmo nome no diretório de saída; o progresso sai arquivo a arquivo e, no
+fim, um resumo com linhas, duplicados, nulos e falhas.
+
+    python limpar_lote.py exportacoes/ limpos/ --processos 8
+    python limpar_lote.py exportacoes/ limpos/ --recursivo --colunas id data --resumo resumo.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from limpeza import TAMANHO_BLOCO, limpar_arquivo
+
+
+
+def listar_csvs(diretorio, recursivo=False):
+    """Caminhos relativos dos `.csv` de `diretorio` (em ordem, para saída estável)."""
+    if not recursivo:
+        return sorted(
+            nome for nome in os.listdir(diretorio)
+            if nome.lower().endswith(".csv") and os.path.isfile(os.path.join(diretorio, nome))
+        )
+    encontrados = []
+    for raiz, _, nomes in os.walk(diretorio):
+        for nome in nomes:
+            if nome.lower().endswith(".csv"):
+                encontrados.append(os.path.relpath(os.path.join(raiz, nome), diretorio))
+    return sorted(encontrados)
+
+
+
+def _processar(entrada, saida, tamanho_bloco, subconjunto):
+    # Roda no processo do pool: devolve só números (nada de DataFrames) e
+    # transforma falhas em resultado, para um arquivo ruim não parar o lote.
+    inicio = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(saida) or ".", exist_ok=True)
+        resumo = limpar_arquivo(entrada, saida, tamanho_bloco, subconjunto)
+    except Exception as e:
+        if os.path.exists(saida):
+            os.remove(saida)
+        return {"arquivo": entrada, "erro": f"{type(e).__name__}: {e}", "tempo": time.perf_counter() - inicio}
+    grupos = resumo["grupos_duplicados"]
+    return {
+        "arquivo": entrada,
+        "linhas_lidas": resumo["linhas_lidas"],
+        "linhas_gravadas": resumo["linhas_gravadas"],
+        "duplicados_removidos": resumo["duplicados_removidos"],
+        "grupos_duplicados": len(grupos),
+        "maior_grupo": int(grupos["ocorrencias"].iloc[0]) if len(grupos) else 0,
+        "nulos_preenchidos": resumo["nulos_preenchidos"],
+        "tempo": time.perf_counter() - inicio,
+    }
+
+
+
+def limpar_diretorio(entrada, saida, processos=None, recursivo=False,
+                     tamanho_bloco=TAMANHO_BLOCO, subconjunto=None, progresso=None):
+    """Limpa todos os CSVs de `entrada` em um pool de processos.
+
+    `progresso(n, total, resultado)` é chamado a cada arquivo concluído.
+    Retorna `{"arquivos", "falhas", "totais", "tempo", "resultados"}`.
+    """
+    if os.path.abspath(entrada) == os.path.abspath(saida):
+        raise ValueError("O diretório de saída precisa ser diferente do de entrada.")
+    arquivos = listar_csvs(entrada, recursivo)
+    inicio = time.perf_counter()
+    resultados = []
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        futuros = [
+            pool.submit(
+                _processar, os.path.join(entrada, nome), os.path.join(saida, nome),
+                tamanho_bloco, subconjunto
+            )
+            for nome in arquivos
+        ]
+        for n, futuro in enumerate(as_completed(futuros), 1):
+            resultado = futuro.result()
+            resultados.append(resultado)
+            if progresso is not None:
+                progresso(n, len(arquivos), resultado)
+
+    ok = [r for r in resultados if "erro" not in r]
+    totais = {
+        campo: sum(r[campo] for r in ok)
+        for campo in ["linhas_lidas", "linhas_gravadas", "duplicados_removidos", "nulos_preenchidos"]
+    }
+    resultados.sort(key=lambda r: r["arquivo"])
+    return {
+        "arquivos": len(arquivos),
+        "falhas": len(resultados) - len(ok),
+        "totais": totais,
+        "tempo": time.perf_counter() - inicio,
+        "resultados": resultados,
+    }
+
+
+
+def _imprimir_progresso(n, total, resultado):
+    nome = os.path.basename(resultado["arquivo"])
+    if "erro" in resultado:
+        detalhe = f"ERRO ({resultado['erro']})"
+    else:
+        detalhe = (
+            f"{resultado['linhas_lidas']} linhas, {resultado['duplicados_removidos']} duplicados, "
+            f"{resultado['nulos_preenchidos']} nulos preenchidos"
+        )
+    print(f"[{n}/{total}] {nome}: {detalhe} ({resultado['tempo']:.1f}s)", file=sys.stderr)
+
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("entrada", help="diretório com os CSVs")
+    parser.add_argument("saida", help="diretório onde os CSVs limpos são gravados")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: número de CPUs")
+    parser.add_argument("--recursivo", action="store_true", help="inclui subdiretórios")
+    parser.add_argument("--tamanho-bloco", type=int, default=TAMANHO_BLOCO)
+    parser.add_argument(
+        "--colunas", nargs="+", metavar="COLUNA",
+        help="colunas (nomes normalizados) que identificam duplicados; padrão: todas"
+    )
+    parser.add_argument("--resumo", help="grava o resumo completo neste arquivo JSON")
+    args = parser.parse_args(argv)
+
+    relatorio = limpar_diretorio(
+        args.entrada, args.saida, args.processos, args.recursivo,
+        args.tamanho_bloco, args.colunas, progresso=_imprimir_progresso
+    )
+    totais = relatorio["totais"]
+    print(
+        f"{relatorio['arquivos']} arquivos em {relatorio['tempo']:.1f}s "
+        f"({relatorio['falhas']} com erro): {totais['linhas_lidas']} linhas lidas, "
+        f"{totais['linhas_gravadas']} gravadas, {totais['duplicados_removidos']} duplicados removidos, "
+        f"{totais['nulos_preenchidos']} nulos preenchidos",
+        file=sys.stderr
+    )
+    if args.resumo:
+        with open(args.resumo, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    return 1 if relatorio["falhas"] else 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
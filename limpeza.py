@@ -0,0 +1,235 @@
+import os
+import tempfile
+from contextlib import ExitStack
+
+import numpy as np
+import pandas as pd
+
+from duplicados import DetectorDuplicados, remover_duplicados
+from estatisticas import ResumoEstatistico
+
+
+
+# ------------------------------------------------------------
+# LIMPEZA DE CSV: CABEÇALHOS, DUPLICADOS E NULOS
+# ------------------------------------------------------------
+TAMANHO_BLOCO = 100_000
+LIMITE_SPOOL = 64 * 1024 * 1024  # acima disso o temporário vai para o disco
+VALOR_DESCONHECIDO = "Desconhecido"
+
+
+
+def normalizar_colunas(colunas):
+    """Padroniza nomes de colunas: sem espaços nas pontas, minúsculas e `_`."""
+    return (
+        pd.Index(colunas)
+        .astype(str)
+        .str.strip()
+        .str.lower()
+        .str.replace(" ", "_")
+    )
+
+
+
+def preencher_nulos(df, medias=None):
+    """Numéricas recebem a média da coluna e as demais `VALOR_DESCONHECIDO`.
+
+    Datas ficam com NaT: um texto no meio delas viraria uma coluna de objetos
+    mistos, que o Parquet e o Feather não aceitam. Numéricas sem nenhum valor
+    (média NaN) também ficam como estão e não contam. `medias` permite usar
+    médias globais (da limpeza em blocos); por padrão são as do próprio
+    `df`. Retorna `(df, nulos_preenchidos)`.
+    """
+    if medias is None:
+        medias = ResumoEstatistico().atualizar(df).medias()
+    nulos = df.isna().sum()
+    datas = df.dtypes.map(pd.api.types.is_datetime64_any_dtype).to_numpy()
+    nulos = nulos[(nulos.to_numpy() > 0) & ~datas]
+    valores = {col: medias[col] if col in medias else VALOR_DESCONHECIDO for col in nulos.index}
+    valores = {col: valor for col, valor in valores.items() if pd.notna(valor)}
+    if not valores:
+        return df, 0
+    colunas = list(valores)
+    # o dtype "boolean" não aceita o texto: vira objeto, como um CSV com nulos
+    booleanas = {col: object for col in colunas if isinstance(df[col].dtype, pd.BooleanDtype)}
+    if booleanas:
+        df = df.astype(booleanas)
+    categorias = {
+        col: df[col].cat.add_categories(VALOR_DESCONHECIDO)
+        for col in colunas
+        if isinstance(df[col].dtype, pd.CategoricalDtype)
+        and valores[col] not in df[col].cat.categories
+    }
+    if categorias:
+        df = df.assign(**categorias)
+    return df.fillna(valores), int(nulos[colunas].sum())
+
+
+
+def limpar_dataframe(df, subconjunto=None):
+    """Limpeza completa em memória: cabeçalhos, duplicados e nulos.
+
+    `subconjunto` (nomes já normalizados) limita as colunas que definem um
+    duplicado. Retorna `(df_limpo, resumo)`.
+    """
+    df_limpo = df.set_axis(normalizar_colunas(df.columns), axis=1)
+    df_limpo, grupos = remover_duplicados(df_limpo, subconjunto)
+    df_limpo, nulos = preencher_nulos(df_limpo)
+    return df_limpo, {
+        "linhas_lidas": len(df),
+        "linhas_gravadas": len(df_limpo),
+        "duplicados_removidos": len(df) - len(df_limpo),
+        "grupos_duplicados": grupos,
+        "nulos_preenchidos": nulos,
+    }
+
+
+
+# ------------------------------------------------------------
+# LIMPEZA EM BLOCOS (STREAMING) PARA CSVs GRANDES
+# ------------------------------------------------------------
+def cabecalhos(arquivos):
+    """Colunas normalizadas de cada arquivo e a união delas (na ordem em que aparecem)."""
+    por_arquivo = []
+    for arquivo in arquivos:
+        if hasattr(arquivo, "seek"):
+            arquivo.seek(0)
+        por_arquivo.append(normalizar_colunas(pd.read_csv(arquivo, nrows=0).columns))
+    uniao = list(dict.fromkeys(col for colunas in por_arquivo for col in colunas))
+    return por_arquivo, uniao
+
+
+
+def tamanho_arquivo(arquivo):
+    """Tamanho em bytes de um upload ou caminho (0 se não der para saber)."""
+    if hasattr(arquivo, "getvalue"):
+        # getvalue() não copia os bytes do upload; getbuffer() copiaria tudo
+        return len(arquivo.getvalue())
+    if isinstance(arquivo, (str, os.PathLike)):
+        return os.path.getsize(arquivo)
+    if hasattr(arquivo, "seek"):
+        posicao = arquivo.tell()
+        tamanho = arquivo.seek(0, os.SEEK_END)
+        arquivo.seek(posicao)
+        return tamanho
+    return 0
+
+
+
+def _ler_blocos(arquivos, tamanho_bloco):
+    # Um ou vários arquivos (fragmentos): cada bloco já sai com as colunas
+    # normalizadas e alinhadas à união dos cabeçalhos, junto com a fração
+    # (em bytes) do total já lida.
+    if not isinstance(arquivos, (list, tuple)):
+        arquivos = [arquivos]
+    por_arquivo, uniao = cabecalhos(arquivos)
+    tamanhos = [tamanho_arquivo(arquivo) for arquivo in arquivos]
+    total = sum(tamanhos) or 1
+    anteriores = 0
+    for arquivo, colunas, tamanho in zip(arquivos, por_arquivo, tamanhos):
+        with ExitStack() as pilha:
+            if isinstance(arquivo, (str, os.PathLike)):
+                arquivo = pilha.enter_context(open(arquivo, "rb"))
+            else:
+                arquivo.seek(0)
+            for bloco in pd.read_csv(arquivo, chunksize=tamanho_bloco):
+                bloco.columns = colunas
+                lida = min((anteriores + arquivo.tell()) / total, 1.0)
+                yield (bloco if list(colunas) == uniao else bloco.reindex(columns=uniao)), lida
+        anteriores += tamanho
+
+
+
+def _acumular_tipos(tipos, bloco):
+    # dtype numérico comum de cada coluna entre os blocos (None = não numérica
+    # em algum bloco); fixado na 2ª passada, um mesmo valor sai escrito igual
+    # em todos os blocos ("1.0" e não "1" só onde o bloco não tinha nulos)
+    for col, tipo in bloco.dtypes.items():
+        if col in tipos and tipos[col] is None:
+            continue
+        if pd.api.types.is_numeric_dtype(tipo) and not pd.api.types.is_bool_dtype(tipo):
+            tipos[col] = np.result_type(tipos[col], tipo) if col in tipos else tipo
+        else:
+            tipos[col] = None
+
+
+
+def limpar_csv_em_blocos(arquivo, tamanho_bloco=TAMANHO_BLOCO, subconjunto=None, destino=None, progresso=None):
+    """Limpa um CSV (ou vários, como um só) bloco a bloco, sem nunca carregá-lo inteiro na memória.
+
+    1ª passada: marca duplicados pelo hash das linhas (ou só das colunas de
+    `subconjunto`, já normalizadas) com um `DetectorDuplicados` e acumula
+    um `ResumoEstatistico` das linhas únicas (médias globais das numéricas).
+    2ª passada: reaplica a máscara de linhas únicas, preenche os nulos e grava
+    o resultado em `destino` (um arquivo binário aberto) ou, sem ele, em um
+    arquivo temporário (em memória até `LIMITE_SPOOL`).
+
+    `progresso(fracao, mensagem)`, se dado, é chamado a cada bloco (e pode
+    interromper a limpeza levantando uma exceção).
+
+    Retorna `(saida, resumo)`; o temporário volta posicionado no início.
+    """
+    colunas = None
+    detector = DetectorDuplicados(subconjunto)
+    mascaras = []
+    estatisticas = ResumoEstatistico()
+    tipos = {}
+    linhas_lidas = 0
+
+    # 1ª passada: duplicados + estatísticas
+    for bloco, lida in _ler_blocos(arquivo, tamanho_bloco):
+        if colunas is None:
+            colunas = bloco.columns
+        linhas_lidas += len(bloco)
+
+        manter = detector.atualizar(bloco)
+        mascaras.append(np.packbits(manter))
+
+        estatisticas.atualizar(bloco[manter])
+        _acumular_tipos(tipos, bloco)
+        if progresso is not None:
+            progresso(lida / 2, f"1ª passada: {linhas_lidas} linhas lidas")
+
+    if colunas is None:
+        raise ValueError("O arquivo CSV está vazio.")
+
+    medias = estatisticas.medias()
+    tipos = {col: tipo for col, tipo in tipos.items() if tipo is not None}
+
+    # 2ª passada: aplica a limpeza e grava a saída
+    saida = destino if destino is not None else tempfile.SpooledTemporaryFile(max_size=LIMITE_SPOOL, mode="w+b")
+    linhas_gravadas = 0
+    nulos_preenchidos = 0
+    for n, (bloco, lida) in enumerate(_ler_blocos(arquivo, tamanho_bloco)):
+        manter = np.unpackbits(mascaras[n], count=len(bloco)).astype(bool)
+        bloco, nulos = preencher_nulos(bloco[manter], medias)
+        nulos_preenchidos += nulos
+        diferentes = {col: tipo for col, tipo in tipos.items() if bloco[col].dtype != tipo}
+        if diferentes:
+            bloco = bloco.astype(diferentes)
+        bloco.to_csv(saida, index=False, header=(n == 0), encoding="utf-8")
+        linhas_gravadas += len(bloco)
+        if progresso is not None:
+            progresso(0.5 + lida / 2, f"2ª passada: {linhas_gravadas} linhas gravadas")
+
+    if destino is None:
+        saida.seek(0)
+    resumo = {
+        "linhas_lidas": linhas_lidas,
+        "linhas_gravadas": linhas_gravadas,
+        "duplicados_removidos": linhas_lidas - linhas_gravadas,
+        "grupos_duplicados": detector.grupos(),
+        "nulos_preenchidos": nulos_preenchidos,
+        "medias": medias,
+        "estatisticas": estatisticas.para_dataframe(),
+        "colunas": list(colunas),
+    }
+    return saida, resumo
+
+
+
+def limpar_arquivo(entrada, saida, tamanho_bloco=TAMANHO_BLOCO, subconjunto=None):
+    """Limpa o CSV em `entrada` (caminho) e grava o resultado no caminho `saida`."""
+    with open(saida, "wb") as destino:
+        _, resumo = limpar_csv_em_blocos(entrada, tamanho_bloco, subconjunto, destino=destino)
+    return resumo
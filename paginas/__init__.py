@@ -0,0 +1,24 @@
+import importlib
+
+
+
+# ------------------------------------------------------------
+# REGISTRO DE PÁGINAS (CADA SEÇÃO É IMPORTADA SÓ QUANDO ABERTA)
+# ------------------------------------------------------------
+PAGINAS = {
+    "🏠 Página Inicial": "inicio",
+    "🧩 Introdução à Ciência de Dados": "introducao",
+    "📊 Limpeza de Dados": "limpeza_dados",
+    "🧹 Limpeza de CSV (Profissional)": "limpeza_csv",
+    "📈 Análise de Dados": "analise",
+    "🧠 Funções Python": "funcoes",
+    "📂 Operações com Listas": "listas",
+    "⚡ Módulo Avançado Interativo": "modulo_avancado",
+    "❓ Quiz do Curso": "quiz",
+}
+
+
+
+def carregar(titulo):
+    """Importa (uma vez por processo) o módulo da página escolhida no menu."""
+    return importlib.import_module(f"{__name__}.{PAGINAS[titulo]}")
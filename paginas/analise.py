@@ -0,0 +1,254 @@
+import numpy as np
+import streamlit as st
+
+import consulta_sql
+from boxplot import estatisticas_boxplot, grafico_boxplot
+from cache_dados import artefato, chave_conjunto, hash_conteudo, ler_csvs
+from correlacao import matriz_correlacao, top_pares
+from dispersao import LIMITE_PONTOS, MODO_AGREGADO, MODO_AMOSTRA, grafico_dispersao, preparar_dispersao
+from estatisticas import resumir
+from histograma import calcular_histograma
+from instrumentacao import etapa
+from perfil import perfil_colunas
+from paginas.comum import em_segundo_plano, mostrar_ingestao
+from visualizador import mostrar_tabela
+
+
+LIMITE_COLUNAS_MATRIZ = 50  # acima disso a correlação abre no modo top-k
+MAX_COLUNAS_PERFIL = 50  # acima disso o perfil ganha um filtro por nome
+LIMITE_CORR_SEGUNDO_PLANO = 500_000_000  # linhas × colunas²: acima disso a correlação vira tarefa
+MODO_SQL = "🦆 Consulta SQL (DuckDB)"
+
+
+
+def mostrar_consulta_sql(arquivos):
+    """Painel SQL: o DuckDB lê os arquivos do disco e só o resultado vem para o pandas."""
+    if not consulta_sql.disponivel():
+        st.info("O modo SQL precisa do pacote `duckdb` (`pip install duckdb`).")
+        return
+
+    chave = chave_conjunto(arquivos)
+    try:
+        caminhos, formato = consulta_sql.despejar(arquivos, [hash_conteudo(arquivo) for arquivo in arquivos])
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    with st.expander(f"📋 Colunas da tabela `{consulta_sql.TABELA}`"):
+        try:
+            st.dataframe(
+                artefato(chave, "sql_esquema", lambda: consulta_sql.esquema(caminhos, formato)),
+                hide_index=True
+            )
+        except consulta_sql.ErroSQL as e:
+            st.error(str(e))
+
+    with st.form("consulta_sql"):
+        sql = st.text_area("SQL", consulta_sql.CONSULTA_PADRAO, height=150)
+        plano = st.checkbox("Mostrar o plano de execução (EXPLAIN)")
+        st.form_submit_button("▶️ Executar")
+    if not sql.strip():
+        return
+
+    try:
+        with etapa("consulta SQL"):
+            resultado = artefato(
+                chave, "sql",
+                lambda: consulta_sql.executar_sql(caminhos, formato, sql, plano=plano),
+                sql, plano
+            )
+    except consulta_sql.ErroSQL as e:
+        st.error(str(e))
+        return
+
+    if resultado["dados"] is None:
+        st.success(f"Comando executado em {resultado['tempo']:.2f}s.")
+        return
+    st.dataframe(resultado["dados"])
+    st.caption(
+        f"{len(resultado['dados'])} linhas em {resultado['tempo']:.2f}s"
+        + (f" (resultado cortado em {consulta_sql.MAX_LINHAS} linhas)" if resultado["truncado"] else "")
+    )
+    if resultado["plano"]:
+        st.code(resultado["plano"], language="text")
+
+
+
+# ------------------------------------------------------------
+# --- 6. Análise de Dados ---
+# ------------------------------------------------------------
+def mostrar():
+    st.title("📈 Análise de Dados")
+    st.subheader("Explore, visualize e entenda seus dados!")
+
+
+
+    uploaded_files = st.file_uploader(
+        "📂 Envie um ou mais arquivos CSV (ou Parquet) para análise",
+        type=["csv", "parquet"],
+        accept_multiple_files=True,
+        help="Vários arquivos (ex.: um por dia) são combinados em um único conjunto."
+    )
+
+
+
+    if uploaded_files:
+        modo = st.radio(
+            "Modo de análise",
+            ["📊 Resumos e gráficos", MODO_SQL],
+            horizontal=True,
+            help="No modo SQL os arquivos não são carregados na memória: o DuckDB lê direto do disco."
+        )
+        if modo == MODO_SQL:
+            mostrar_consulta_sql(uploaded_files)
+            return
+
+        with etapa("leitura do CSV (read_csv)"):
+            chave, df = ler_csvs(uploaded_files)
+        mostrar_ingestao(chave)
+        
+        # --- Visualização básica ---
+        st.subheader("📄 Visualização das primeiras linhas")
+        mostrar_tabela(df, "analise", chave, tamanho_pagina=10)
+
+
+
+        st.subheader("📊 Estatísticas descritivas")
+        with etapa("describe"):
+            st.dataframe(artefato(chave, "resumo", lambda: resumir(df)))
+
+
+
+        st.subheader("📌 Informações do DataFrame")
+        with etapa("perfil das colunas"):
+            perfil = artefato(chave, "perfil", lambda: perfil_colunas(df))
+        tipos = perfil["tipo"].value_counts()
+        st.write(
+            f"Linhas: {df.shape[0]}, Colunas: {df.shape[1]} · memória: {perfil['memoria_bytes'].sum() / 1024 ** 2:.1f} MB · "
+            + ", ".join(f"{tipo} ({n})" for tipo, n in tipos.items())
+        )
+        if len(perfil) > MAX_COLUNAS_PERFIL:
+            busca = st.text_input("Filtrar colunas pelo nome", key="analise_perfil_busca")
+            if busca:
+                perfil = perfil[perfil.index.astype(str).str.contains(busca, case=False, regex=False)]
+        st.dataframe(
+            perfil,
+            column_config={
+                "tipo": "Tipo",
+                "nao_nulos": st.column_config.NumberColumn("Não nulos", format="localized"),
+                "nulos": st.column_config.NumberColumn("Nulos", format="localized"),
+                "pct_nulos": st.column_config.ProgressColumn("% nulos", min_value=0, max_value=1, format="percent"),
+                "distintos": st.column_config.NumberColumn("Distintos", format="localized"),
+                "distintos_aproximado": st.column_config.CheckboxColumn("≈ (HyperLogLog)"),
+                "memoria_bytes": st.column_config.NumberColumn("Memória", format="bytes"),
+            },
+            height=min(35 * (len(perfil) + 1) + 3, 400)
+        )
+
+
+
+        # --- Seleção de colunas numéricas ---
+        numeric_cols = df.select_dtypes(include=np.number).columns.tolist()
+        if numeric_cols:
+            st.subheader("🔹 Gráficos das colunas numéricas")
+            col_to_plot = st.selectbox("Escolha a coluna para visualizar", numeric_cols)
+
+
+
+            # Histograma
+            st.write(f"📈 Histograma de **{col_to_plot}**")
+            bins = st.selectbox("Número de faixas (bins)", ["Automático", 10, 20, 50, 100, 200])
+            bins = None if bins == "Automático" else bins
+            with etapa("histograma"):
+                st.bar_chart(artefato(
+                    chave, "histograma",
+                    lambda: calcular_histograma(df[col_to_plot], bins),
+                    col_to_plot, bins
+                ))
+
+
+
+            # Boxplot (só o resumo da coluna vai para o navegador)
+            st.write(f"📦 Boxplot de **{col_to_plot}**")
+            violino = st.toggle("Mostrar como violino", key="analise_violino")
+            with etapa("boxplot"):
+                resumo_box = artefato(chave, "boxplot", lambda: estatisticas_boxplot(df[col_to_plot]), col_to_plot)
+            if resumo_box is None:
+                st.info("A coluna não tem valores para o boxplot.")
+            else:
+                st.altair_chart(grafico_boxplot(resumo_box, col_to_plot, violino), width="stretch")
+                st.caption(
+                    f"Mediana {resumo_box['mediana']:.4g} · Q1 {resumo_box['q1']:.4g} · Q3 {resumo_box['q3']:.4g} · "
+                    f"{resumo_box['total_outliers']} outliers"
+                    + (f" ({len(resumo_box['outliers'])} exibidos)" if resumo_box["total_outliers"] > len(resumo_box["outliers"]) else "")
+                    + (" · quartis aproximados por amostragem" if resumo_box["aproximado"] else "")
+                )
+
+
+
+            # Dispersão (scatter) entre duas colunas numéricas
+            st.subheader("📊 Gráfico de Dispersão")
+            col_x = st.selectbox("Escolha o eixo X", numeric_cols, index=0)
+            col_y = st.selectbox("Escolha o eixo Y", numeric_cols, index=1 if len(numeric_cols) > 1 else 0)
+            c1, c2 = st.columns(2)
+            limite_pontos = c1.number_input(
+                "Máximo de pontos no gráfico", min_value=500, max_value=50000, value=LIMITE_PONTOS, step=500
+            )
+            modo_dispersao = c2.radio(
+                "Acima do limite", ["Amostragem estratificada", "Agregação em grade 2D"], horizontal=True
+            )
+            modo_dispersao = MODO_AGREGADO if modo_dispersao == "Agregação em grade 2D" else MODO_AMOSTRA
+            with etapa("dispersão"):
+                dados_dispersao, info_dispersao = artefato(
+                    chave, "dispersao",
+                    lambda: preparar_dispersao(df, col_x, col_y, limite_pontos, modo_dispersao),
+                    col_x, col_y, limite_pontos, modo_dispersao
+                )
+                st.write(f"Scatter plot entre **{col_x}** e **{col_y}**")
+                st.altair_chart(
+                    grafico_dispersao(dados_dispersao, info_dispersao, col_x, col_y),
+                    width="stretch"
+                )
+            if info_dispersao["modo"] == MODO_AGREGADO:
+                st.caption(
+                    f"{info_dispersao['agregados']} pontos agregados em "
+                    f"{info_dispersao['exibidos']} células da grade."
+                )
+            elif info_dispersao["modo"] == MODO_AMOSTRA:
+                st.caption(
+                    f"Exibindo uma amostra de {info_dispersao['exibidos']} de {info_dispersao['total']} pontos "
+                    f"({info_dispersao['agregados']} omitidos)."
+                )
+
+
+
+            # Correlação
+            st.subheader("📌 Matriz de Correlação")
+            modo_corr = st.radio(
+                "Exibir",
+                ["Matriz completa", "Pares mais correlacionados (top-k)"],
+                index=1 if len(numeric_cols) > LIMITE_COLUNAS_MATRIZ else 0,
+                horizontal=True
+            )
+            segundo_plano = len(df) * len(numeric_cols) ** 2 > LIMITE_CORR_SEGUNDO_PLANO
+            if modo_corr == "Matriz completa":
+                with etapa("corr"):
+                    corr = em_segundo_plano(
+                        "Correlação", chave, "corr",
+                        lambda tarefa: matriz_correlacao(df, numeric_cols, progresso=tarefa.avancar),
+                        segundo_plano=segundo_plano
+                    )
+            else:
+                k = st.number_input("Quantidade de pares (k)", min_value=1, max_value=500, value=20)
+                with etapa("corr (top-k)"):
+                    corr = em_segundo_plano(
+                        "Correlação (top-k)", chave, "top_pares",
+                        lambda tarefa: top_pares(df, numeric_cols, k, progresso=tarefa.avancar), k,
+                        segundo_plano=segundo_plano
+                    )
+            if corr is not None:
+                st.dataframe(corr)
+            if artefato(chave, "nulos_numericos", lambda: bool(df[numeric_cols].isna().any().any())):
+                st.caption("Com valores nulos, cada par de colunas usa só as linhas em que as duas têm valor.")
+        else:
+            st.info("Nenhuma coluna numérica encontrada para análise e gráficos.")
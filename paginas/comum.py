@@ -0,0 +1,142 @@
+import streamlit as st
+
+from cache_dados import artefato, cache, disco, guardar_artefato, pegar_artefato, relatorio_ingestao, sessao_atual
+from tarefas import Tarefa, iniciar_tarefa
+
+
+INTERVALO_PROGRESSO = 0.5  # segundos entre atualizações da barra de progresso
+_AUSENTE = object()
+
+
+
+# ------------------------------------------------------------
+# FUNÇÕES COMPARTILHADAS ENTRE AS PÁGINAS
+# ------------------------------------------------------------
+def t(pt, en):
+    return pt if st.session_state.idioma == "PT" else en
+
+
+
+def mostrar_memoria(detalhes=False):
+    """Avisa o que voltou do disco neste rerun e, com `detalhes`, o uso do cache."""
+    sessao = sessao_atual()
+    recarregados = cache.recarregados(sessao)
+    if recarregados:
+        st.toast(t(
+            f"♻️ {len(recarregados)} resultado(s) tinham saído da memória e foram recarregados do disco.",
+            f"♻️ {len(recarregados)} result(s) had been evicted from memory and were reloaded from disk."
+        ))
+    recusados = cache.recusados(sessao)
+    if recusados:
+        mb = 1024 * 1024
+        maior = max(tamanho for _, tamanho in recusados) / mb
+        st.warning(t(
+            f"⚠️ {len(recusados)} resultado(s) (o maior com {maior:.0f} MB) não cabem no cache de "
+            f"{cache.limite_bytes / mb:.0f} MB e são refeitos a cada interação.",
+            f"⚠️ {len(recusados)} result(s) (the largest {maior:.0f} MB) do not fit in the "
+            f"{cache.limite_bytes / mb:.0f} MB cache and are rebuilt on every interaction."
+        ))
+    if detalhes:
+        mb = 1024 * 1024
+        st.sidebar.caption(t(
+            f"🧠 Cache: {cache.uso_sessao(sessao) / mb:.0f} MB desta sessão · "
+            f"{cache.bytes_usados / mb:.0f}/{cache.limite_bytes / mb:.0f} MB no total · "
+            f"{cache.bytes_disco / mb:.0f} MB em disco · {disco.uso_bytes() / mb:.0f} MB no cache persistente",
+            f"🧠 Cache: {cache.uso_sessao(sessao) / mb:.0f} MB for this session · "
+            f"{cache.bytes_usados / mb:.0f}/{cache.limite_bytes / mb:.0f} MB overall · "
+            f"{cache.bytes_disco / mb:.0f} MB on disk · {disco.uso_bytes() / mb:.0f} MB in the persistent cache"
+        ))
+
+
+
+@st.fragment(run_every=INTERVALO_PROGRESSO)
+def _acompanhar(tarefa):
+    # Só este trecho é reexecutado enquanto a tarefa roda; ao terminar, a
+    # página inteira roda de novo e pega o resultado.
+    if tarefa.concluida:
+        st.rerun()
+    st.progress(tarefa.fracao, text=f"⏳ {tarefa.rotulo} · {tarefa.mensagem} ({tarefa.duracao:.0f}s)")
+    if not tarefa.cancelando and st.button(t("✖️ Cancelar", "✖️ Cancel"), key=f"cancelar_{id(tarefa)}"):
+        tarefa.cancelar()
+    if tarefa.cancelando:
+        st.caption(t("Cancelando...", "Cancelling..."))
+
+
+
+def em_segundo_plano(rotulo, hash_dataset, nome, calcular, *params, segundo_plano=True, em_cache=True):
+    """Roda `calcular(tarefa)` em uma thread, com barra de progresso e botão de cancelar.
+
+    A tarefa fica em `st.session_state`, então os reruns seguintes só
+    acompanham o progresso; enquanto ela roda a função devolve None. Pronto,
+    o resultado vai para o cache (como em `artefato`) ou, com
+    `em_cache=False` ou se não couber lá, fica guardado na própria sessão.
+    Um novo pedido com o mesmo `nome` e outros parâmetros cancela o anterior.
+    """
+    chave = (hash_dataset, nome, *params)
+    if em_cache:
+        valor = pegar_artefato(hash_dataset, nome, *params, padrao=_AUSENTE)
+        if valor is not _AUSENTE:
+            return valor
+    if not segundo_plano:
+        tarefa = Tarefa(rotulo, chave)
+        if em_cache:
+            return artefato(hash_dataset, nome, lambda: calcular(tarefa), *params)
+        return calcular(tarefa)
+
+    tarefas = st.session_state.setdefault("_tarefas", {})
+    tarefa = tarefas.get(nome)
+    if tarefa is not None and tarefa.chave != chave:
+        tarefa.cancelar()
+        tarefa = None
+    if tarefa is None:
+        tarefa = iniciar_tarefa(rotulo, calcular, chave)
+        tarefas[nome] = tarefa
+
+    if not tarefa.concluida:
+        _acompanhar(tarefa)
+        return None
+    if tarefa.cancelada:
+        st.warning(t(f"⏹️ {rotulo}: cancelado.", f"⏹️ {rotulo}: cancelled."))
+        if st.button(t("🔁 Recomeçar", "🔁 Start again"), key=f"recomecar_{nome}"):
+            del tarefas[nome]
+            st.rerun()
+        return None
+    if tarefa.erro is not None:
+        st.error(t(f"❌ {rotulo}: {tarefa.erro}", f"❌ {rotulo}: {tarefa.erro}"))
+        if st.button(t("🔁 Tentar de novo", "🔁 Try again"), key=f"recomecar_{nome}"):
+            del tarefas[nome]
+            st.rerun()
+        return None
+    if em_cache:
+        guardar_artefato(hash_dataset, nome, tarefa.resultado, *params)
+        if chave in cache:
+            del tarefas[nome]
+    return tarefa.resultado
+
+
+
+def mostrar_ingestao(chave):
+    relatorio = relatorio_ingestao(chave)
+    if relatorio:
+        mb = 1024 * 1024
+        st.caption(t(
+            f"⚡ Lido com o motor {relatorio['motor']} em {relatorio['tempo_leitura']:.2f}s · "
+            f"memória: {relatorio['memoria_antes'] / mb:.1f} MB → {relatorio['memoria_depois'] / mb:.1f} MB "
+            f"({relatorio['economia'] / mb:.1f} MB economizados)",
+            f"⚡ Read with the {relatorio['motor']} engine in {relatorio['tempo_leitura']:.2f}s · "
+            f"memory: {relatorio['memoria_antes'] / mb:.1f} MB → {relatorio['memoria_depois'] / mb:.1f} MB "
+            f"({relatorio['economia'] / mb:.1f} MB saved)"
+        ))
+        if "tempo_disco" in relatorio:
+            st.caption(t(
+                f"💾 Já visto antes: recarregado do cache em disco em {relatorio['tempo_disco']:.2f}s, sem reler o CSV.",
+                f"💾 Seen before: reloaded from the disk cache in {relatorio['tempo_disco']:.2f}s, without re-reading the CSV."
+            ))
+        if relatorio.get("arquivos"):
+            st.caption(t(
+                f"📚 {relatorio['arquivos']} arquivos combinados em {relatorio['linhas']} linhas.",
+                f"📚 {relatorio['arquivos']} files combined into {relatorio['linhas']} rows."
+            ))
+        if relatorio.get("ajustes"):
+            with st.expander(t("🧩 Ajustes de esquema entre os arquivos", "🧩 Schema adjustments across files")):
+                st.markdown("\n".join(f"- {ajuste}" for ajuste in relatorio["ajustes"]))
@@ -0,0 +1,31 @@
+import streamlit as st
+
+
+
+# ------------------------------------------------------------
+# --- 3. Funções Python ---
+# ------------------------------------------------------------
+def mostrar():
+    st.title("🧠 Funções em Python")
+    st.subheader("Organizando códigos e automatizando tarefas")
+    st.video("https://www.youtube.com/watch?v=9Os0o3wzS_I")
+
+
+
+    st.markdown("""
+Funções são **blocos de código reutilizáveis**.  
+Elas ajudam a deixar o código **mais limpo, rápido e organizado**.
+""")
+
+
+
+    st.code("""
+def saudacao(nome):
+    return f"Olá, {nome}!"
+""", language="python")
+
+
+
+    st.write("""
+Aqui, `def` define a função, `nome` é o parâmetro e `return` devolve o resultado.
+""")
@@ -0,0 +1,43 @@
+import streamlit as st
+
+
+
+# ------------------------------------------------------------
+# --- 0. PÁGINA INICIAL ---
+# ------------------------------------------------------------
+def mostrar():
+    st.markdown("<h1 class='main-title'>🚀 Curso Completo da introdução de Ciência de Dados com Python</h1>", unsafe_allow_html=True)
+    st.markdown("<p class='sub-title'>Do zero à prática — entenda, limpe, analise e visualize dados com Python!</p>", unsafe_allow_html=True)
+
+
+
+    st.markdown("---")
+    st.image("https://media.giphy.com/media/26tn33aiTi1jkl6H6/giphy.gif", width=300)
+
+
+
+    st.header("📖 Sobre o Curso")
+    st.write("""
+Este curso foi desenvolvido para **introduzir você à Ciência de Dados**, combinando **teoria e prática** em um ambiente interativo com Python.
+
+
+
+Você aprenderá:
+- 🧮 Conceitos fundamentais de Ciência de Dados  
+- 🐍 Programação prática em Python  
+- 📊 Limpeza e manipulação de dados com Pandas e Numpy  
+- 💡 Funções e estruturas de dados em Python  
+- ⚡ Interatividade com Streamlit  
+""")
+    st.video("https://youtu.be/cm_tM0m9zcI")
+    
+    st.header("🎯 Objetivo do Curso")
+    st.write("""
+Ao final deste curso, você será capaz de:
+- Compreender os **fundamentos da análise de dados**
+- Criar e limpar **DataFrames**
+- Escrever **funções eficientes**
+- Trabalhar com **listas e estruturas dinâmicas**
+- Construir **projetos interativos com Streamlit**
+""")
+    st.success("✅ Clique no menu lateral para iniciar sua jornada!")
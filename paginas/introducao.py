@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+
+# ------------------------------------------------------------
+# --- 1. Introdução à Ciência de Dados ---
+# ------------------------------------------------------------
+def mostrar():
+    st.title("🧠 Introdução à Ciência de Dados")
+    st.image("https://media.giphy.com/media/3o6ZtaO9BZHcOjmErm/giphy.gif", width=250)
+
+
+
+    st.header("📘 O que é Ciência de Dados?")
+    st.write("""
+A **Ciência de Dados** une **estatística, programação e análise de dados** para gerar insights e apoiar decisões.
+
+
+
+Ela é usada em praticamente todas as áreas: negócios, saúde, finanças, tecnologia, e até esportes!
+""")
+
+
+
+    st.video("https://youtu.be/i6fcwf31htU")
+
+
+
+    st.header("🐍 Primeiros Passos com Python")
+    st.code('print("Olá, mundo da Ciência de Dados!")', language="python")
+
+
+
+    st.write("""
+O comando `print()` serve para **exibir mensagens na tela**.  
+Ele é o primeiro passo de qualquer pessoa aprendendo Python.
+""")
+
+
+
+    st.subheader("Exemplo prático com Numpy")
+    st.code("""
+import numpy as np
+idades = np.array([23, 35, 29])
+media = np.mean(idades)
+print("Média das idades:", media)
+""", language="python")
+
+
+
+    idades = np.array([23, 35, 29])
+    media = np.mean(idades)
+    st.success(f"Média das idades: {media}")
+
+
+
+    st.write("""
+O NumPy é uma biblioteca usada para cálculos matemáticos e estatísticos.  
+Aqui, `np.mean()` calcula a **média** de uma lista de números.
+""")
+
+
+
+    st.header("📦 Trabalhando com pandas (DataFrames)")
+    dados = {"Nome": ["Ana", "Carlos", "Beatriz"], "Idade": [23, 35, 29]}
+    df = pd.DataFrame(dados)
+    st.dataframe(df)
+    st.write("📈 Estatísticas descritivas:")
+    st.dataframe(df.describe())
+
+
+
+    st.write("""
+O Pandas permite criar tabelas chamadas **DataFrames**.  
+Elas são essenciais para manipular, filtrar e analisar dados estruturados.
+""")
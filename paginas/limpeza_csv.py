@@ -0,0 +1,189 @@
+import io
+import tempfile
+
+import pandas as pd
+import streamlit as st
+
+from cache_dados import artefato, chave_conjunto, ler_csvs
+from duplicados import remover_duplicados
+from exportacao import FORMATOS, FORMATOS_CSV, comprimir_arquivo, exportar, mime, nome_arquivo
+from instrumentacao import etapa
+from limpeza import cabecalhos, limpar_csv_em_blocos, normalizar_colunas, preencher_nulos
+from paginas.comum import em_segundo_plano, mostrar_ingestao, t
+from visualizador import mostrar_tabela
+
+
+LIMITE_STREAMING = 200 * 1024 * 1024  # uploads maiores usam a limpeza em blocos
+MAX_GRUPOS_EXIBIDOS = 100
+LIMITE_SEGUNDO_PLANO = 1_000_000      # acima disso (linhas) a limpeza em memória vira tarefa
+
+
+
+def mostrar_duplicados(grupos, removidos, original=None):
+    """Relatório dos grupos de linhas repetidas (maiores primeiro)."""
+    with st.expander(t(f"🔁 Duplicados removidos: {removidos}", f"🔁 Duplicates removed: {removidos}")):
+        if grupos.empty:
+            st.write(t("Nenhuma linha repetida.", "No repeated rows."))
+            return
+        st.write(t(
+            f"{len(grupos)} grupos de linhas repetidas; o maior tem {grupos['ocorrencias'].iloc[0]} linhas.",
+            f"{len(grupos)} groups of repeated rows; the largest has {grupos['ocorrencias'].iloc[0]} rows."
+        ))
+        exibidos = grupos.head(MAX_GRUPOS_EXIBIDOS)
+        if original is not None:
+            # a primeira linha de cada grupo representa o grupo inteiro
+            exemplo = original.iloc[exibidos["primeira_linha"].to_numpy()].reset_index(drop=True)
+            exibidos = pd.concat([exibidos, exemplo], axis=1)
+        st.dataframe(exibidos, hide_index=True)
+
+
+
+# ------------------------------------------------------------
+# --- 2.1 Limpeza de CSV (Profissional) ---
+# ------------------------------------------------------------
+def mostrar():
+    st.title("🧹 Limpeza Profissional de Arquivos CSV")
+    st.write(t(
+        "Envie um CSV bagunçado, limpe automaticamente e baixe o arquivo tratado.",
+        "Upload a messy CSV, clean it automatically and download the processed file."
+    ))
+
+
+
+    files = st.file_uploader(
+        "📂 Upload do CSV",
+        type=["csv"],
+        accept_multiple_files=True,
+        help=t(
+            "Vários arquivos com as mesmas colunas são limpos como um só.",
+            "Several files with the same columns are cleaned as one."
+        )
+    )
+
+
+
+    if files:
+        modo_streaming = st.checkbox(
+            t("⚡ Modo streaming (arquivos grandes)", "⚡ Streaming mode (large files)"),
+            value=sum(file.size for file in files) > LIMITE_STREAMING,
+            help=t(
+                "Lê o CSV em blocos e grava o resultado em um arquivo temporário, sem carregar tudo na memória.",
+                "Reads the CSV in chunks and writes the result to a temporary file, without loading everything in memory."
+            )
+        )
+        _, colunas = cabecalhos(files)
+        subconjunto = st.multiselect(
+            t("🔁 Colunas que identificam duplicados (vazio = todas)", "🔁 Columns that identify duplicates (empty = all)"),
+            colunas
+        )
+
+    if files and modo_streaming:
+        def limpar_em_blocos(tarefa):
+            # Cópias próprias dos uploads, feitas só quando uma tarefa nova
+            # começa: os reruns seguem lendo os cabeçalhos dos originais
+            # enquanto ela roda.
+            copias = [io.BytesIO(file.getvalue()) for file in files]
+            # Arquivo com nome: cada download abre o seu próprio handle (roda
+            # em outra thread, junto com os reruns). Some quando o resultado
+            # sai da sessão.
+            saida = tempfile.NamedTemporaryFile(prefix="databyte_limpo_", suffix=".csv")
+            _, resumo = limpar_csv_em_blocos(
+                copias, subconjunto=subconjunto, destino=saida, progresso=tarefa.avancar
+            )
+            saida.flush()
+            with open(saida.name, "rb") as leitura:
+                resumo["amostra"] = pd.read_csv(leitura, nrows=100)
+            return saida, resumo
+
+        resultado = em_segundo_plano(
+            t("Limpeza em blocos", "Chunked cleaning"), chave_conjunto(files), "limpeza_blocos",
+            limpar_em_blocos, *subconjunto, em_cache=False
+        )
+        if resultado is None:
+            return
+        saida, resumo = resultado
+
+
+
+        st.success("✅ Limpeza concluída com sucesso!")
+        st.write(t(
+            f"Linhas lidas: {resumo['linhas_lidas']} · gravadas: {resumo['linhas_gravadas']} · "
+            f"duplicados removidos: {resumo['duplicados_removidos']} · nulos preenchidos: {resumo['nulos_preenchidos']}",
+            f"Rows read: {resumo['linhas_lidas']} · written: {resumo['linhas_gravadas']} · "
+            f"duplicates removed: {resumo['duplicados_removidos']} · nulls filled: {resumo['nulos_preenchidos']}"
+        ))
+        mostrar_duplicados(resumo["grupos_duplicados"], resumo["duplicados_removidos"])
+        st.subheader("📊 Dados Tratados")
+        st.dataframe(resumo["amostra"])
+        st.write(t("📈 Estatísticas (calculadas durante a leitura):", "📈 Statistics (computed while reading):"))
+        st.dataframe(resumo["estatisticas"])
+
+
+
+        formato = st.selectbox(t("Formato do arquivo", "File format"), FORMATOS_CSV, index=1)
+        st.download_button(
+            "📥 Baixar CSV Tratado",
+            data=lambda: comprimir_arquivo(saida.name, formato),
+            file_name=nome_arquivo("dados_tratados", formato),
+            mime=mime(formato)
+        )
+
+    elif files:
+        with etapa("leitura do CSV (read_csv)"):
+            chave, df = ler_csvs(files)
+        mostrar_ingestao(chave)
+        st.subheader("📄 Dados Originais")
+        mostrar_tabela(df, "limpeza_original", chave)
+
+
+
+        st.subheader("⚙️ Processo de Limpeza")
+
+        preenchendo = t("preenchendo nulos", "filling nulls")  # a tarefa não enxerga o session_state
+
+        def limpar(tarefa):
+            # Padronizar colunas (sem copiar os dados)
+            df_limpo = df.set_axis(normalizar_colunas(df.columns), axis=1)
+
+
+
+            # Remover duplicados (hash das linhas, em blocos)
+            with etapa("drop_duplicates"):
+                df_limpo, grupos = remover_duplicados(
+                    df_limpo, subconjunto, progresso=lambda fracao, mensagem: tarefa.avancar(0.8 * fracao, mensagem)
+                )
+
+
+
+            # Tratar valores nulos (médias das numéricas, "Desconhecido" nas demais)
+            tarefa.avancar(0.8, preenchendo)
+            with etapa("fillna"):
+                df_limpo, _ = preencher_nulos(df_limpo)
+            return df_limpo, grupos
+
+        resultado = em_segundo_plano(
+            t("Limpeza", "Cleaning"), chave, "limpo", limpar, *subconjunto,
+            segundo_plano=len(df) > LIMITE_SEGUNDO_PLANO
+        )
+        if resultado is None:
+            return
+        df_limpo, grupos = resultado
+        chave_limpo = ":".join([chave, "limpo", *subconjunto])
+
+
+
+        st.success("✅ Limpeza concluída com sucesso!")
+        mostrar_duplicados(grupos, len(df) - len(df_limpo), df)
+        st.subheader("📊 Dados Tratados")
+        mostrar_tabela(df_limpo, "limpeza_tratados", chave_limpo)
+
+
+
+        # O arquivo só é gerado quando o botão é clicado (em outra thread)
+        formato = st.selectbox(t("Formato do arquivo", "File format"), list(FORMATOS))
+        st.download_button(
+            "📥 Baixar CSV Tratado",
+            data=lambda: artefato(chave_limpo, "exportacao", lambda: exportar(df_limpo, formato), formato),
+            file_name=nome_arquivo("dados_tratados", formato),
+            mime=mime(formato)
+        )
@@ -0,0 +1,29 @@
+import streamlit as st
+
+
+
+# ------------------------------------------------------------
+# --- 2. Limpeza de Dados ---
+# ------------------------------------------------------------
+def mostrar():
+    st.title("📊 Limpeza de Dados")
+    st.subheader("Preparando e organizando dados sujos para análise")
+    st.image("https://media.giphy.com/media/26tn33aiTi1jkl6H6/giphy.gif", width=200)
+
+
+
+    st.write("""
+Antes de analisar dados, é essencial **limpá-los e estruturá-los** corretamente.
+Este processo é chamado de **data cleaning**.
+""")
+    st.video("https://youtu.be/WQ5rsl8y_dw")
+
+
+
+    st.write("""
+O Pandas facilita essa etapa, permitindo:
+- Verificar valores ausentes (`df.isnull()`)
+- Remover linhas com `df.dropna()`
+- Preencher dados vazios com `df.fillna()`
+- Padronizar tipos de dados e nomes de colunas
+""")
@@ -0,0 +1,32 @@
+import streamlit as st
+
+
+
+# ------------------------------------------------------------
+# --- 4. Operações com Listas ---
+# ------------------------------------------------------------
+def mostrar():
+    st.title("📂 Operações com Listas")
+    st.video("https://www.youtube.com/watch?v=ohCDWZgNIU0")
+
+
+
+    st.markdown("""
+Listas armazenam **múltiplos valores em uma única variável**.
+""")
+
+
+
+    st.code("""
+lista = [1, 2, 3, 4, 5]
+soma = sum(lista)
+media = soma / len(lista)
+print(f"Soma: {soma}, Média: {media}")
+""", language="python")
+
+
+
+    st.write("""
+Com `sum()` somamos os valores, e com `len()` contamos os itens da lista.  
+A média é a soma dividida pela quantidade de elementos.
+""")
@@ -0,0 +1,302 @@
+import io
+import tempfile
+
+import pandas as pd
+import streamlit as st
+
+from cache_dados import artefato, hash_conteudo, ler_csv
+from estatisticas import resumir
+from executor_codigo import executar_codigo
+from exportacao import FORMATOS_CSV, comprimir_arquivo, mime, nome_arquivo
+from gerador import DISTRIBUICOES, DISTRIBUICOES_PADRAO, OPCOES_LINHAS, gerar_dados
+from instrumentacao import etapa
+from limpeza import LIMITE_SPOOL
+from paginas.comum import em_segundo_plano, mostrar_ingestao
+from reducao_serie import LIMITE_PONTOS_LINHA, METODO_LTTB, METODO_MIN_MAX, reduzir_para_grafico
+from regressao import ajustar, ajustar_em_blocos, prever, prever_em_blocos
+from visualizador import mostrar_tabela
+
+
+# uploads maiores são ajustados em blocos (o limite de upload, em
+# .streamlit/config.toml, precisa ficar acima disso)
+LIMITE_REGRESSAO_BLOCOS = 200 * 1024 * 1024
+
+
+
+def previsoes_csv(arquivo, modelo, formato):
+    """CSV (comprimido conforme `formato`) com as previsões do modelo para cada linha do arquivo."""
+    with tempfile.SpooledTemporaryFile(max_size=LIMITE_SPOOL, mode="w+b") as saida:
+        prever_em_blocos(arquivo, modelo, saida)
+        return comprimir_arquivo(saida, formato)
+
+
+
+def simulador_com_dados():
+    """Ajusta `y = a1*x1 + ... + b` às colunas de um CSV enviado e baixa as previsões."""
+    arquivo = st.file_uploader("Envie um CSV para ajustar a regressão", type=["csv"], key="regressao_upload")
+    if arquivo is None:
+        return
+    em_blocos = st.checkbox(
+        "⚡ Ajuste em blocos (arquivos grandes)",
+        value=arquivo.size > LIMITE_REGRESSAO_BLOCOS,
+        help="Lê o CSV aos pedaços e acumula só as somas da regressão, sem carregar o arquivo na memória."
+    )
+    if em_blocos:
+        arquivo.seek(0)
+        amostra = pd.read_csv(arquivo, nrows=1000)
+        arquivo.seek(0)
+        chave = hash_conteudo(arquivo)
+    else:
+        with etapa("leitura do CSV (read_csv)"):
+            chave, df = ler_csv(arquivo)
+        mostrar_ingestao(chave)
+        amostra = df.head(1000)
+    numericas = amostra.select_dtypes("number").columns.tolist()
+    if len(numericas) < 2:
+        st.warning("⚠️ O arquivo precisa de pelo menos duas colunas numéricas.")
+        return
+
+    coluna_y = st.selectbox("Coluna a prever (y):", numericas, index=len(numericas) - 1)
+    colunas_x = st.multiselect(
+        "Colunas explicativas (x):", [col for col in numericas if col != coluna_y],
+        default=[col for col in numericas if col != coluna_y][:1]
+    )
+    if not colunas_x:
+        return
+
+    try:
+        if em_blocos:
+            def ajustar_tarefa(tarefa):
+                # a tarefa lê a própria cópia, feita só quando ela começa
+                copia = io.BytesIO(arquivo.getvalue())
+                return ajustar_em_blocos(copia, colunas_x, coluna_y, progresso=tarefa.avancar)
+
+            modelo = em_segundo_plano(
+                "Ajuste em blocos", chave, "regressao_blocos", ajustar_tarefa, coluna_y, *colunas_x
+            )
+            if modelo is None:
+                return
+        else:
+            with etapa("regressão (lstsq)"):
+                modelo = artefato(chave, "regressao", lambda: ajustar(df, colunas_x, coluna_y), coluna_y, *colunas_x)
+    except ValueError as erro:
+        st.error(f"❌ {erro}")
+        return
+
+    termos = " + ".join(f"{modelo['coeficientes'][col]:.4g}·{col}" for col in colunas_x)
+    st.success(f"📈 **{coluna_y} = {termos} + {modelo['intercepto']:.4g}**")
+    c1, c2, c3 = st.columns(3)
+    c1.metric("R²", f"{modelo['r2']:.4f}")
+    c2.metric("RMSE", f"{modelo['rmse']:.4g}")
+    c3.metric("Linhas usadas", f"{modelo['n']:,}".replace(",", "."))
+
+    valores = [st.number_input(f"Valor de {col}:", value=float(amostra[col].mean()), key=f"regressao_x_{col}")
+               for col in colunas_x]
+    st.write(f"🔮 Previsão de {coluna_y}: **{float(prever(modelo, [valores])[0]):.4g}**")
+
+    formato = st.selectbox("Formato das previsões", FORMATOS_CSV, index=1, key="regressao_formato")
+    st.download_button(
+        "📥 Baixar previsões de todas as linhas",
+        # roda em outra thread, junto com os reruns: lê a própria cópia do upload
+        data=lambda: previsoes_csv(io.BytesIO(arquivo.getvalue()), modelo, formato),
+        file_name=nome_arquivo("previsoes", formato),
+        mime=mime(formato)
+    )
+
+
+
+# ------------------------------------------------------------
+# --- 5. Módulo Avançado Interativo ---
+# ------------------------------------------------------------
+def mostrar():
+    st.title("⚡ Módulo Avançado Interativo")
+    st.subheader("Coloque a mão na massa! Aqui você vai testar, calcular e analisar dados em tempo real!")
+
+
+
+    st.image("https://media.giphy.com/media/3o7aCTfyhYawdOXcFW/giphy.gif", width=250)
+
+
+
+    # Saudação
+    nome = st.text_input("Digite seu nome:")
+    if nome:
+        st.success(f"Olá, {nome}! 👋 Vamos testar um pouco de Python ao vivo!")
+
+
+
+    # 1️⃣ Calculadora de potência
+    st.markdown("---")
+    st.header("🧮 Calculadora de Potência")
+    numero = st.number_input("Digite um número (pode ser decimal):", value=2.0, step=0.1)
+    expoente = st.number_input("Digite o expoente:", value=2.0, step=0.1)
+    resultado = numero ** expoente
+    st.success(f"🔹 Resultado: {numero} elevado a {expoente} = **{resultado}**")
+
+
+
+    st.info("""
+**Teoria:**  
+Este exercício mostra como Python pode realizar **operações matemáticas** usando variáveis.  
+A expressão `numero ** expoente` significa “número elevado ao expoente”.
+""")
+
+
+
+    # 2️⃣ Calculadora personalizada
+    st.markdown("---")
+    st.header("🧠 Mini Calculadora Inteligente")
+    a = st.number_input("Valor A:", value=0.0, step=0.1)
+    b = st.number_input("Valor B:", value=0.0, step=0.1)
+    operacao = st.selectbox("Escolha uma operação:", ["Soma", "Subtração", "Multiplicação", "Divisão"])
+    if st.button("Calcular"):
+        if operacao == "Soma":
+            st.success(f"✅ Resultado: {a + b}")
+        elif operacao == "Subtração":
+            st.success(f"✅ Resultado: {a - b}")
+        elif operacao == "Multiplicação":
+            st.success(f"✅ Resultado: {a * b}")
+        elif operacao == "Divisão":
+            st.success(f"✅ Resultado: {a / b if b != 0 else 'Erro: divisão por zero!'}")
+
+
+
+    st.info("""
+**Teoria:**  
+Aqui, você usa **condicionais (if/elif)** para decidir qual operação executar.  
+É o mesmo raciocínio usado em modelos de decisão em Ciência de Dados.
+""")
+
+
+
+    # 3️⃣ Gerador de dados
+    st.markdown("---")
+    st.header("📊 Gerador de Dados Aleatórios")
+    c1, c2 = st.columns(2)
+    semente = c1.number_input("Semente (mesma semente, mesmos dados):", min_value=0, value=42, step=1)
+    linhas = c2.select_slider("Número de linhas:", OPCOES_LINHAS, value=100)
+    distribuicoes = st.multiselect("Distribuições (uma coluna cada):", list(DISTRIBUICOES), DISTRIBUICOES_PADRAO)
+    if distribuicoes:
+        # hash_dataset fixo: os dados gerados ficam no cache por (semente, linhas, distribuições)
+        with etapa("geração dos dados"):
+            df = artefato("gerador", "dados", lambda: gerar_dados(semente, linhas, distribuicoes),
+                          semente, linhas, *distribuicoes)
+        mostrar_tabela(df, "gerador", f"gerador:{semente}:{linhas}:{':'.join(distribuicoes)}", tamanho_pagina=10)
+
+        metodo = METODO_LTTB
+        if linhas > LIMITE_PONTOS_LINHA:
+            metodo = st.radio(
+                "Redução para o gráfico:", [METODO_LTTB, METODO_MIN_MAX], horizontal=True,
+                format_func=lambda m: "LTTB (forma da série)" if m == METODO_LTTB else "Mín/máx por faixa (picos)"
+            )
+        with etapa("redução do gráfico"):
+            grafico = artefato(
+                "gerador", "grafico", lambda: reduzir_para_grafico(df, metodo=metodo),
+                semente, linhas, metodo, *distribuicoes
+            )
+        st.line_chart(grafico)
+        if len(grafico) < linhas:
+            st.caption(f"Gráfico com {len(grafico)} de {linhas} pontos ({'LTTB' if metodo == METODO_LTTB else 'mín/máx'}).")
+
+
+
+    st.info("""
+**Teoria:**  
+Aqui, o NumPy gera **valores aleatórios** simulando dados reais, com um gerador próprio (`np.random.default_rng(semente)`): a mesma semente sempre gera os mesmos dados.  
+Esses valores são organizados em um **DataFrame**, e depois visualizados em um gráfico de linha.
+""")
+
+
+
+    # 4️⃣ Download e upload de CSV
+    st.markdown("---")
+    st.header("📥 Baixe o arquivo CSV de exemplo e faça upload")
+    csv_content = """Nome,Idade,Nota,Presenca
+Ana,22,8.5,Sim
+Bruno,25,7.8,Sim
+Carla,23,9.2,Não
+Diego,21,,Sim
+Elisa,24,6.9,Não
+Felipe,22,8.0,Sim
+Gabriela,26,7.5,Sim
+Henrique,20,5.8,Não
+Isabela,23,,Sim
+João,25,9.5,Sim
+"""
+    st.download_button("📩 Baixar arquivo DADOS_ALUNOS.csv", data=csv_content, file_name="DADOS_ALUNOS.csv", mime="text/csv")
+
+
+
+    uploaded_file = st.file_uploader("Envie seu arquivo CSV", type=["csv"])
+    if uploaded_file is not None:
+        with etapa("leitura do CSV (read_csv)"):
+            chave, df_user = ler_csv(uploaded_file)
+        mostrar_ingestao(chave)
+        st.write("📄 Visualização inicial:")
+        mostrar_tabela(df_user, "modulo_upload", chave, tamanho_pagina=10)
+        st.write("📊 Estatísticas:")
+        with etapa("describe"):
+            st.dataframe(artefato(chave, "resumo", lambda: resumir(df_user)))
+
+
+
+    st.info("""
+**Teoria:**  
+O CSV é um formato amplamente usado para armazenar dados.  
+Com `pandas.read_csv()`, você lê o arquivo e pode analisá-lo diretamente com Python.
+""")
+
+
+
+    # 5️⃣ Simulador de previsão simples
+    st.markdown("---")
+    st.header("🤖 Simulador de Previsão Linear")
+    x = st.number_input("Digite o valor de X:", value=5.0)
+    coef = st.slider("Coeficiente (a):", 0.0, 10.0, 2.0)
+    intercepto = st.slider("Intercepto (b):", 0.0, 10.0, 1.0)
+    previsao = coef * x + intercepto
+    st.success(f"🔮 Previsão: **y = {coef}x + {intercepto} → y = {previsao:.2f}**")
+
+
+
+    st.subheader("📂 Regressão com os seus dados")
+    simulador_com_dados()
+
+
+
+    st.info("""
+**Teoria:**  
+Esta é a base de um **modelo de regressão linear simples**, usado para prever valores.  
+A equação `y = ax + b` mostra como uma variável (x) afeta outra (y).  
+Com os seus dados, `a` e `b` (ou um coeficiente por coluna, na regressão múltipla) saem dos **mínimos quadrados**: os valores que tornam menor a soma dos erros ao quadrado, calculados com `np.linalg.lstsq`.  
+Para arquivos grandes basta acumular, bloco a bloco, as somas `XᵀX` e `Xᵀy`, e resolver o sistema no fim, sem carregar o arquivo inteiro.
+""")
+
+
+
+    # 6️⃣ Código livre
+    st.markdown("---")
+    st.header("💬 Execute seu próprio código Python")
+    codigo = st.text_area("Digite seu código Python abaixo:", "print('Olá, Ciência de Dados!')")
+    if st.button("Executar código"):
+        with st.spinner("Executando..."):
+            resultado = executar_codigo(codigo)
+        if resultado["saida"]:
+            st.code(resultado["saida"], language="text")
+        if resultado["erro"]:
+            st.error(f"❌ Erro ao executar o código: {resultado['erro']}")
+        else:
+            st.caption(f"⏱️ Executado em {resultado['tempo']:.2f}s")
+
+
+
+    st.info("""
+**Teoria:**  
+Com o comando `exec()`, você pode **executar qualquer código Python** dinamicamente.  
+Isso permite testar ideias e algoritmos rapidamente.  
+Aqui o código roda em um processo separado (com `pd`, `np` e `math` já importados), com limites de tempo e memória, e o que você imprimir com `print()` aparece logo acima.
+""")
+
+
+
+    st.success("🎉 Parabéns! Você concluiu o módulo interativo!")
@@ -0,0 +1,181 @@
+import pandas as pd
+import streamlit as st
+
+from resultados_quiz import ESPERA_GRAVACAO, resultados
+
+
+
+# ------------------------------------------------------------
+# BANCO DE PERGUNTAS
+# ------------------------------------------------------------
+# id (estável: é o que vai para o banco de resultados), enunciado, opções e
+# a opção correta. Para incluir uma pergunta basta acrescentar um item.
+PERGUNTAS = [
+    {
+        "id": "ciencia_dados",
+        "enunciado": "O que é Ciência de Dados?",
+        "opcoes": [
+            "Apenas criar gráficos",
+            "A união de estatística, programação e análise de dados",
+            "Somente mexer em planilhas",
+        ],
+        "correta": "A união de estatística, programação e análise de dados",
+    },
+    {
+        "id": "biblioteca_dataframes",
+        "enunciado": "Qual biblioteca é usada para DataFrames?",
+        "opcoes": ["NumPy", "Pandas", "Math"],
+        "correta": "Pandas",
+    },
+    {
+        "id": "funcao_print",
+        "enunciado": "O que faz a função print()?",
+        "opcoes": ["Mostra mensagens na tela", "Apaga dados", "Fecha o programa"],
+        "correta": "Mostra mensagens na tela",
+    },
+    {
+        "id": "remover_nulos",
+        "enunciado": "Qual comando remove valores nulos?",
+        "opcoes": ["df.remove()", "df.dropna()", "df.fillna()"],
+        "correta": "df.dropna()",
+    },
+    {
+        "id": "definir_funcao",
+        "enunciado": "Qual palavra define uma função?",
+        "opcoes": ["lambda", "def", "func"],
+        "correta": "def",
+    },
+    {
+        "id": "operador_potencia",
+        "enunciado": "O que significa o operador ** em Python?",
+        "opcoes": ["Multiplicação simples", "Potência (elevação a um número)", "Divisão inteira"],
+        "correta": "Potência (elevação a um número)",
+    },
+    {
+        "id": "describe",
+        "enunciado": "O que faz o comando df.describe()?",
+        "opcoes": ["Apaga colunas do DataFrame", "Mostra estatísticas descritivas", "Adiciona novas linhas"],
+        "correta": "Mostra estatísticas descritivas",
+    },
+    {
+        "id": "nao_biblioteca",
+        "enunciado": "Qual dessas opções NÃO é uma biblioteca de dados em Python?",
+        "opcoes": ["Pandas", "NumPy", "HTML"],
+        "correta": "HTML",
+    },
+    {
+        "id": "importar",
+        "enunciado": "Qual comando é usado para importar bibliotecas em Python?",
+        "opcoes": ["load", "import", "include"],
+        "correta": "import",
+    },
+    {
+        "id": "dataframe",
+        "enunciado": "O que é um DataFrame?",
+        "opcoes": [
+            "Um tipo de gráfico de barras",
+            "Uma tabela de dados bidimensional do Pandas",
+            "Uma função do NumPy",
+        ],
+        "correta": "Uma tabela de dados bidimensional do Pandas",
+    },
+]
+NUMEROS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+ENUNCIADOS = {pergunta["id"]: pergunta["enunciado"] for pergunta in PERGUNTAS}
+
+
+
+def rotulo(n, pergunta):
+    numero = NUMEROS[n] if n < len(NUMEROS) else f"{n + 1}."
+    return f"{numero} {pergunta['enunciado']}"
+
+
+
+def corrigir(respostas):
+    """`{id: acertou?}` para as respostas `{id: opção escolhida}` (em branco conta como erro)."""
+    return {pergunta["id"]: respostas.get(pergunta["id"]) == pergunta["correta"] for pergunta in PERGUNTAS}
+
+
+
+def mostrar_resultado(acertos):
+    pontuacao, total = sum(acertos.values()), len(acertos)
+    st.success(f"🎯 Sua pontuação final: **{pontuacao}/{total}**")
+    if pontuacao == total:
+        st.balloons()
+        st.success("🏆 Excelente! Você dominou o conteúdo!")
+    elif pontuacao >= 0.7 * total:
+        st.info("💪 Bom trabalho! Reveja alguns conceitos para aperfeiçoar.")
+    else:
+        st.warning("📘 Continue estudando! Volte aos módulos e pratique mais.")
+
+    erros = [rotulo(n, pergunta) for n, pergunta in enumerate(PERGUNTAS) if not acertos[pergunta["id"]]]
+    if erros:
+        st.error("❌ Você errou as seguintes perguntas:")
+        for e in erros:
+            st.write(f"• {e}")
+    else:
+        st.success("🎉 Você acertou todas as perguntas!")
+
+
+
+def mostrar_estatisticas(turma):
+    banco = resultados()
+    turmas = banco.turmas()
+    if not turmas:
+        return
+
+    st.subheader("🏅 Ranking da turma")
+    turma = st.selectbox("Turma", turmas, index=turmas.index(turma) if turma in turmas else 0)
+    ranking = pd.DataFrame(banco.ranking(turma), columns=["Aluno", "Melhor pontuação", "Tentativas"])
+    ranking.index = range(1, len(ranking) + 1)
+    st.dataframe(ranking)
+
+    with st.expander("📉 Taxa de erro por pergunta (todas as turmas)"):
+        taxas = pd.DataFrame(banco.taxas_de_erro(), columns=["id", "Respostas", "Erros", "Taxa de erro"])
+        taxas.insert(0, "Pergunta", taxas["id"].map(ENUNCIADOS).fillna(taxas["id"]))
+        st.dataframe(
+            taxas.drop(columns="id"),
+            hide_index=True,
+            column_config={"Taxa de erro": st.column_config.ProgressColumn(min_value=0, max_value=1, format="percent")}
+        )
+
+
+
+# ------------------------------------------------------------
+# --- 7. Quiz ---
+# ------------------------------------------------------------
+def mostrar():
+    st.title("❓ Quiz - Ciência de Dados com Python")
+    st.subheader("Teste seus conhecimentos adquiridos no curso!")
+
+
+
+    # Tudo dentro de um formulário: marcar opções não roda o script de novo,
+    # só o envio (uma correção por tentativa).
+    with st.form("quiz"):
+        c1, c2 = st.columns(2)
+        aluno = c1.text_input("Seu nome")
+        turma = c2.text_input("Turma")
+        respostas = {
+            pergunta["id"]: st.radio(rotulo(n, pergunta), pergunta["opcoes"], index=None, key=f"quiz_{pergunta['id']}")
+            for n, pergunta in enumerate(PERGUNTAS)
+        }
+        enviado = st.form_submit_button("Ver resultado")
+
+
+
+    if enviado:
+        acertos = corrigir(respostas)
+        mostrar_resultado(acertos)
+        aluno, turma = aluno.strip(), turma.strip()
+        if aluno and turma:
+            # a gravação é em lote, em outra thread; espera só para o
+            # ranking abaixo já incluir esta tentativa
+            resultados().registrar(aluno, turma, acertos).wait(ESPERA_GRAVACAO)
+            st.session_state.quiz_turma = turma
+        else:
+            st.info("Preencha nome e turma para guardar sua pontuação no ranking.")
+
+
+
+    mostrar_estatisticas(st.session_state.get("quiz_turma"))
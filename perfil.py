@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+
+
+# ------------------------------------------------------------
+# PERFIL DAS COLUNAS (TIPO, NULOS, CARDINALIDADE E MEMÓRIA)
+# ------------------------------------------------------------
+LIMITE_CARDINALIDADE_EXATA = 100_000  # acima disso (valores não nulos) usa HyperLogLog
+PRECISAO_HLL = 14                     # 2^14 registradores: erro padrão de ~0,8%
+MAX_ELEMENTOS_BLOCO = 10_000_000      # numéricas ordenadas juntas, em blocos de colunas
+_UM = np.uint64(1)
+
+
+
+def _misturar(x):
+    # finalizador do splitmix64: hash de 64 bits barato para valores numéricos
+    x = x.astype(np.uint64, copy=True)
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return x
+
+
+
+def hashes_coluna(serie):
+    """Hash uint64 de cada valor não nulo (valores iguais, hashes iguais)."""
+    serie = serie.dropna()
+    tipo = serie.dtype
+    if pd.api.types.is_bool_dtype(tipo) or pd.api.types.is_integer_dtype(tipo):
+        return _misturar(serie.to_numpy(dtype=np.int64).view(np.uint64))
+    if pd.api.types.is_float_dtype(tipo):
+        # + 0.0 junta -0.0 e 0.0 antes de olhar os bits
+        return _misturar((serie.to_numpy(dtype=np.float64) + 0.0).view(np.uint64))
+    if pd.api.types.is_datetime64_any_dtype(tipo) or pd.api.types.is_timedelta64_dtype(tipo):
+        return _misturar(serie.to_numpy().view(np.int64).view(np.uint64))
+    # texto e objetos: categorize=False evita fatorar a coluna (o que já seria a contagem exata)
+    return pd.util.hash_array(serie.to_numpy(dtype=object), categorize=False)
+
+
+
+def hyperloglog(hashes, precisao=PRECISAO_HLL):
+    """Estimativa do número de valores distintos a partir de hashes uint64."""
+    m = 1 << precisao
+    resto = 64 - precisao
+    registro = (hashes >> np.uint64(resto)).astype(np.int64)
+    sufixo = hashes & ((_UM << np.uint64(resto)) - _UM)
+    # com resto <= 53 bits a conversão para float é exata: o expoente do
+    # frexp é o número de bits significativos
+    posicao = resto - np.frexp(sufixo.astype(np.float64))[1] + 1  # zeros à esquerda + 1
+    # máximo por registrador sem ufunc.at: marca os pares (registrador, posição)
+    # presentes e pega a maior posição marcada de cada registrador
+    presentes = np.bincount(registro * 64 + posicao, minlength=m * 64).reshape(m, 64) > 0
+    registradores = np.where(presentes.any(axis=1), 63 - np.argmax(presentes[:, ::-1], axis=1), 0)
+
+    alfa = 0.7213 / (1 + 1.079 / m)
+    estimativa = alfa * m * m / np.sum(np.exp2(-registradores.astype(np.float64)))
+    vazios = int(np.count_nonzero(registradores == 0))
+    if estimativa <= 2.5 * m and vazios:
+        estimativa = m * np.log(m / vazios)  # contagem linear para cardinalidades pequenas
+    return int(round(estimativa))
+
+
+
+def _distintos_numericos(df, colunas):
+    # Ordena várias colunas de uma vez (uma matriz por bloco) e conta as
+    # mudanças de valor; os NaN vão para o fim e ficam de fora.
+    por_bloco = max(MAX_ELEMENTOS_BLOCO // max(len(df), 1), 1)
+    distintos = {}
+    for inicio in range(0, len(colunas), por_bloco):
+        grupo = colunas[inicio:inicio + por_bloco]
+        valores = np.sort(df[grupo].to_numpy(dtype=np.float64, na_value=np.nan), axis=0)
+        validos = np.count_nonzero(~np.isnan(valores), axis=0)
+        mudancas = np.diff(valores, axis=0) != 0
+        linhas = np.arange(1, len(valores))[:, None]
+        mudancas &= linhas < validos  # só entre valores não nulos
+        contagem = np.where(validos > 0, mudancas.sum(axis=0) + 1, 0)
+        distintos.update(zip(grupo, contagem.tolist()))
+    return distintos
+
+
+
+def _distintos(serie, nao_nulos):
+    """`(distintos, aproximado)` de uma coluna."""
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        codigos = serie.cat.codes.to_numpy()
+        return int(np.count_nonzero(np.bincount(codigos[codigos >= 0], minlength=1))), False
+    if nao_nulos <= LIMITE_CARDINALIDADE_EXATA or pd.api.types.is_bool_dtype(serie.dtype):
+        return int(serie.nunique(dropna=True)), False
+    return hyperloglog(hashes_coluna(serie)), True
+
+
+
+def perfil_colunas(df):
+    """Uma linha por coluna: tipo, não nulos, nulos, % nulos, distintos e memória.
+
+    Contagens e memória saem de chamadas vetorizadas sobre o DataFrame todo;
+    a cardinalidade é exata (numéricas pequenas ordenadas em bloco) ou, em
+    colunas com mais de `LIMITE_CARDINALIDADE_EXATA` valores, estimada com
+    HyperLogLog (`distintos_aproximado`).
+    """
+    linhas = len(df)
+    nao_nulos = df.count()
+    memoria = df.memory_usage(deep=True, index=False)
+
+    numericas_pequenas = []
+    if linhas <= LIMITE_CARDINALIDADE_EXATA:
+        numericas_pequenas = [
+            col for col, tipo in df.dtypes.items()
+            if pd.api.types.is_numeric_dtype(tipo) and not pd.api.types.is_bool_dtype(tipo)
+            and not isinstance(tipo, pd.CategoricalDtype)
+        ]
+    distintos = _distintos_numericos(df, numericas_pequenas) if numericas_pequenas else {}
+    aproximados = dict.fromkeys(distintos, False)
+    for col in df.columns:
+        if col not in distintos:
+            distintos[col], aproximados[col] = _distintos(df[col], int(nao_nulos[col]))
+
+    return pd.DataFrame({
+        "tipo": df.dtypes.astype(str),
+        "nao_nulos": nao_nulos.astype(np.int64),
+        "nulos": (linhas - nao_nulos).astype(np.int64),
+        "pct_nulos": (linhas - nao_nulos) / linhas if linhas else 0.0,
+        "distintos": pd.Series(distintos, dtype=np.int64),
+        "distintos_aproximado": pd.Series(aproximados, dtype=bool),
+        "memoria_bytes": memoria.astype(np.int64),
+    }, index=df.columns)
@@ -0,0 +1,87 @@
+import numpy as np
+
+
+
+# ------------------------------------------------------------
+# REDUÇÃO DE SÉRIES PARA GRÁFICOS DE LINHA (LTTB E MÍN/MÁX)
+# ------------------------------------------------------------
+LIMITE_PONTOS_LINHA = 2000  # pontos por coluna enviados ao gráfico
+METODO_LTTB = "lttb"
+METODO_MIN_MAX = "min_max"
+
+
+
+def indices_min_max(y, limite=LIMITE_PONTOS_LINHA):
+    """Posições do mínimo e do máximo de cada faixa (~`limite` pontos no total).
+
+    Preserva os picos e vales (o "envelope" da série) e é todo vetorizado.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = y.size
+    faixas = max(limite // 2, 1)
+    if n <= limite:
+        return np.arange(n)
+    tamanho = -(-n // faixas)
+    faixas = -(-n // tamanho)  # sem faixa vazia no fim
+    sobra = faixas * tamanho - n
+    valores = np.concatenate([y, np.full(sobra, np.nan)]).reshape(faixas, tamanho)
+    vazios = np.isnan(valores)  # nulos e o preenchimento não viram pico nem vale
+    base = np.arange(faixas) * tamanho
+    minimos = base + np.argmin(np.where(vazios, np.inf, valores), axis=1)
+    maximos = base + np.argmax(np.where(vazios, -np.inf, valores), axis=1)
+    return np.unique(np.concatenate([[0, n - 1], minimos, maximos]))
+
+
+
+def indices_lttb(y, limite=LIMITE_PONTOS_LINHA):
+    """Largest-Triangle-Three-Buckets: `limite` posições que mantêm a forma da série.
+
+    Em cada faixa fica o ponto que forma o maior triângulo com o escolhido na
+    faixa anterior e a média da próxima. O laço é por faixa (não por ponto),
+    então o custo cresce com `limite` e só linearmente com o tamanho.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = y.size
+    if n <= limite or limite < 3:
+        return np.arange(n)
+    y = np.where(np.isnan(y), np.nanmean(y) if np.isfinite(y).any() else 0.0, y)
+
+    bordas = np.linspace(1, n - 1, limite - 1).astype(np.int64)
+    somas = np.add.reduceat(y[1:n - 1], bordas[:-1] - 1)
+    medias_y = somas / np.diff(bordas)
+    medias_x = (bordas[:-1] + bordas[1:] - 1) / 2
+
+    escolhidos = np.empty(limite, dtype=np.int64)
+    escolhidos[0], escolhidos[-1] = 0, n - 1
+    anterior = 0
+    for f in range(limite - 2):
+        inicio, fim = bordas[f], bordas[f + 1]
+        if f + 1 < limite - 2:
+            proximo_x, proximo_y = medias_x[f + 1], medias_y[f + 1]
+        else:
+            proximo_x, proximo_y = n - 1, y[n - 1]
+        xs = np.arange(inicio, fim)
+        areas = np.abs(
+            (anterior - proximo_x) * (y[inicio:fim] - y[anterior])
+            - (anterior - xs) * (proximo_y - y[anterior])
+        )
+        anterior = inicio + int(np.argmax(areas))
+        escolhidos[f + 1] = anterior
+    return escolhidos
+
+
+
+def reduzir_para_grafico(df, limite=LIMITE_PONTOS_LINHA, metodo=METODO_LTTB):
+    """Linhas de `df` (colunas numéricas) suficientes para desenhar o gráfico de linha.
+
+    As posições escolhidas para cada coluna são unidas, então o resultado
+    tem no máximo ~`limite` pontos por coluna, qualquer que seja `len(df)`.
+    O índice original (a posição no eixo X) é mantido.
+    """
+    if len(df) <= limite:
+        return df
+    escolher = indices_lttb if metodo == METODO_LTTB else indices_min_max
+    posicoes = np.unique(np.concatenate([
+        escolher(df[col].to_numpy(dtype=np.float64, na_value=np.nan), limite) for col in df.columns
+    ]))
+    return df.iloc[posicoes]
@@ -0,0 +1,240 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
+
+from limpeza import tamanho_arquivo
+
+
+
+# ------------------------------------------------------------
+# REGRESSÃO LINEAR (MÍNIMOS QUADRADOS, EM MEMÓRIA OU EM BLOCOS)
+# ------------------------------------------------------------
+TAMANHO_BLOCO_BYTES = 32 * 1024 * 1024  # bytes de CSV convertidos por vez no modo em blocos
+MAX_THREADS = min(8, os.cpu_count() or 1)
+
+
+
+def _matriz(x):
+    # colunas de x mais a coluna de 1s do intercepto
+    return np.column_stack([x, np.ones(len(x))])
+
+
+
+def _modelo(colunas_x, coluna_y, beta, n, sse, sst):
+    return {
+        "colunas_x": list(colunas_x),
+        "coluna_y": coluna_y,
+        "coeficientes": dict(zip(colunas_x, beta[:-1].tolist())),
+        "intercepto": float(beta[-1]),
+        "n": int(n),
+        "r2": float(1 - sse / sst) if sst > 0 else float("nan"),
+        "rmse": float(np.sqrt(max(sse, 0) / n)) if n else float("nan"),
+    }
+
+
+
+def _validos(x, y):
+    manter = np.isfinite(y) & np.isfinite(x).all(axis=1)
+    return x[manter], y[manter]
+
+
+
+def ajustar(df, colunas_x, coluna_y):
+    """`y = a1*x1 + ... + b` por mínimos quadrados (`np.linalg.lstsq`) em um DataFrame.
+
+    Linhas com algum nulo nas colunas usadas ficam de fora. Retorna o dict do
+    modelo: `coeficientes`, `intercepto`, `n`, `r2` e `rmse`.
+    """
+    x = df[list(colunas_x)].to_numpy(dtype=np.float64, na_value=np.nan)
+    y = df[coluna_y].to_numpy(dtype=np.float64, na_value=np.nan)
+    x, y = _validos(x, y)
+    if not len(y):
+        raise ValueError("Nenhuma linha com valores em todas as colunas escolhidas.")
+    beta, _, _, _ = np.linalg.lstsq(_matriz(x), y, rcond=None)
+    residuos = y - _matriz(x) @ beta
+    return _modelo(colunas_x, coluna_y, beta, len(y), float(residuos @ residuos), float(((y - y.mean()) ** 2).sum()))
+
+
+
+class EstatisticasSuficientes:
+    """Acumula X'X, X'y e y'y bloco a bloco: o ajuste nunca vê o arquivo inteiro.
+
+    Os valores são deslocados (pelas médias do primeiro bloco, ou pelo
+    `deslocamento` dado) antes de somar, o que evita a perda de precisão das
+    equações normais quando as colunas têm médias grandes em relação à
+    variação. Acumuladores com o mesmo deslocamento podem ser combinados.
+    """
+
+    def __init__(self, colunas_x, coluna_y, deslocamento=None):
+        self.colunas_x = list(colunas_x)
+        self.coluna_y = coluna_y
+        k = len(self.colunas_x) + 1
+        self.xtx = np.zeros((k, k))
+        self.xty = np.zeros(k)
+        self.yty = 0.0
+        self.soma_y = 0.0
+        self.n = 0
+        self.deslocamento = deslocamento  # (médias de x, média de y)
+
+    def atualizar(self, x, y):
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        validos = np.isfinite(y) & np.isfinite(x).all(axis=1)
+        if not validos.all():
+            x, y = x[validos], y[validos]
+        if not len(y):
+            return self
+        if self.deslocamento is None:
+            self.deslocamento = (x.mean(axis=0), float(y.mean()))
+        xd = x - self.deslocamento[0]
+        yd = y - self.deslocamento[1]
+        # X'X com a coluna de 1s sem montá-la: [[xd'xd, Σxd], [Σxd', n]]
+        soma_x = xd.sum(axis=0)
+        soma_y = float(yd.sum())
+        self.xtx[:-1, :-1] += xd.T @ xd
+        self.xtx[:-1, -1] += soma_x
+        self.xtx[-1, :-1] += soma_x
+        self.xtx[-1, -1] += len(y)
+        self.xty[:-1] += xd.T @ yd
+        self.xty[-1] += soma_y
+        self.yty += float(yd @ yd)
+        self.soma_y += soma_y
+        self.n += len(y)
+        return self
+
+    def combinar(self, outro):
+        if outro.n:
+            self.xtx += outro.xtx
+            self.xty += outro.xty
+            self.yty += outro.yty
+            self.soma_y += outro.soma_y
+            self.n += outro.n
+        return self
+
+    def resolver(self):
+        if not self.n:
+            raise ValueError("Nenhuma linha com valores em todas as colunas escolhidas.")
+        beta, _, _, _ = np.linalg.lstsq(self.xtx, self.xty, rcond=None)
+        sse = self.yty - 2 * beta @ self.xty + beta @ self.xtx @ beta
+        sst = self.yty - self.soma_y ** 2 / self.n
+        # volta do espaço deslocado: só o intercepto muda
+        medias_x, media_y = self.deslocamento
+        beta[-1] += media_y - beta[:-1] @ medias_x
+        return _modelo(self.colunas_x, self.coluna_y, beta, self.n, float(sse), float(sst))
+
+
+
+def _blocos_de_bytes(arquivo, tamanho_bloco):
+    # Pedaços do CSV terminados em fim de linha (o cabeçalho sai à parte).
+    # Campos entre aspas com quebra de linha não são suportados aqui.
+    cabecalho = arquivo.readline()
+    yield cabecalho
+    while True:
+        bloco = arquivo.read(tamanho_bloco)
+        if not bloco:
+            return
+        yield bloco + arquivo.readline()
+
+
+
+def processar_em_blocos(arquivo, colunas, funcao):
+    """Aplica `funcao(matriz)` a cada bloco das `colunas` numéricas de um CSV.
+
+    `arquivo` é um caminho ou um arquivo binário. Os blocos são convertidos
+    e processados em paralelo (o parser do Arrow libera o GIL), com no
+    máximo `2 × MAX_THREADS` blocos na memória. Gera `(resultado, fração
+    lida)` na ordem do arquivo.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    total = tamanho_arquivo(arquivo) or 1
+    with ExitStack() as pilha:
+        if isinstance(arquivo, (str, os.PathLike)):
+            arquivo = pilha.enter_context(open(arquivo, "rb"))
+        else:
+            arquivo.seek(0)
+        blocos = _blocos_de_bytes(arquivo, TAMANHO_BLOCO_BYTES)
+        nomes = pacsv.read_csv(pa.py_buffer(next(blocos))).schema.names
+        opcoes_leitura = pacsv.ReadOptions(column_names=nomes, use_threads=False)
+        opcoes_conversao = pacsv.ConvertOptions(
+            include_columns=colunas, column_types={col: pa.float64() for col in colunas}
+        )
+
+        def converter(bloco):
+            tabela = pacsv.read_csv(pa.py_buffer(bloco), read_options=opcoes_leitura, convert_options=opcoes_conversao)
+            return funcao(np.column_stack([tabela.column(col).to_numpy() for col in colunas]))
+
+        executor = pilha.enter_context(ThreadPoolExecutor(max_workers=MAX_THREADS))
+        pendentes = deque()
+        for bloco in blocos:
+            pendentes.append(executor.submit(converter, bloco))
+            if len(pendentes) >= 2 * MAX_THREADS:
+                yield pendentes.popleft().result(), min(arquivo.tell() / total, 1.0)
+        while pendentes:
+            yield pendentes.popleft().result(), min(arquivo.tell() / total, 1.0)
+
+
+
+def ajustar_em_blocos(arquivo, colunas_x, coluna_y, progresso=None):
+    """Como `ajustar`, lendo o CSV (caminho ou arquivo) em blocos, com memória limitada.
+
+    Cada bloco vira um acumulador de estatísticas suficientes, e eles são
+    somados; `progresso(fracao, mensagem)`, se dado, é chamado a cada bloco.
+    """
+    colunas = list(colunas_x) + [coluna_y]
+    total = EstatisticasSuficientes(colunas_x, coluna_y)
+    deslocamento = [None]
+    trava = threading.Lock()
+
+    def acumular(matriz):
+        # o primeiro bloco com valores fixa o deslocamento de todos (para poderem ser somados)
+        with trava:
+            if deslocamento[0] is None:
+                parcial = EstatisticasSuficientes(colunas_x, coluna_y).atualizar(matriz[:, :-1], matriz[:, -1])
+                deslocamento[0] = parcial.deslocamento
+                return parcial
+        return EstatisticasSuficientes(colunas_x, coluna_y, deslocamento[0]).atualizar(matriz[:, :-1], matriz[:, -1])
+
+    for parcial, lida in processar_em_blocos(arquivo, colunas, acumular):
+        if total.deslocamento is None:
+            total.deslocamento = parcial.deslocamento
+        total.combinar(parcial)
+        if progresso is not None:
+            progresso(lida, f"{total.n} linhas acumuladas")
+    return total.resolver()
+
+
+
+def prever(modelo, x):
+    """Previsões do modelo para a matriz `x` (uma coluna por `colunas_x`)."""
+    coeficientes = np.array([modelo["coeficientes"][col] for col in modelo["colunas_x"]])
+    return np.asarray(x, dtype=np.float64) @ coeficientes + modelo["intercepto"]
+
+
+
+def prever_em_blocos(arquivo, modelo, destino, progresso=None):
+    """Grava em `destino` (binário) um CSV com as colunas X e a `previsao`.
+
+    O texto de cada bloco também é gerado nas threads; aqui só se escreve.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    colunas = modelo["colunas_x"]
+
+    def gerar_csv(matriz):
+        dados = dict(zip(colunas, matriz.T))
+        dados["previsao"] = prever(modelo, matriz)
+        saida = pa.BufferOutputStream()
+        pacsv.write_csv(pa.table(dados), saida, pacsv.WriteOptions(include_header=False))
+        return saida.getvalue()
+
+    destino.write((",".join(f'"{col}"' for col in colunas + ["previsao"]) + "\n").encode("utf-8"))
+    for texto, lida in processar_em_blocos(arquivo, colunas, gerar_csv):
+        destino.write(texto)
+        if progresso is not None:
+            progresso(lida, "gravando previsões")
@@ -0,0 +1,169 @@
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+
+
+# ------------------------------------------------------------
+# RESULTADOS DO QUIZ EM SQLITE (GRAVAÇÃO EM LOTES, CONSULTAS INDEXADAS)
+# ------------------------------------------------------------
+CAMINHO_BANCO = os.environ.get(
+    "DATABYTE_BANCO_QUIZ",
+    os.path.join(os.path.expanduser("~"), ".local", "share", "databyte", "quiz.sqlite3")
+)
+TAMANHO_LOTE = 200     # envios gravados por transação
+ESPERA_LOTE = 0.05     # segundos esperando mais envios antes de gravar
+ESPERA_GRAVACAO = 5.0  # quanto a página espera o próprio envio ser gravado
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tentativas (
+    id INTEGER PRIMARY KEY,
+    aluno TEXT NOT NULL,
+    turma TEXT NOT NULL,
+    pontuacao INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    enviado_em REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS respostas (
+    tentativa_id INTEGER NOT NULL REFERENCES tentativas(id),
+    pergunta TEXT NOT NULL,
+    correta INTEGER NOT NULL
+);
+-- ranking por turma: a busca e o MAX por aluno saem só do índice
+CREATE INDEX IF NOT EXISTS idx_tentativas_turma ON tentativas (turma, aluno, pontuacao);
+-- taxa de erro por pergunta: índice de cobertura para o GROUP BY
+CREATE INDEX IF NOT EXISTS idx_respostas_pergunta ON respostas (pergunta, correta);
+"""
+
+
+
+def _conectar(caminho):
+    conexao = sqlite3.connect(caminho, timeout=30, check_same_thread=False)
+    # WAL: leitores não bloqueiam o escritor (nem o contrário)
+    conexao.execute("PRAGMA journal_mode=WAL")
+    conexao.execute("PRAGMA synchronous=NORMAL")
+    return conexao
+
+
+
+class ResultadosQuiz:
+    """Guarda as tentativas do quiz; uma única thread grava, em lotes.
+
+    `registrar` só enfileira o envio (não bloqueia o rerun); a thread
+    gravadora junta o que chegou em até `ESPERA_LOTE` segundos e grava tudo
+    numa transação, então centenas de envios simultâneos viram poucos
+    commits em vez de disputar o lock do SQLite.
+    """
+
+    def __init__(self, caminho=CAMINHO_BANCO):
+        self.caminho = caminho
+        if os.path.dirname(caminho):
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with _conectar(caminho) as conexao:
+            conexao.executescript(_ESQUEMA)
+        self._fila = queue.Queue()
+        self._local = threading.local()
+        self._gravadora = threading.Thread(target=self._gravar_continuamente, name="quiz-gravadora", daemon=True)
+        self._gravadora.start()
+        atexit.register(self.fechar)
+
+    def _leitura(self):
+        # uma conexão de leitura por thread (o Streamlit roda cada sessão em uma)
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is None:
+            conexao = self._local.conexao = _conectar(self.caminho)
+        return conexao
+
+    def registrar(self, aluno, turma, acertos_por_pergunta):
+        """Enfileira uma tentativa; devolve um `Event` marcado quando ela for gravada.
+
+        `acertos_por_pergunta` é um dict `{id da pergunta: acertou?}`.
+        """
+        gravado = threading.Event()
+        self._fila.put((aluno, turma, dict(acertos_por_pergunta), time.time(), gravado))
+        return gravado
+
+    def _gravar_continuamente(self):
+        conexao = _conectar(self.caminho)
+        while True:
+            item = self._fila.get()
+            if item is None:
+                break
+            lote = [item]
+            limite = time.monotonic() + ESPERA_LOTE
+            while len(lote) < TAMANHO_LOTE:
+                try:
+                    proximo = self._fila.get(timeout=max(limite - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if proximo is None:
+                    self._fila.put(None)  # termina depois de gravar este lote
+                    break
+                lote.append(proximo)
+            self._gravar_lote(conexao, lote)
+        conexao.close()
+
+    def _gravar_lote(self, conexao, lote):
+        try:
+            with conexao:
+                for aluno, turma, acertos, enviado_em, _ in lote:
+                    cursor = conexao.execute(
+                        "INSERT INTO tentativas (aluno, turma, pontuacao, total, enviado_em) VALUES (?, ?, ?, ?, ?)",
+                        (aluno, turma, sum(acertos.values()), len(acertos), enviado_em)
+                    )
+                    conexao.executemany(
+                        "INSERT INTO respostas (tentativa_id, pergunta, correta) VALUES (?, ?, ?)",
+                        [(cursor.lastrowid, pergunta, int(certa)) for pergunta, certa in acertos.items()]
+                    )
+        except sqlite3.Error:
+            pass  # o lote se perde, mas a gravadora continua viva para os próximos
+        finally:
+            for *_, gravado in lote:
+                gravado.set()
+
+    def fechar(self):
+        if self._gravadora.is_alive():
+            self._fila.put(None)
+            self._gravadora.join(timeout=ESPERA_GRAVACAO)
+
+    def taxas_de_erro(self):
+        """`[(pergunta, respostas, erros, taxa)]`, das perguntas mais erradas para as menos."""
+        return self._leitura().execute(
+            """
+            SELECT pergunta, COUNT(*) AS respostas, COUNT(*) - SUM(correta) AS erros,
+                   1.0 - AVG(correta) AS taxa
+            FROM respostas GROUP BY pergunta ORDER BY taxa DESC
+            """
+        ).fetchall()
+
+    def ranking(self, turma, limite=10):
+        """Melhor pontuação de cada aluno da turma: `[(aluno, melhor, tentativas)]`."""
+        return self._leitura().execute(
+            """
+            SELECT aluno, MAX(pontuacao) AS melhor, COUNT(*) AS tentativas
+            FROM tentativas WHERE turma = ?
+            GROUP BY aluno ORDER BY melhor DESC, tentativas ASC, aluno LIMIT ?
+            """,
+            (turma, limite)
+        ).fetchall()
+
+    def turmas(self):
+        return [linha[0] for linha in self._leitura().execute("SELECT DISTINCT turma FROM tentativas ORDER BY turma")]
+
+
+
+_resultados = None
+_resultados_lock = threading.Lock()
+
+
+
+def resultados():
+    """Armazenamento compartilhado pelo processo (criado no primeiro uso)."""
+    global _resultados
+    with _resultados_lock:
+        if _resultados is None:
+            _resultados = ResultadosQuiz()
+    return _resultados
@@ -0,0 +1,93 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+
+# ------------------------------------------------------------
+# TAREFAS EM SEGUNDO PLANO (PROGRESSO E CANCELAMENTO)
+# ------------------------------------------------------------
+MAX_TAREFAS_SIMULTANEAS = 4
+
+
+
+class TarefaCancelada(Exception):
+    """Levantada dentro da tarefa quando o usuário pede o cancelamento."""
+
+
+
+class Tarefa:
+    """Uma operação longa rodando em uma thread do pool.
+
+    A função recebe a própria tarefa e chama `avancar(fracao, mensagem)` de
+    tempos em tempos; é aí que o pedido de cancelamento é atendido (com
+    `TarefaCancelada`), então o cancelamento é cooperativo.
+    """
+
+    def __init__(self, rotulo, chave=None):
+        self.rotulo = rotulo
+        self.chave = chave
+        self.fracao = 0.0
+        self.mensagem = ""
+        self.resultado = None
+        self.erro = None
+        self.inicio = time.perf_counter()
+        self.fim = None
+        self._cancelar = threading.Event()
+        self._futuro = None
+
+    def avancar(self, fracao, mensagem=""):
+        if self._cancelar.is_set():
+            raise TarefaCancelada()
+        self.fracao = min(max(float(fracao), 0.0), 1.0)
+        self.mensagem = mensagem
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    @property
+    def cancelando(self):
+        return self._cancelar.is_set() and not self.concluida
+
+    @property
+    def cancelada(self):
+        return self._cancelar.is_set() and self.concluida
+
+    @property
+    def concluida(self):
+        return self._futuro is not None and self._futuro.done()
+
+    @property
+    def duracao(self):
+        return (self.fim or time.perf_counter()) - self.inicio
+
+    def _executar(self, funcao):
+        try:
+            self.resultado = funcao(self)
+            self.fracao = 1.0
+        except TarefaCancelada:
+            pass
+        except Exception as e:  # a página mostra o erro quando pegar o resultado
+            self.erro = e
+        finally:
+            self.fim = time.perf_counter()
+
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+
+def iniciar_tarefa(rotulo, funcao, chave=None):
+    """Agenda `funcao(tarefa)` no pool compartilhado e devolve a `Tarefa`.
+
+    `chave` identifica o que está sendo calculado (parâmetros inclusos).
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_TAREFAS_SIMULTANEAS, thread_name_prefix="tarefa")
+    tarefa = Tarefa(rotulo, chave)
+    tarefa._futuro = _executor.submit(tarefa._executar, funcao)
+    return tarefa
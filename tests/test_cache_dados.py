@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+import cache_dados
+from cache_dados import CacheLRU
+
+
+@pytest.fixture
+def na_sessao(monkeypatch):
+    def entrar(sessao):
+        monkeypatch.setattr(cache_dados, "sessao_atual", lambda: sessao)
+    return entrar
+
+
+def test_item_maior_que_a_sessao_fica_no_limite_global(na_sessao):
+    cache = CacheLRU(limite_bytes=1_000_000, limite_sessao=300_000, diretorio_derramamento=None)
+    na_sessao("a")
+    cache.guardar(("h", "df"), np.zeros(50_000))  # ~400 KB, acima do orçamento da sessão
+    for i in range(5):
+        cache.guardar(("h", "resumo", i), np.zeros(10_000))
+    assert ("h", "df") in cache
+    assert ("h", "resumo", 4) in cache
+    assert cache.uso_sessao("a") <= 300_000  # o DataFrame não conta para a sessão
+
+    na_sessao("b")
+    cache.pegar(("h", "df"))
+    assert cache.uso_sessao("b") == 0
+
+
+def test_item_maior_que_o_limite_global_e_avisado(na_sessao):
+    cache = CacheLRU(limite_bytes=100_000, limite_sessao=50_000, diretorio_derramamento=None)
+    na_sessao("a")
+    cache.guardar(("h", "df"), np.zeros(20_000))
+    assert ("h", "df") not in cache
+    [(chave, tamanho)] = cache.recusados("a")
+    assert chave == ("h", "df") and tamanho > 100_000
+    assert cache.recusados("a") == []
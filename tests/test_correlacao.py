@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from correlacao import matriz_correlacao, top_pares
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 5000
+    a = rng.normal(size=n)
+    df = pd.DataFrame({
+        "a": a,
+        "b": a + 0.1 * rng.normal(size=n),
+        "c": rng.normal(size=n),
+        "d": 1e6 + a * 1e-3,  # média grande e pouca variação
+    })
+    df.loc[rng.random(n) < 0.4, ["a", "b"]] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("tamanho_bloco", [1, 256])
+def test_matriz_igual_ao_pandas(df, tamanho_bloco):
+    colunas = list(df.columns)
+    matriz = matriz_correlacao(df, colunas, tamanho_bloco=tamanho_bloco)
+    np.testing.assert_allclose(matriz.to_numpy(), df.corr().to_numpy(), atol=1e-5)
+
+
+def test_top_pares_mantem_coluna_de_media_grande(df):
+    pares = top_pares(df, list(df.columns), k=3, tamanho_bloco=1)
+    com_d = pares[(pares["coluna_a"] == "d") | (pares["coluna_b"] == "d")]
+    assert len(com_d)
+    assert com_d["correlacao"].abs().max() == pytest.approx(1.0, abs=1e-5)
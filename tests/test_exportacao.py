@@ -0,0 +1,58 @@
+import gzip
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from exportacao import comprimir_arquivo, exportar
+from ingestao import ler_csv_otimizado
+from limpeza import limpar_dataframe
+
+
+CSV_COM_DATAS = b"""id,data,nome
+1,2024-01-05,ana
+2,,bruno
+3,2024-03-10,
+4,2024-04-01,diego
+"""
+
+
+@pytest.fixture
+def limpo():
+    df, _ = ler_csv_otimizado(io.BytesIO(CSV_COM_DATAS))
+    assert pd.api.types.is_datetime64_any_dtype(df["data"])
+    df_limpo, _ = limpar_dataframe(df)
+    return df_limpo
+
+
+def test_limpeza_mantem_nat_nas_datas(limpo):
+    assert pd.api.types.is_datetime64_any_dtype(limpo["data"])
+    assert limpo["data"].isna().sum() == 1
+    assert limpo["nome"].tolist() == ["ana", "bruno", "Desconhecido", "diego"]
+
+
+@pytest.mark.parametrize("formato, ler", [("Parquet", pd.read_parquet), ("Feather", pd.read_feather)])
+def test_ida_e_volta_parquet_e_feather(limpo, formato, ler):
+    lido = ler(io.BytesIO(exportar(limpo, formato, tamanho_bloco=2)))
+    assert pd.api.types.is_datetime64_any_dtype(lido["data"])
+    pd.testing.assert_series_equal(lido["data"].astype("datetime64[ns]"), limpo["data"].astype("datetime64[ns]"))
+    assert lido["nome"].tolist() == limpo["nome"].tolist()
+
+
+@pytest.mark.parametrize("formato, ler", [("Parquet", pd.read_parquet), ("Feather", pd.read_feather)])
+def test_objetos_mistos_viram_texto(formato, ler):
+    df = pd.DataFrame({"x": pd.Series([pd.Timestamp("2024-01-01"), "Desconhecido", 3], dtype=object)})
+    lido = ler(io.BytesIO(exportar(df, formato, tamanho_bloco=2)))
+    assert lido["x"].tolist() == ["2024-01-01 00:00:00", "Desconhecido", "3"]
+
+
+def test_comprimir_arquivo_por_caminho_em_paralelo(tmp_path):
+    conteudo = "".join(f"{i},{i * 2}\n" for i in range(200_000)).encode()
+    caminho = tmp_path / "limpo.csv"
+    caminho.write_bytes(conteudo)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        saidas = list(executor.map(
+            lambda _: comprimir_arquivo(str(caminho), "CSV (gzip)", tamanho_bloco=4096), range(8)
+        ))
+    assert all(gzip.decompress(saida) == conteudo for saida in saidas)
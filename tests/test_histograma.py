@@ -0,0 +1,16 @@
+import pandas as pd
+
+from histograma import calcular_histograma
+
+
+def test_inteiros_com_poucos_valores_tem_uma_barra_por_valor():
+    histograma = calcular_histograma(pd.Series([1.0, 2.0, 2.0, None]))
+    assert histograma.index.tolist() == [1, 2]
+    assert histograma["contagem"].tolist() == [1, 2]
+
+
+def test_floats_inteiros_fora_do_int64_usam_faixas():
+    histograma = calcular_histograma(pd.Series([1e300, -1e300, 1e300]))
+    assert histograma["contagem"].sum() == 3
+    assert histograma.index.min() >= -1e300 and histograma.index.max() <= 1e300
+    assert histograma.index.dtype.kind == "f"
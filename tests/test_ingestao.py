@@ -0,0 +1,35 @@
+import io
+
+import pandas as pd
+
+from ingestao import ler_csvs_otimizado, reconciliar_esquemas
+from limpeza import VALOR_DESCONHECIDO, limpar_dataframe, preencher_nulos
+
+
+def test_booleana_ausente_em_um_fragmento_e_limpa():
+    fragmentos = [
+        io.BytesIO(b"id,ativo\n1,true\n2,false\n"),
+        io.BytesIO(b"id\n3\n4\n"),
+    ]
+    df, relatorio = ler_csvs_otimizado(fragmentos)
+    assert df["ativo"].dtype == object
+    assert any("ativo" in ajuste for ajuste in relatorio["ajustes"])
+
+    limpo, resumo = limpar_dataframe(df)
+    assert limpo["ativo"].tolist() == [True, False, VALOR_DESCONHECIDO, VALOR_DESCONHECIDO]
+    assert resumo["nulos_preenchidos"] == 2
+
+
+def test_reconciliar_booleana_igual_a_um_arquivo_so():
+    partes, _ = reconciliar_esquemas([
+        pd.DataFrame({"a": [True, False]}),
+        pd.DataFrame({"b": [1, 2]}),
+    ])
+    assert all(parte["a"].dtype == object for parte in partes)
+
+
+def test_preencher_nulos_em_coluna_boolean():
+    df = pd.DataFrame({"ativo": pd.array([True, None], dtype="boolean")})
+    preenchido, nulos = preencher_nulos(df)
+    assert preenchido["ativo"].tolist() == [True, VALOR_DESCONHECIDO]
+    assert nulos == 1
@@ -0,0 +1,96 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from limpar_lote import main
+from limpeza import VALOR_DESCONHECIDO, limpar_arquivo, limpar_dataframe, preencher_nulos
+
+
+CSV_SUJO = """ Nome ,Idade,Nota
+ana,22,8.5
+bruno,,7.0
+ana,22,8.5
+,25,
+diego,21,6.0
+"""
+
+
+@pytest.fixture
+def csv_sujo(tmp_path):
+    caminho = tmp_path / "sujo.csv"
+    caminho.write_text(CSV_SUJO, encoding="utf-8")
+    return caminho
+
+
+def test_limpar_dataframe():
+    df = pd.DataFrame({" Nome ": ["ana", "bruno", "ana", None], "Idade": [22, None, 22, 25.0]})
+    limpo, resumo = limpar_dataframe(df)
+    assert list(limpo.columns) == ["nome", "idade"]
+    assert limpo["nome"].tolist() == ["ana", "bruno", VALOR_DESCONHECIDO]
+    assert limpo["idade"].tolist() == [22, 23.5, 25]
+    assert resumo["duplicados_removidos"] == 1
+    assert resumo["nulos_preenchidos"] == 2
+
+
+def test_limpar_dataframe_com_subconjunto():
+    df = pd.DataFrame({"id": [1, 1, 2], "valor": [10, 20, 30]})
+    limpo, resumo = limpar_dataframe(df, subconjunto=["id"])
+    assert limpo["valor"].tolist() == [10, 30]
+    assert resumo["duplicados_removidos"] == 1
+
+
+def test_limpar_arquivo(csv_sujo, tmp_path):
+    saida = tmp_path / "limpo.csv"
+    resumo = limpar_arquivo(csv_sujo, saida)
+    limpo = pd.read_csv(saida)
+    assert list(limpo.columns) == ["nome", "idade", "nota"]
+    assert resumo["linhas_lidas"] == 5
+    assert resumo["linhas_gravadas"] == len(limpo) == 4
+    assert not limpo.isna().any().any()
+
+
+@pytest.mark.parametrize("tamanho_bloco", [1, 2, 100])
+def test_streaming_igual_a_memoria(csv_sujo, tmp_path, tamanho_bloco):
+    saida = tmp_path / "limpo.csv"
+    resumo = limpar_arquivo(csv_sujo, saida, tamanho_bloco=tamanho_bloco)
+    em_memoria, resumo_memoria = limpar_dataframe(pd.read_csv(csv_sujo))
+    pd.testing.assert_frame_equal(
+        pd.read_csv(saida), em_memoria.reset_index(drop=True), check_dtype=False
+    )
+    for campo in ["linhas_lidas", "linhas_gravadas", "duplicados_removidos", "nulos_preenchidos"]:
+        assert resumo[campo] == resumo_memoria[campo]
+
+
+def test_lote_sucesso(csv_sujo, tmp_path):
+    entrada, saida = csv_sujo.parent, tmp_path / "saida"
+    resumo = tmp_path / "resumo.json"
+    assert main([str(entrada), str(saida), "--processos", "1", "--resumo", str(resumo)]) == 0
+    assert (saida / "sujo.csv").exists()
+    relatorio = json.loads(resumo.read_text(encoding="utf-8"))
+    assert relatorio["arquivos"] == 1 and relatorio["falhas"] == 0
+    assert relatorio["totais"]["duplicados_removidos"] == 1
+
+
+@pytest.mark.parametrize("conteudo", ["", "a,b\n1,2\n3,4,5,6\n"], ids=["vazio", "malformado"])
+def test_lote_falha_retorna_1(csv_sujo, tmp_path, conteudo):
+    (csv_sujo.parent / "ruim.csv").write_text(conteudo, encoding="utf-8")
+    saida = tmp_path / "saida"
+    assert main([str(csv_sujo.parent), str(saida), "--processos", "1"]) == 1
+    # o arquivo bom é limpo mesmo assim, e o ruim não deixa saída parcial
+    assert (saida / "sujo.csv").exists()
+    assert not (saida / "ruim.csv").exists()
+
+
+def test_coluna_numerica_toda_nula_nao_conta_como_preenchida(tmp_path):
+    df = pd.DataFrame({"vazia": [np.nan, np.nan, np.nan], "nota": [1.0, np.nan, 3.0]})
+    limpo, nulos = preencher_nulos(df)
+    assert nulos == 1
+    assert limpo["vazia"].isna().all()
+    assert limpo["nota"].tolist() == [1.0, 2.0, 3.0]
+
+    caminho = tmp_path / "vazia.csv"
+    df.to_csv(caminho, index=False)
+    resumo = limpar_arquivo(caminho, tmp_path / "limpo.csv", tamanho_bloco=1)
+    assert resumo["nulos_preenchidos"] == 1
@@ -0,0 +1,47 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import regressao
+from ingestao import ler_csv_otimizado
+from regressao import ajustar, ajustar_em_blocos, prever_em_blocos
+
+
+@pytest.fixture
+def csv_regressao():
+    rng = np.random.default_rng(0)
+    n = 5000
+    x1 = 1000 + rng.normal(size=n)  # média grande: testa o deslocamento
+    x2 = rng.random(n)
+    y = 3 * x1 - 2 * x2 + 5 + rng.normal(scale=0.01, size=n)
+    df = pd.DataFrame({"x1": x1, "x2": x2, "y": y})
+    df.loc[::97, "x2"] = np.nan
+    return df.to_csv(index=False).encode()
+
+
+def test_em_blocos_igual_a_memoria(csv_regressao, monkeypatch):
+    monkeypatch.setattr(regressao, "TAMANHO_BLOCO_BYTES", 4096)  # muitos blocos
+    df, _ = ler_csv_otimizado(io.BytesIO(csv_regressao))
+    memoria = ajustar(df, ["x1", "x2"], "y")
+    blocos = ajustar_em_blocos(io.BytesIO(csv_regressao), ["x1", "x2"], "y")
+    assert blocos["n"] == memoria["n"] == 5000 - len(range(0, 5000, 97))
+    for col in ["x1", "x2"]:
+        assert blocos["coeficientes"][col] == pytest.approx(memoria["coeficientes"][col], rel=1e-6)
+    assert blocos["intercepto"] == pytest.approx(memoria["intercepto"], abs=1e-3)
+    assert blocos["rmse"] == pytest.approx(memoria["rmse"], rel=1e-4)
+    assert memoria["rmse"] < 0.02
+
+
+def test_prever_em_blocos(csv_regressao, monkeypatch):
+    monkeypatch.setattr(regressao, "TAMANHO_BLOCO_BYTES", 4096)
+    df = pd.read_csv(io.BytesIO(csv_regressao))
+    modelo = ajustar(df, ["x1", "x2"], "y")
+    saida = io.BytesIO()
+    prever_em_blocos(io.BytesIO(csv_regressao), modelo, saida)
+    previsoes = pd.read_csv(io.BytesIO(saida.getvalue()))
+    assert list(previsoes.columns) == ["x1", "x2", "previsao"]
+    assert len(previsoes) == len(df)
+    validas = df["x2"].notna()
+    np.testing.assert_allclose(previsoes["previsao"][validas], df["y"][validas], atol=0.1)
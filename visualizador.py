@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cache_dados import artefato
+from instrumentacao import etapa
+
+
+
+# ------------------------------------------------------------
+# VISUALIZADOR PAGINADO (OS DADOS FICAM NO SERVIDOR)
+# ------------------------------------------------------------
+TAMANHOS_PAGINA = [10, 25, 50, 100, 500]
+
+
+
+def _ordem(df, coluna, crescente):
+    serie = df[coluna].reset_index(drop=True)
+    return serie.sort_values(ascending=crescente, kind="stable", na_position="last").index.to_numpy()
+
+
+
+def _mascara(serie, filtro):
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        categorias = serie.cat.categories
+        aceitas = categorias[categorias.astype(str).str.contains(filtro, case=False, regex=False)]
+        return serie.isin(aceitas).to_numpy()
+    if pd.api.types.is_numeric_dtype(serie):
+        minimo, maximo = filtro
+        return serie.between(minimo, maximo).to_numpy()
+    return serie.astype(str).str.contains(filtro, case=False, regex=False, na=False).to_numpy()
+
+
+
+def mostrar_tabela(df, key, chave=None, tamanho_pagina=25):
+    """Mostra `df` página a página: só as linhas visíveis vão para o navegador.
+
+    Ordenação e filtro são feitos no pandas, no servidor. `key` separa os
+    widgets de tabelas diferentes na mesma página; com `chave` (hash do
+    dataset) a ordem de cada coluna fica no cache entre reruns.
+    """
+    total = len(df)
+    posicoes = None
+
+    with st.expander("🔎 Ordenar e filtrar", expanded=False):
+        c1, c2, c3 = st.columns(3)
+        col_ordem = c1.selectbox("Ordenar por", ["(nenhuma)"] + list(df.columns), key=f"{key}_ordem")
+        crescente = c1.radio("Sentido", ["Crescente", "Decrescente"], horizontal=True, key=f"{key}_sentido") == "Crescente"
+        col_filtro = c2.selectbox("Filtrar coluna", ["(nenhuma)"] + list(df.columns), key=f"{key}_col_filtro")
+
+        filtro = None
+        if col_filtro != "(nenhuma)":
+            serie = df[col_filtro]
+            if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+                minimo, maximo = float(serie.min()), float(serie.max())
+                if minimo < maximo:
+                    filtro = c3.slider("Intervalo", minimo, maximo, (minimo, maximo), key=f"{key}_intervalo")
+                    if filtro == (minimo, maximo):
+                        filtro = None
+            else:
+                filtro = c3.text_input("Contém", key=f"{key}_texto") or None
+
+    if col_ordem != "(nenhuma)":
+        if chave is None:
+            posicoes = _ordem(df, col_ordem, crescente)
+        else:
+            posicoes = artefato(chave, "ordem", lambda: _ordem(df, col_ordem, crescente), col_ordem, crescente)
+
+    if filtro is not None:
+        mascara = _mascara(df[col_filtro], filtro)
+        posicoes = np.flatnonzero(mascara) if posicoes is None else posicoes[mascara[posicoes]]
+
+    linhas = total if posicoes is None else len(posicoes)
+    c1, c2, c3 = st.columns([1, 1, 2])
+    indice_tamanho = TAMANHOS_PAGINA.index(tamanho_pagina) if tamanho_pagina in TAMANHOS_PAGINA else 0
+    por_pagina = c1.selectbox("Linhas por página", TAMANHOS_PAGINA, index=indice_tamanho, key=f"{key}_tamanho")
+    paginas = max(1, math.ceil(linhas / por_pagina))
+    pagina = c2.number_input("Página", min_value=1, max_value=paginas, value=1, step=1, key=f"{key}_pagina")
+    pagina = min(int(pagina), paginas)
+
+    inicio = (pagina - 1) * por_pagina
+    fim = min(inicio + por_pagina, linhas)
+    if posicoes is None:
+        visiveis = df.iloc[inicio:fim]
+    else:
+        visiveis = df.iloc[posicoes[inicio:fim]]
+
+    with etapa(f"renderização da tabela ({key})"):
+        st.dataframe(visiveis)
+    c3.caption(f"Linhas {inicio + 1 if linhas else 0}–{fim} de {linhas}" + (f" (filtradas de {total})" if linhas != total else ""))